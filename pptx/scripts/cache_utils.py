@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""On-disk JSON cache for data derived from template files.
+
+Entries are stored under ~/.cache/pptx_skills/, one JSON file per
+(kind, source file), so parallel processes working on different sources
+never touch the same file. Each entry records the key it was built for
+(format version, real path, st_mtime_ns, st_size, ...); a lookup with a
+different key is a miss. Files are replaced atomically, and values that do
+not survive a JSON round trip unchanged are simply not cached.
+
+Usage:
+    from scripts.cache_utils import file_cache_key, read_json_cache, write_json_cache
+
+    key = file_cache_key(path, 1)
+    data = read_json_cache('style_data', path, key)
+    if data is None:
+        data = parse(path)
+        write_json_cache('style_data', path, key, data)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, List, Optional
+
+CACHE_DIR = os.path.expanduser('~/.cache/pptx_skills')
+
+
+def file_cache_key(path: str, version: int, *extra) -> List[Any]:
+    """Key identifying the current contents of path.
+
+    Args:
+        path: Source file
+        version: Format version of the cached value; bump it when the value changes shape
+        *extra: Further JSON values the cached value depends on
+
+    Returns:
+        [version, real path, st_mtime_ns, st_size, *extra]
+    """
+    st = os.stat(path)
+    return [version, os.path.realpath(path), st.st_mtime_ns, st.st_size, *extra]
+
+
+def _entry_path(kind: str, path: str) -> str:
+    """Cache file for one (kind, source file) pair."""
+    digest = hashlib.sha1(os.path.realpath(path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f'{kind}-{digest}.json')
+
+
+def read_json_cache(kind: str, path: str, key: List[Any]) -> Optional[Any]:
+    """Cached value for path, or None if missing, unreadable or built for another key."""
+    try:
+        with open(_entry_path(kind, path), 'rb') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get('key') != key:
+        return None
+    return entry.get('value')
+
+
+def write_json_cache(kind: str, path: str, key: List[Any], value: Any) -> None:
+    """Store value for path (best effort; failures leave the cache unchanged)."""
+    try:
+        text = json.dumps({'key': key, 'value': value}, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return
+    # Tuples, non-string keys etc. would come back different: don't cache those
+    if json.loads(text)['value'] != value:
+        return
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, _entry_path(kind, path))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
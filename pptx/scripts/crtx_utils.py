@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 """Utility functions for applying .crtx chart template styling."""
 
+import functools
+import io
+import os
+import re
 import zipfile
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from lxml import etree
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from pptx.util import Pt
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_DATA_LABEL_POSITION, XL_LEGEND_POSITION, XL_TICK_MARK
 from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 
@@ -12,6 +21,75 @@ from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from scripts.logging_utils import get_logger
 
 
+# Namespaces used in chart.xml
+_NS = {
+    'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+}
+
+# Style-bearing elements streamed out of chart.xml by extract_crtx_styling()
+_SER_TAG = '{%s}ser' % _NS['c']
+_CATAX_TAG = '{%s}catAx' % _NS['c']
+_VALAX_TAG = '{%s}valAx' % _NS['c']
+_DLBLS_TAG = '{%s}dLbls' % _NS['c']
+_LEGEND_TAG = '{%s}legend' % _NS['c']
+_STYLE_TAGS = (_SER_TAG, _CATAX_TAG, _VALAX_TAG, _DLBLS_TAG, _LEGEND_TAG)
+
+# Read buffer for streaming chart.xml out of the .crtx archive
+_READ_BUFFER_SIZE = 1 << 20
+
+# Chart part inside a .crtx archive ('chart/chart.xml', or 'chart/chartN.xml')
+_CHART_PART_RE = re.compile(r'chart/chart\d*\.xml')
+
+# XPath expressions compiled once at import time (reused by every
+# extract_crtx_styling() call instead of re-parsing the path strings).
+# Paths follow the chart schema and use the child axis wherever the element
+# is a direct child, so lookups never walk whole subtrees (and cannot pick up
+# e.g. gridline spPr or per-point dLbl settings by accident).
+_XP_SPPR = etree.XPath('./c:spPr', namespaces=_NS)
+_XP_SOLIDFILL = etree.XPath('./a:solidFill', namespaces=_NS)
+_XP_SRGB = etree.XPath('./a:srgbClr', namespaces=_NS)
+_XP_SCHEME = etree.XPath('./a:schemeClr', namespaces=_NS)
+_XP_LUMMOD = etree.XPath('./a:lumMod', namespaces=_NS)
+_XP_LUMOFF = etree.XPath('./a:lumOff', namespaces=_NS)
+_XP_LN = etree.XPath('./a:ln', namespaces=_NS)
+_XP_DEFRPR = etree.XPath('./a:p/a:pPr/a:defRPr', namespaces=_NS)
+
+# Direct children of c:catAx/c:valAx/c:dLbls/c:legend read by the extractors.
+# These contexts need several lookups each, so their children are indexed by
+# tag in a single pass (see _children_by_tag) rather than queried one by one.
+_SPPR_TAG = '{%s}spPr' % _NS['c']
+_DELETE_TAG = '{%s}delete' % _NS['c']
+_MAJOR_TICK_TAG = '{%s}majorTickMark' % _NS['c']
+_MINOR_TICK_TAG = '{%s}minorTickMark' % _NS['c']
+_TXPR_TAG = '{%s}txPr' % _NS['c']
+_NUMFMT_TAG = '{%s}numFmt' % _NS['c']
+_DLBLPOS_TAG = '{%s}dLblPos' % _NS['c']
+_SHOWVAL_TAG = '{%s}showVal' % _NS['c']
+_LEGENDPOS_TAG = '{%s}legendPos' % _NS['c']
+_OVERLAY_TAG = '{%s}overlay' % _NS['c']
+
+# DrawingML color elements written by apply_crtx_styling_to_chart()
+_SRGBCLR_TAG = '{%s}srgbClr' % _NS['a']
+_SCHEMECLR_TAG = '{%s}schemeClr' % _NS['a']
+_LUMMOD_TAG = '{%s}lumMod' % _NS['a']
+_LUMOFF_TAG = '{%s}lumOff' % _NS['a']
+
+
+def _first(xpath, elem):
+    """Return the first node matched by a compiled XPath, or None."""
+    nodes = xpath(elem)
+    return nodes[0] if nodes else None
+
+
+def _children_by_tag(elem) -> Dict[str, Any]:
+    """Index the direct children of an element by tag (first occurrence wins)."""
+    children = {}
+    for child in elem:
+        children.setdefault(child.tag, child)
+    return children
+
+
 def lummod_to_brightness(lummod_val: int, lumoff_val: int = 0) -> float:
     """Convert lumMod/lumOff values to brightness (-1.0 to 1.0).
 
@@ -43,16 +121,423 @@ def lummod_to_brightness(lummod_val: int, lumoff_val: int = 0) -> float:
         return percentage - 1.0
 
 
-def extract_crtx_styling(crtx_path: str) -> Dict[str, Any]:
+def lummods_to_brightness(lummod_vals) -> List[Optional[float]]:
+    """lummod_to_brightness() for each lumMod value (None stays None)."""
+    return [None if lm is None else lummod_to_brightness(lm) for lm in lummod_vals]
+
+
+# String -> enum lookup tables, built once at import time (read-only so callers
+# cannot mutate the shared tables). Style records resolve their values through
+# these when constructed, so applying styling does no string lookups.
+_THEME_MAP = MappingProxyType({
+    'tx1': MSO_THEME_COLOR.TEXT_1,
+    'tx2': MSO_THEME_COLOR.TEXT_2,
+    'bg1': MSO_THEME_COLOR.BACKGROUND_1,
+    'bg2': MSO_THEME_COLOR.BACKGROUND_2,
+    'accent1': MSO_THEME_COLOR.ACCENT_1,
+    'accent2': MSO_THEME_COLOR.ACCENT_2,
+    'accent3': MSO_THEME_COLOR.ACCENT_3,
+    'accent4': MSO_THEME_COLOR.ACCENT_4,
+    'accent5': MSO_THEME_COLOR.ACCENT_5,
+    'accent6': MSO_THEME_COLOR.ACCENT_6,
+    'hlink': MSO_THEME_COLOR.HYPERLINK,
+    'folHlink': MSO_THEME_COLOR.FOLLOWED_HYPERLINK,
+    'dk1': MSO_THEME_COLOR.DARK_1,
+    'lt1': MSO_THEME_COLOR.LIGHT_1,
+    'dk2': MSO_THEME_COLOR.DARK_2,
+    'lt2': MSO_THEME_COLOR.LIGHT_2,
+})
+
+_TICK_MAP = MappingProxyType({
+    'none': XL_TICK_MARK.NONE,
+    'inside': XL_TICK_MARK.INSIDE,
+    'outside': XL_TICK_MARK.OUTSIDE,
+    'cross': XL_TICK_MARK.CROSS,
+})
+
+_DL_POS_MAP = MappingProxyType({
+    't': XL_DATA_LABEL_POSITION.ABOVE,
+    'b': XL_DATA_LABEL_POSITION.BELOW,
+    'l': XL_DATA_LABEL_POSITION.LEFT,
+    'r': XL_DATA_LABEL_POSITION.RIGHT,
+    'ctr': XL_DATA_LABEL_POSITION.CENTER,
+    'inBase': XL_DATA_LABEL_POSITION.INSIDE_BASE,
+    'inEnd': XL_DATA_LABEL_POSITION.INSIDE_END,
+    'outEnd': XL_DATA_LABEL_POSITION.OUTSIDE_END,
+})
+
+_LEGEND_POS_MAP = MappingProxyType({
+    'b': XL_LEGEND_POSITION.BOTTOM,
+    't': XL_LEGEND_POSITION.TOP,
+    'r': XL_LEGEND_POSITION.RIGHT,
+    'l': XL_LEGEND_POSITION.LEFT,
+})
+
+
+class _StyleRecord(MappingABC):
+    """Read-only mapping view over a style dataclass's non-None fields.
+
+    Lets the typed results of extract_crtx_styling() still be used like the
+    dicts they replace (style.get('fill_type'), 'fill_lummod' in style,
+    json.dumps(..., default=dict)), while the apply path reads slots directly.
+    """
+
+    __slots__ = ()
+
+    def _resolve(self, name: str, value) -> None:
+        """Set a derived (enum) field on the frozen record."""
+        object.__setattr__(self, name, value)
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (name for name in self._field_names if getattr(self, name) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def _style_record(cls):
+    """Make cls a frozen, slotted dataclass with _StyleRecord mapping access.
+
+    eq=False keeps Mapping equality, so records still compare equal to dicts.
+    """
+    cls = dataclass(frozen=True, slots=True, eq=False)(cls)
+    cls._field_names = tuple(f.name for f in fields(cls) if not f.metadata.get('derived'))
+    cls._field_set = frozenset(cls._field_names)
+    return cls
+
+
+def _derived():
+    """Field computed in __post_init__ from the extracted strings.
+
+    Derived fields hold the python-pptx enum for a template string; they are
+    not constructor arguments and are left out of the mapping view.
+    """
+    return field(default=None, init=False, repr=False, metadata={'derived': True})
+
+
+@_style_record
+class SeriesStyle(_StyleRecord):
+    """Fill/line styling of one c:ser."""
+    fill_type: Optional[str] = None  # 'rgb' or 'theme'
+    fill_value: Optional[str] = None  # '#RRGGBB' or theme name (e.g. 'bg1')
+    fill_lummod: Optional[int] = None
+    line_lummod: Optional[int] = None
+    fill_theme_enum: Optional[MSO_THEME_COLOR] = _derived()
+
+    def __post_init__(self):
+        if self.fill_type == 'theme':
+            self._resolve('fill_theme_enum', _THEME_MAP.get(self.fill_value))
+
+
+@_style_record
+class AxisStyle(_StyleRecord):
+    """Styling of a c:catAx/c:valAx (value axes only carry visibility/ticks)."""
+    visible: Optional[bool] = None
+    major_tick_mark: Optional[str] = None
+    minor_tick_mark: Optional[str] = None
+    font_size_pt: Optional[float] = None
+    font_color_theme: Optional[str] = None
+    font_lummod: Optional[int] = None
+    font_lumoff: Optional[int] = None
+    line_width_emu: Optional[int] = None
+    line_color_type: Optional[str] = None
+    line_color_value: Optional[str] = None
+    line_lummod: Optional[int] = None
+    line_lumoff: Optional[int] = None
+    major_tick_enum: Optional[XL_TICK_MARK] = _derived()
+    minor_tick_enum: Optional[XL_TICK_MARK] = _derived()
+    font_theme_enum: Optional[MSO_THEME_COLOR] = _derived()
+    line_theme_enum: Optional[MSO_THEME_COLOR] = _derived()
+
+    def __post_init__(self):
+        self._resolve('major_tick_enum', _TICK_MAP.get(self.major_tick_mark))
+        self._resolve('minor_tick_enum', _TICK_MAP.get(self.minor_tick_mark))
+        self._resolve('font_theme_enum', _THEME_MAP.get(self.font_color_theme))
+        if self.line_color_type == 'theme':
+            self._resolve('line_theme_enum', _THEME_MAP.get(self.line_color_value))
+
+
+@_style_record
+class DataLabelStyle(_StyleRecord):
+    """Styling of a c:dLbls."""
+    show_value: Optional[bool] = None
+    position: Optional[str] = None
+    number_format: Optional[str] = None
+    number_format_linked: Optional[bool] = None
+    font_size_pt: Optional[float] = None
+    font_color_rgb: Optional[str] = None  # 'RRGGBB'
+    font_color_theme: Optional[str] = None
+    font_lummod: Optional[int] = None
+    font_lumoff: Optional[int] = None
+    position_enum: Optional[XL_DATA_LABEL_POSITION] = _derived()
+    font_theme_enum: Optional[MSO_THEME_COLOR] = _derived()
+
+    def __post_init__(self):
+        self._resolve('position_enum', _DL_POS_MAP.get(self.position))
+        self._resolve('font_theme_enum', _THEME_MAP.get(self.font_color_theme))
+
+
+@_style_record
+class LegendStyle(_StyleRecord):
+    """Styling of the c:legend."""
+    position: Optional[str] = None
+    overlay: Optional[bool] = None
+    font_size_pt: Optional[float] = None
+    font_color_theme: Optional[str] = None
+    font_lummod: Optional[int] = None
+    font_lumoff: Optional[int] = None
+    position_enum: Optional[XL_LEGEND_POSITION] = _derived()
+    font_theme_enum: Optional[MSO_THEME_COLOR] = _derived()
+
+    def __post_init__(self):
+        self._resolve('position_enum', _LEGEND_POS_MAP.get(self.position))
+        self._resolve('font_theme_enum', _THEME_MAP.get(self.font_color_theme))
+
+
+@_style_record
+class CrtxStyling(_StyleRecord):
+    """Styling extracted from a .crtx chart template."""
+    series: Tuple[SeriesStyle, ...]
+    series_brightness: Tuple[Optional[float], ...]  # fill_lummod per series
+    category_axis: AxisStyle
+    value_axis: AxisStyle
+    data_labels: Tuple[DataLabelStyle, ...]
+    legend: LegendStyle
+
+
+def _parse_color(parent) -> Tuple[Optional[str], Optional[str], Optional[int], Optional[int]]:
+    """Parse the a:solidFill color of an spPr/ln/defRPr element.
+
+    Returns:
+        (color_type, color_value, lummod, lumoff) where color_type is 'rgb'
+        (value is the raw RRGGBB hex) or 'theme' (value is the scheme name),
+        and lummod/lumoff are set only for theme colors. All four are None
+        when there is no solid fill color.
+    """
+    solidFill = _first(_XP_SOLIDFILL, parent)
+    if solidFill is None:
+        return None, None, None, None
+
+    srgbClr = _first(_XP_SRGB, solidFill)
+    if srgbClr is not None:
+        return 'rgb', srgbClr.get('val'), None, None
+
+    schemeClr = _first(_XP_SCHEME, solidFill)
+    if schemeClr is None:
+        return None, None, None, None
+
+    lumMod = _first(_XP_LUMMOD, schemeClr)
+    lumOff = _first(_XP_LUMOFF, schemeClr)
+    return ('theme', schemeClr.get('val'),
+            int(lumMod.get('val')) if lumMod is not None else None,
+            int(lumOff.get('val')) if lumOff is not None else None)
+
+
+def _extract_font_block(txPr, out: Dict[str, Any], prefix: str = 'font',
+                        rgb: bool = False) -> None:
+    """Store size/color of a c:txPr's default run properties into out.
+
+    Writes {prefix}_size_pt, {prefix}_color_theme, {prefix}_lummod and
+    {prefix}_lumoff; RGB colors are stored as {prefix}_color_rgb only when
+    rgb is True.
+    """
+    if txPr is None:
+        return
+    defRPr = _first(_XP_DEFRPR, txPr)
+    if defRPr is None:
+        return
+
+    sz = defRPr.get('sz')
+    if sz:
+        out[f'{prefix}_size_pt'] = int(sz) / 100
+
+    ctype, cval, lummod, lumoff = _parse_color(defRPr)
+    if ctype == 'theme':
+        out[f'{prefix}_color_theme'] = cval
+        if lummod is not None:
+            out[f'{prefix}_lummod'] = lummod
+        if lumoff is not None:
+            out[f'{prefix}_lumoff'] = lumoff
+    elif ctype == 'rgb' and rgb:
+        out[f'{prefix}_color_rgb'] = cval
+
+
+def _extract_series_style(ser) -> SeriesStyle:
+    """Extract fill/line styling from a c:ser element."""
+    series_style = {}
+
+    spPr = _first(_XP_SPPR, ser)
+    if spPr is not None:
+        # Fill styling
+        ctype, cval, lummod, _ = _parse_color(spPr)
+        if ctype == 'rgb':
+            series_style['fill_type'] = 'rgb'
+            series_style['fill_value'] = f"#{cval}"
+        elif ctype == 'theme':
+            series_style['fill_type'] = 'theme'
+            series_style['fill_value'] = cval
+
+            # Get lumMod (brightness modifier)
+            if lummod is not None:
+                series_style['fill_lummod'] = lummod
+
+        # Line styling
+        ln = _first(_XP_LN, spPr)
+        if ln is not None:
+            _, _, lummod, _ = _parse_color(ln)
+            if lummod is not None:
+                series_style['line_lummod'] = lummod
+
+    return SeriesStyle(**series_style)
+
+
+def _extract_category_axis_style(catAx) -> AxisStyle:
+    """Extract visibility, tick mark, font and line styling from a c:catAx element."""
+    axis_style = {}
+    children = _children_by_tag(catAx)
+
+    delete_elem = children.get(_DELETE_TAG)
+    axis_style['visible'] = (delete_elem is None or delete_elem.get('val') == '0')
+
+    # Tick marks
+    majorTickMark = children.get(_MAJOR_TICK_TAG)
+    if majorTickMark is not None:
+        axis_style['major_tick_mark'] = majorTickMark.get('val')
+
+    minorTickMark = children.get(_MINOR_TICK_TAG)
+    if minorTickMark is not None:
+        axis_style['minor_tick_mark'] = minorTickMark.get('val')
+
+    # Text properties (font)
+    _extract_font_block(children.get(_TXPR_TAG), axis_style)
+
+    # Shape properties (line)
+    spPr = children.get(_SPPR_TAG)
+    if spPr is not None:
+        ln = _first(_XP_LN, spPr)
+        if ln is not None:
+            width = ln.get('w')
+            if width:
+                axis_style['line_width_emu'] = int(width)
+
+            # Extract line color
+            ctype, cval, lummod, lumoff = _parse_color(ln)
+            if ctype == 'rgb':
+                axis_style['line_color_type'] = 'rgb'
+                axis_style['line_color_value'] = f"#{cval}"
+            elif ctype == 'theme':
+                axis_style['line_color_type'] = 'theme'
+                axis_style['line_color_value'] = cval
+
+                # lumMod and lumOff
+                if lummod is not None:
+                    axis_style['line_lummod'] = lummod
+                if lumoff is not None:
+                    axis_style['line_lumoff'] = lumoff
+
+    return AxisStyle(**axis_style)
+
+
+def _extract_value_axis_style(valAx) -> AxisStyle:
+    """Extract visibility and tick mark styling from a c:valAx element."""
+    axis_style = {}
+    children = _children_by_tag(valAx)
+
+    delete_elem = children.get(_DELETE_TAG)
+    axis_style['visible'] = (delete_elem is None or delete_elem.get('val') == '0')
+
+    # Tick marks
+    majorTickMark = children.get(_MAJOR_TICK_TAG)
+    if majorTickMark is not None:
+        axis_style['major_tick_mark'] = majorTickMark.get('val')
+
+    minorTickMark = children.get(_MINOR_TICK_TAG)
+    if minorTickMark is not None:
+        axis_style['minor_tick_mark'] = minorTickMark.get('val')
+
+    return AxisStyle(**axis_style)
+
+
+def _extract_data_label_style(dLbls) -> DataLabelStyle:
+    """Extract show/position/number format/font styling from a c:dLbls element."""
+    dl_style = {}
+    children = _children_by_tag(dLbls)
+
+    # Show options
+    showVal = children.get(_SHOWVAL_TAG)
+    if showVal is not None:
+        dl_style['show_value'] = showVal.get('val') == '1'
+
+    # Position
+    dLblPos = children.get(_DLBLPOS_TAG)
+    if dLblPos is not None:
+        dl_style['position'] = dLblPos.get('val')
+
+    # Number format
+    numFmt = children.get(_NUMFMT_TAG)
+    if numFmt is not None:
+        dl_style['number_format'] = numFmt.get('formatCode')
+        # sourceLinked="0" means custom format
+        source_linked = numFmt.get('sourceLinked')
+        if source_linked is not None:
+            dl_style['number_format_linked'] = source_linked == '1'
+
+    # Text properties (font color may be RGB or scheme color)
+    _extract_font_block(children.get(_TXPR_TAG), dl_style, rgb=True)
+
+    return DataLabelStyle(**dl_style)
+
+
+def _extract_legend_style(legend) -> LegendStyle:
+    """Extract position, overlay and font styling from a c:legend element."""
+    legend_style = {}
+    children = _children_by_tag(legend)
+
+    legendPos = children.get(_LEGENDPOS_TAG)
+    if legendPos is not None:
+        legend_style['position'] = legendPos.get('val')
+
+    # Overlay
+    overlay = children.get(_OVERLAY_TAG)
+    if overlay is not None:
+        legend_style['overlay'] = overlay.get('val') == '1'
+
+    # Text properties (font)
+    _extract_font_block(children.get(_TXPR_TAG), legend_style)
+
+    return LegendStyle(**legend_style)
+
+
+@functools.lru_cache(maxsize=32)
+def _extract_crtx_styling_cached(real_path: str, mtime_ns: int, size: int) -> CrtxStyling:
+    """Parse a .crtx once per (path, mtime, size) key."""
+    return _parse_crtx_styling(real_path)
+
+
+def extract_crtx_styling(crtx_path: str) -> CrtxStyling:
     """Extract styling information from .crtx chart template file.
 
+    Results are cached per (real path, st_mtime_ns, st_size): repeated calls
+    for an unchanged file skip the zip/XML work entirely, while saving or
+    replacing the file changes its stat and forces a fresh parse. The cached
+    value is shared, so it is immutable (frozen dataclasses and tuples).
+
     Args:
         crtx_path: Path to .crtx file
 
     Returns:
-        Dictionary with styling info:
+        CrtxStyling with SeriesStyle/AxisStyle/DataLabelStyle/LegendStyle
+        records. Fields missing from the template are None; each record also
+        reads like the equivalent dict of its set fields, e.g.
         {
-            'series': [
+            'series': (
                 {
                     'fill_type': 'rgb' or 'theme',
                     'fill_value': '#RRGGBB' or 'bg1',
@@ -60,7 +545,8 @@ def extract_crtx_styling(crtx_path: str) -> Dict[str, Any]:
                     'line_lummod': int (optional),
                 },
                 ...
-            ],
+            ),
+            'series_brightness': (float or None, ...),  # fill_lummod per series
             'category_axis': {
                 'visible': bool,
                 'line_width_emu': int,
@@ -70,634 +556,479 @@ def extract_crtx_styling(crtx_path: str) -> Dict[str, Any]:
             }
         }
     """
-    with zipfile.ZipFile(crtx_path, 'r') as z:
-        chart_xml = z.read('chart/chart.xml')
+    st = os.stat(crtx_path)
+    return _extract_crtx_styling_cached(os.path.realpath(crtx_path), st.st_mtime_ns, st.st_size)
 
-    root = etree.fromstring(chart_xml)
 
-    # Define namespaces
-    ns = {
-        'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
-        'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-    }
+def _find_chart_part(names: List[str]) -> str:
+    """Return the chart XML member of a .crtx archive from its name list."""
+    chart_parts = [name for name in names if _CHART_PART_RE.fullmatch(name)]
+    if not chart_parts:
+        raise KeyError("There is no chart/chart.xml item in the .crtx archive")
+    return min(chart_parts, key=len)
 
+
+def _parse_crtx_styling(crtx_path: str) -> CrtxStyling:
+    """Parse chart.xml of a .crtx file into CrtxStyling (uncached).
+
+    chart.xml is streamed with iterparse and only the style-bearing elements
+    (series, axes, data labels, legend) are inspected; each one is cleared
+    once handled so the cached category/value data is never held in full.
+    """
     result = {
         'series': [],
-        'category_axis': {},
-        'value_axis': {},
+        'category_axis': AxisStyle(),
+        'value_axis': AxisStyle(),
         'data_labels': [],
-        'legend': {},
+        'legend': LegendStyle(),
     }
 
-    # Extract series styling
-    for ser in root.findall('.//c:ser', ns):
-        series_style = {}
-
-        spPr = ser.find('.//c:spPr', ns)
-        if spPr is not None:
-            # Fill styling
-            solidFill = spPr.find('.//a:solidFill', ns)
-            if solidFill is not None:
-                # Check for RGB color
-                srgbClr = solidFill.find('.//a:srgbClr', ns)
-                if srgbClr is not None:
-                    series_style['fill_type'] = 'rgb'
-                    series_style['fill_value'] = f"#{srgbClr.get('val')}"
-
-                # Check for theme color
-                schemeClr = solidFill.find('.//a:schemeClr', ns)
-                if schemeClr is not None:
-                    series_style['fill_type'] = 'theme'
-                    series_style['fill_value'] = schemeClr.get('val')
-
-                    # Get lumMod (brightness modifier)
-                    lumMod = schemeClr.find('.//a:lumMod', ns)
-                    if lumMod is not None:
-                        series_style['fill_lummod'] = int(lumMod.get('val'))
-
-            # Line styling
-            ln = spPr.find('.//a:ln', ns)
-            if ln is not None:
-                solidFill_ln = ln.find('.//a:solidFill', ns)
-                if solidFill_ln is not None:
-                    schemeClr = solidFill_ln.find('.//a:schemeClr', ns)
-                    if schemeClr is not None:
-                        lumMod = schemeClr.find('.//a:lumMod', ns)
-                        if lumMod is not None:
-                            series_style['line_lummod'] = int(lumMod.get('val'))
-
-        result['series'].append(series_style)
-
-    # Extract category axis styling
-    catAx = root.find('.//c:catAx', ns)
-    if catAx is not None:
-        delete_elem = catAx.find('.//c:delete', ns)
-        result['category_axis']['visible'] = (delete_elem is None or delete_elem.get('val') == '0')
-
-        # Tick marks
-        majorTickMark = catAx.find('.//c:majorTickMark', ns)
-        if majorTickMark is not None:
-            result['category_axis']['major_tick_mark'] = majorTickMark.get('val')
-
-        minorTickMark = catAx.find('.//c:minorTickMark', ns)
-        if minorTickMark is not None:
-            result['category_axis']['minor_tick_mark'] = minorTickMark.get('val')
-
-        # Text properties (font)
-        txPr = catAx.find('.//c:txPr', ns)
-        if txPr is not None:
-            defRPr = txPr.find('.//a:defRPr', ns)
-            if defRPr is not None:
-                sz = defRPr.get('sz')
-                if sz:
-                    result['category_axis']['font_size_pt'] = int(sz) / 100
-
-                # Font color
-                solidFill = defRPr.find('.//a:solidFill', ns)
-                if solidFill is not None:
-                    schemeClr = solidFill.find('.//a:schemeClr', ns)
-                    if schemeClr is not None:
-                        result['category_axis']['font_color_theme'] = schemeClr.get('val')
-
-                        lumMod = schemeClr.find('.//a:lumMod', ns)
-                        if lumMod is not None:
-                            result['category_axis']['font_lummod'] = int(lumMod.get('val'))
-
-                        lumOff = schemeClr.find('.//a:lumOff', ns)
-                        if lumOff is not None:
-                            result['category_axis']['font_lumoff'] = int(lumOff.get('val'))
-
-        # Shape properties (line)
-        spPr = catAx.find('.//c:spPr', ns)
-        if spPr is not None:
-            ln = spPr.find('.//a:ln', ns)
-            if ln is not None:
-                width = ln.get('w')
-                if width:
-                    result['category_axis']['line_width_emu'] = int(width)
-
-                # Extract line color
-                solidFill = ln.find('.//a:solidFill', ns)
-                if solidFill is not None:
-                    # RGB color
-                    srgbClr = solidFill.find('.//a:srgbClr', ns)
-                    if srgbClr is not None:
-                        result['category_axis']['line_color_type'] = 'rgb'
-                        result['category_axis']['line_color_value'] = f"#{srgbClr.get('val')}"
-
-                    # Theme color
-                    schemeClr = solidFill.find('.//a:schemeClr', ns)
-                    if schemeClr is not None:
-                        result['category_axis']['line_color_type'] = 'theme'
-                        result['category_axis']['line_color_value'] = schemeClr.get('val')
-
-                        # lumMod and lumOff
-                        lumMod = schemeClr.find('.//a:lumMod', ns)
-                        if lumMod is not None:
-                            result['category_axis']['line_lummod'] = int(lumMod.get('val'))
-
-                        lumOff = schemeClr.find('.//a:lumOff', ns)
-                        if lumOff is not None:
-                            result['category_axis']['line_lumoff'] = int(lumOff.get('val'))
-
-    # Extract value axis styling
-    valAx = root.find('.//c:valAx', ns)
-    if valAx is not None:
-        delete_elem = valAx.find('.//c:delete', ns)
-        result['value_axis']['visible'] = (delete_elem is None or delete_elem.get('val') == '0')
-
-        # Tick marks
-        majorTickMark = valAx.find('.//c:majorTickMark', ns)
-        if majorTickMark is not None:
-            result['value_axis']['major_tick_mark'] = majorTickMark.get('val')
-
-        minorTickMark = valAx.find('.//c:minorTickMark', ns)
-        if minorTickMark is not None:
-            result['value_axis']['minor_tick_mark'] = minorTickMark.get('val')
-
-    # Extract data label styling
-    for dLbls in root.findall('.//c:dLbls', ns):
-        dl_style = {}
-
-        # Show options
-        showVal = dLbls.find('.//c:showVal', ns)
-        if showVal is not None:
-            dl_style['show_value'] = showVal.get('val') == '1'
-
-        # Position
-        dLblPos = dLbls.find('.//c:dLblPos', ns)
-        if dLblPos is not None:
-            dl_style['position'] = dLblPos.get('val')
-
-        # Number format
-        numFmt = dLbls.find('.//c:numFmt', ns)
-        if numFmt is not None:
-            dl_style['number_format'] = numFmt.get('formatCode')
-            # sourceLinked="0" means custom format
-            source_linked = numFmt.get('sourceLinked')
-            if source_linked is not None:
-                dl_style['number_format_linked'] = source_linked == '1'
-
-        # Text properties
-        txPr = dLbls.find('.//c:txPr', ns)
-        if txPr is not None:
-            defRPr = txPr.find('.//a:defRPr', ns)
-            if defRPr is not None:
-                sz = defRPr.get('sz')
-                if sz:
-                    dl_style['font_size_pt'] = int(sz) / 100
-
-                # Font color
-                solidFill = defRPr.find('.//a:solidFill', ns)
-                if solidFill is not None:
-                    # Check for RGB color first
-                    srgbClr = solidFill.find('.//a:srgbClr', ns)
-                    if srgbClr is not None:
-                        dl_style['font_color_rgb'] = srgbClr.get('val')
-                    else:
-                        # Check for scheme color
-                        schemeClr = solidFill.find('.//a:schemeClr', ns)
-                        if schemeClr is not None:
-                            dl_style['font_color_theme'] = schemeClr.get('val')
+    with zipfile.ZipFile(crtx_path, 'r') as z:
+        # Only the chart part is read - content types and relationships are
+        # never parsed
+        chart_part = _find_chart_part(z.namelist())
+        # ZipExtFile hands the parser small chunks; buffer them into 1 MiB
+        # reads so decompression and file I/O happen in large blocks
+        with z.open(chart_part) as zf, \
+                io.BufferedReader(zf, buffer_size=_READ_BUFFER_SIZE) as f:
+            for _, elem in etree.iterparse(f, events=('end',), tag=_STYLE_TAGS):
+                tag = elem.tag
+
+                if tag == _DLBLS_TAG:
+                    result['data_labels'].append(_extract_data_label_style(elem))
+                    # Series-level dLbls sit inside c:ser, whose earlier
+                    # children (spPr) are still needed - only drop own content
+                    elem.clear()
+                    continue
+
+                if tag == _SER_TAG:
+                    result['series'].append(_extract_series_style(elem))
+                elif tag == _CATAX_TAG:
+                    if not result['category_axis']:
+                        result['category_axis'] = _extract_category_axis_style(elem)
+                elif tag == _VALAX_TAG:
+                    if not result['value_axis']:
+                        result['value_axis'] = _extract_value_axis_style(elem)
+                elif tag == _LEGEND_TAG:
+                    # c:legend follows c:plotArea in CT_Chart and nothing after
+                    # it carries series/axis/label styling, so stop streaming
+                    result['legend'] = _extract_legend_style(elem)
+                    break
+
+                # Free the handled element and any already-processed siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+    return CrtxStyling(
+        series=tuple(result['series']),
+        series_brightness=tuple(_series_fill_brightness(result['series'])),
+        category_axis=result['category_axis'],
+        value_axis=result['value_axis'],
+        data_labels=tuple(result['data_labels']),
+        legend=result['legend'],
+    )
+
+
+def _series_fill_brightness(series_styles) -> List[Optional[float]]:
+    """Convert each series' fill_lummod to brightness (None if absent)."""
+    return lummods_to_brightness(style.fill_lummod for style in series_styles)
+
+
+def _warn_unknown_theme(logger, theme_val: str, context: str) -> None:
+    """Log a theme color name from the template that has no MSO_THEME_COLOR."""
+    logger.warning("Unknown theme color '%s' in %s", theme_val, context)
+
+
+def _get_theme_color_map() -> Mapping[str, MSO_THEME_COLOR]:
+    """Get comprehensive theme color mapping."""
+    return _THEME_MAP
 
-                            lumMod = schemeClr.find('.//a:lumMod', ns)
-                            if lumMod is not None:
-                                dl_style['font_lummod'] = int(lumMod.get('val'))
 
-                            lumOff = schemeClr.find('.//a:lumOff', ns)
-                            if lumOff is not None:
-                                dl_style['font_lumoff'] = int(lumOff.get('val'))
+def _hex_to_rgb(hex_str: str) -> RGBColor:
+    """Convert 'RRGGBB' or '#RRGGBB' to RGBColor with a single hex parse."""
+    if hex_str[:1] == '#':
+        hex_str = hex_str[1:]
+    v = int(hex_str, 16)
+    return RGBColor((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
 
-        result['data_labels'].append(dl_style)
 
-    # Extract legend styling
-    legend = root.find('.//c:legend', ns)
-    if legend is not None:
-        legendPos = legend.find('.//c:legendPos', ns)
-        if legendPos is not None:
-            result['legend']['position'] = legendPos.get('val')
+def _percentage(value: float) -> str:
+    """Format a fraction as an OOXML ST_Percentage value (e.g. 0.75 -> '75000')."""
+    return str(int(round(value * 100000.0)))
 
-        # Overlay
-        overlay = legend.find('.//c:overlay', ns)
-        if overlay is not None:
-            result['legend']['overlay'] = overlay.get('val') == '1'
 
-        txPr = legend.find('.//c:txPr', ns)
-        if txPr is not None:
-            defRPr = txPr.find('.//a:defRPr', ns)
-            if defRPr is not None:
-                sz = defRPr.get('sz')
-                if sz:
-                    result['legend']['font_size_pt'] = int(sz) / 100
+def _add_lum(color_elm, brightness: Optional[float]) -> None:
+    """Append lumMod/lumOff for a brightness the same way python-pptx does."""
+    if not brightness:
+        return
+    if brightness > 0:
+        # Tint: lighten towards white
+        etree.SubElement(color_elm, _LUMMOD_TAG, val=_percentage(1.0 - brightness))
+        etree.SubElement(color_elm, _LUMOFF_TAG, val=_percentage(brightness))
+    else:
+        # Shade: darken towards black
+        etree.SubElement(color_elm, _LUMMOD_TAG, val=_percentage(1.0 - abs(brightness)))
 
-                solidFill = defRPr.find('.//a:solidFill', ns)
-                if solidFill is not None:
-                    schemeClr = solidFill.find('.//a:schemeClr', ns)
-                    if schemeClr is not None:
-                        result['legend']['font_color_theme'] = schemeClr.get('val')
 
-                        lumMod = schemeClr.find('.//a:lumMod', ns)
-                        if lumMod is not None:
-                            result['legend']['font_lummod'] = int(lumMod.get('val'))
+def _solid_fill(xPr):
+    """Return an empty a:solidFill on spPr/ln, replacing any existing fill."""
+    solidFill = xPr.get_or_change_to_solidFill()
+    for child in list(solidFill):
+        solidFill.remove(child)
+    return solidFill
 
-                        lumOff = schemeClr.find('.//a:lumOff', ns)
-                        if lumOff is not None:
-                            result['legend']['font_lumoff'] = int(lumOff.get('val'))
 
-    return result
+def _apply_fill_series(series, idx: int, style: SeriesStyle,
+                       series_styles, series_brightness, logger) -> None:
+    """Apply fill (and border) styling for column/bar/area series.
 
+    The c:spPr fill/line subtrees are written directly on the series element
+    rather than through python-pptx's FillFormat/ColorFormat setters, which
+    re-resolve the same XML path for every property assigned.
+    """
+    spPr = series._element.get_or_add_spPr()
+    solidFill = _solid_fill(spPr)
+
+    if style.fill_type == 'rgb':
+        # RGB color
+        rgb_color = _hex_to_rgb(style.fill_value)
+        etree.SubElement(solidFill, _SRGBCLR_TAG, val=str(rgb_color))
+
+    elif style.fill_type == 'theme':
+        # Theme color (schemeClr val is the theme key itself, e.g. 'bg1')
+        theme_val = style.fill_value
+        if style.fill_theme_enum is not None:
+            schemeClr = etree.SubElement(solidFill, _SCHEMECLR_TAG, val=theme_val)
+            # Apply lumMod as brightness
+            _add_lum(schemeClr, series_brightness[idx])
+        else:
+            _warn_unknown_theme(logger, theme_val, f"series {idx} fill")
+
+    # Apply line styling for borders
+    if style.line_lummod is not None:
+        try:
+            lnFill = _solid_fill(spPr.get_or_add_ln())
+            schemeClr = etree.SubElement(lnFill, _SCHEMECLR_TAG, val='bg1')
+            _add_lum(schemeClr, lummod_to_brightness(style.line_lummod))
+        except Exception as e:
+            logger.warning("Failed to apply line styling to series %s: %s", idx, e)
+
+
+def _apply_line_series(series, idx: int, style: SeriesStyle,
+                       series_styles, series_brightness, logger) -> None:
+    """Apply line color styling for line chart series."""
+    if style.fill_type == 'rgb':
+        # RGB color for line
+        rgb_color = _hex_to_rgb(style.fill_value)
+        series.format.line.color.rgb = rgb_color
+
+    elif style.fill_type == 'theme':
+        # Theme color for line
+        theme_val = style.fill_value
+        theme_color = style.fill_theme_enum
+        if theme_color is not None:
+            series.format.line.color.theme_color = theme_color
+        else:
+            _warn_unknown_theme(logger, theme_val, f"series {idx} line")
 
-def _get_theme_color_map() -> Dict[str, MSO_THEME_COLOR]:
-    """Get comprehensive theme color mapping."""
-    return {
-        'tx1': MSO_THEME_COLOR.TEXT_1,
-        'tx2': MSO_THEME_COLOR.TEXT_2,
-        'bg1': MSO_THEME_COLOR.BACKGROUND_1,
-        'bg2': MSO_THEME_COLOR.BACKGROUND_2,
-        'accent1': MSO_THEME_COLOR.ACCENT_1,
-        'accent2': MSO_THEME_COLOR.ACCENT_2,
-        'accent3': MSO_THEME_COLOR.ACCENT_3,
-        'accent4': MSO_THEME_COLOR.ACCENT_4,
-        'accent5': MSO_THEME_COLOR.ACCENT_5,
-        'accent6': MSO_THEME_COLOR.ACCENT_6,
-        'hlink': MSO_THEME_COLOR.HYPERLINK,
-        'folHlink': MSO_THEME_COLOR.FOLLOWED_HYPERLINK,
-        'dk1': MSO_THEME_COLOR.DARK_1,
-        'lt1': MSO_THEME_COLOR.LIGHT_1,
-        'dk2': MSO_THEME_COLOR.DARK_2,
-        'lt2': MSO_THEME_COLOR.LIGHT_2,
-    }
+        # Apply lumMod as brightness
+        brightness = series_brightness[idx]
+        if brightness is not None:
+            series.format.line.color.brightness = brightness
 
 
-def apply_crtx_styling_to_chart(chart, crtx_styling: Dict[str, Any], limited_mode=False):
-    """Apply .crtx styling to an existing python-pptx chart.
+def _apply_pie_series(series, idx: int, style: SeriesStyle,
+                      series_styles, series_brightness, logger) -> None:
+    """Apply series styles to the individual points of a pie series.
 
-    Args:
-        chart: python-pptx Chart object
-        crtx_styling: Styling dict from extract_crtx_styling()
-        limited_mode: If True, only apply series colors (for compatibility)
+    Point 0 -> Series 0 colors, Point 1 -> Series 1 colors, etc.
+    Points beyond series count get BACKGROUND_1 with continuing brightness.
     """
-    from pptx.enum.chart import XL_CHART_TYPE
-    from pptx.util import Pt
-    from pptx.dml.color import RGBColor
-
-    logger = get_logger()
-    chart_type = chart.chart_type
-    theme_map = _get_theme_color_map()
+    points = series.points
+    n_styles = len(series_styles)
 
-    # Apply series styling
-    for idx, series in enumerate(chart.series):
-        if idx >= len(crtx_styling['series']):
-            break
+    # Brightness for points beyond series count, computed once up front:
+    # Point 3: -0.10, Point 4: -0.05, Point 5: 0.0, etc. (capped at 0.0)
+    extra_brightness = [min(0.0, -0.10 + (extra_idx * 0.05))
+                        for extra_idx in range(max(0, len(points) - n_styles))]
 
-        style = crtx_styling['series'][idx]
+    for point_idx, point in enumerate(points):
+        point.format.fill.solid()
 
-        # Apply fill for column/bar/area charts
-        if chart_type in [XL_CHART_TYPE.COLUMN_CLUSTERED, XL_CHART_TYPE.BAR_CLUSTERED,
-                          XL_CHART_TYPE.COLUMN_STACKED, XL_CHART_TYPE.BAR_STACKED,
-                          XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED]:
-            series.format.fill.solid()
+        if point_idx < n_styles:
+            # Use series styling
+            point_style = series_styles[point_idx]
 
-            if style.get('fill_type') == 'rgb':
+            if point_style.fill_type == 'rgb':
                 # RGB color
-                rgb_hex = style['fill_value'].lstrip('#')
-                rgb_color = RGBColor.from_string(rgb_hex)
-                series.format.fill.fore_color.rgb = rgb_color
+                rgb_color = _hex_to_rgb(point_style.fill_value)
+                point.format.fill.fore_color.rgb = rgb_color
 
-            elif style.get('fill_type') == 'theme':
+            elif point_style.fill_type == 'theme':
                 # Theme color
-                theme_val = style['fill_value']
-                if theme_val in theme_map:
-                    series.format.fill.fore_color.theme_color = theme_map[theme_val]
+                theme_val = point_style.fill_value
+                theme_color = point_style.fill_theme_enum
+                if theme_color is not None:
+                    point.format.fill.fore_color.theme_color = theme_color
                 else:
-                    logger.warning(f"Unknown theme color '{theme_val}' in series {idx} fill")
+                    _warn_unknown_theme(logger, theme_val, f"pie point {point_idx}")
 
                 # Apply lumMod as brightness
-                if 'fill_lummod' in style:
-                    brightness = lummod_to_brightness(style['fill_lummod'])
-                    series.format.fill.fore_color.brightness = brightness
+                brightness = series_brightness[point_idx]
+                if brightness is not None:
+                    point.format.fill.fore_color.brightness = brightness
+        else:
+            # Points beyond series count: continue BACKGROUND_1 with brightness gradient
+            point.format.fill.fore_color.theme_color = MSO_THEME_COLOR.BACKGROUND_1
+            point.format.fill.fore_color.brightness = extra_brightness[point_idx - n_styles]
+
+
+# Chart types whose series are styled via fill (column/bar/area)
+_FILL_TYPES = frozenset({
+    XL_CHART_TYPE.COLUMN_CLUSTERED, XL_CHART_TYPE.BAR_CLUSTERED,
+    XL_CHART_TYPE.COLUMN_STACKED, XL_CHART_TYPE.BAR_STACKED,
+    XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED,
+})
+
+# Area charts skip gridline/data label position settings (python-pptx compatibility)
+_AREA_TYPES = frozenset({XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED})
+
+# Data label position used when the template has none. Area charts are
+# deliberately absent - position setting causes XML corruption.
+_DEFAULT_DL_POSITION = MappingProxyType({
+    XL_CHART_TYPE.LINE: XL_DATA_LABEL_POSITION.ABOVE,  # top for line charts
+    XL_CHART_TYPE.COLUMN_CLUSTERED: XL_DATA_LABEL_POSITION.OUTSIDE_END,  # outside end for bar/column
+    XL_CHART_TYPE.BAR_CLUSTERED: XL_DATA_LABEL_POSITION.OUTSIDE_END,
+    XL_CHART_TYPE.COLUMN_STACKED: XL_DATA_LABEL_POSITION.CENTER,  # center for stacked
+    XL_CHART_TYPE.BAR_STACKED: XL_DATA_LABEL_POSITION.CENTER,
+    XL_CHART_TYPE.PIE: XL_DATA_LABEL_POSITION.OUTSIDE_END,  # outside for pie
+})
+
+# Series styling handler per chart type (other chart types are left unstyled)
+_SERIES_HANDLERS = MappingProxyType({
+    **{chart_type: _apply_fill_series for chart_type in _FILL_TYPES},
+    XL_CHART_TYPE.LINE: _apply_line_series,
+    XL_CHART_TYPE.PIE: _apply_pie_series,
+})
+
+
+def apply_crtx_styling_to_chart(chart, crtx_styling: CrtxStyling, limited_mode=False):
+    """Apply .crtx styling to an existing python-pptx chart.
 
-            # Apply line styling for borders
-            if 'line_lummod' in style:
-                try:
-                    series.format.line.color.theme_color = MSO_THEME_COLOR.BACKGROUND_1
-                    brightness = lummod_to_brightness(style['line_lummod'])
-                    series.format.line.color.brightness = brightness
-                except Exception as e:
-                    get_logger().warning(f"Failed to apply line styling to series {idx}: {e}")
-
-        # Apply line for line charts
-        elif chart_type == XL_CHART_TYPE.LINE:
-            if style.get('fill_type') == 'rgb':
-                # RGB color for line
-                rgb_hex = style['fill_value'].lstrip('#')
-                rgb_color = RGBColor.from_string(rgb_hex)
-                series.format.line.color.rgb = rgb_color
-
-            elif style.get('fill_type') == 'theme':
-                # Theme color for line
-                theme_val = style['fill_value']
-                if theme_val in theme_map:
-                    series.format.line.color.theme_color = theme_map[theme_val]
-                else:
-                    logger.warning(f"Unknown theme color '{theme_val}' in series {idx} line")
+    Args:
+        chart: python-pptx Chart object
+        crtx_styling: CrtxStyling from extract_crtx_styling()
+        limited_mode: If True, only apply series colors (for compatibility)
+    """
+    logger = get_logger()
+    chart_type = chart.chart_type
 
-                # Apply lumMod as brightness
-                if 'fill_lummod' in style:
-                    brightness = lummod_to_brightness(style['fill_lummod'])
-                    series.format.line.color.brightness = brightness
-
-        # Apply to pie charts - use series colors for points
-        elif chart_type == XL_CHART_TYPE.PIE:
-            # For pie chart, apply series styling to individual points
-            # Point 0 -> Series 0 colors, Point 1 -> Series 1 colors, etc.
-            # Points beyond series count get BACKGROUND_1 with continuing brightness
-            for point_idx, point in enumerate(series.points):
-                point.format.fill.solid()
-
-                if point_idx < len(crtx_styling['series']):
-                    # Use series styling
-                    point_style = crtx_styling['series'][point_idx]
-
-                    if point_style.get('fill_type') == 'rgb':
-                        # RGB color
-                        rgb_hex = point_style['fill_value'].lstrip('#')
-                        rgb_color = RGBColor.from_string(rgb_hex)
-                        point.format.fill.fore_color.rgb = rgb_color
-
-                    elif point_style.get('fill_type') == 'theme':
-                        # Theme color
-                        theme_val = point_style['fill_value']
-                        if theme_val in theme_map:
-                            point.format.fill.fore_color.theme_color = theme_map[theme_val]
-                        else:
-                            logger.warning(f"Unknown theme color '{theme_val}' in pie point {point_idx}")
+    # Apply series styling (handler chosen once per chart, not per series)
+    series_styles = crtx_styling.series
+    apply_series = _SERIES_HANDLERS.get(chart_type)
+    if apply_series is not None:
+        series_brightness = crtx_styling.series_brightness
+        for idx, series in enumerate(chart.series):
+            if idx >= len(series_styles):
+                break
 
-                        # Apply lumMod as brightness
-                        if 'fill_lummod' in point_style:
-                            brightness = lummod_to_brightness(point_style['fill_lummod'])
-                            point.format.fill.fore_color.brightness = brightness
-                else:
-                    # Points beyond series count: continue BACKGROUND_1 with brightness gradient
-                    # Point 3: -0.10, Point 4: -0.05, Point 5: 0.0, etc.
-                    point.format.fill.fore_color.theme_color = MSO_THEME_COLOR.BACKGROUND_1
-                    extra_idx = point_idx - len(crtx_styling['series'])
-                    brightness = -0.10 + (extra_idx * 0.05)
-                    brightness = min(0.0, brightness)  # Cap at 0.0
-                    point.format.fill.fore_color.brightness = brightness
+            apply_series(series, idx, series_styles[idx], series_styles,
+                         series_brightness, logger)
 
     # Apply category axis styling (skip in limited mode for compatibility)
     if not limited_mode and chart_type != XL_CHART_TYPE.PIE:
-        cat_axis = crtx_styling.get('category_axis', {})
+        cat_axis = crtx_styling.category_axis
         if cat_axis:
             try:
                 # Tick marks
-                from pptx.enum.chart import XL_TICK_MARK
-                tick_map = {
-                    'none': XL_TICK_MARK.NONE,
-                    'inside': XL_TICK_MARK.INSIDE,
-                    'outside': XL_TICK_MARK.OUTSIDE,
-                    'cross': XL_TICK_MARK.CROSS,
-                }
-                if 'major_tick_mark' in cat_axis:
-                    tick_val = cat_axis['major_tick_mark']
-                    if tick_val in tick_map:
-                        chart.category_axis.major_tick_mark = tick_map[tick_val]
-
-                if 'minor_tick_mark' in cat_axis:
-                    tick_val = cat_axis['minor_tick_mark']
-                    if tick_val in tick_map:
-                        chart.category_axis.minor_tick_mark = tick_map[tick_val]
+                if cat_axis.major_tick_enum is not None:
+                    chart.category_axis.major_tick_mark = cat_axis.major_tick_enum
+
+                if cat_axis.minor_tick_enum is not None:
+                    chart.category_axis.minor_tick_mark = cat_axis.minor_tick_enum
 
                 # Line width
-                if 'line_width_emu' in cat_axis:
-                    chart.category_axis.format.line.width = cat_axis['line_width_emu']
+                if cat_axis.line_width_emu is not None:
+                    chart.category_axis.format.line.width = cat_axis.line_width_emu
 
                 # Line color
-                if 'line_color_type' in cat_axis:
-                    if cat_axis['line_color_type'] == 'rgb':
-                        rgb_hex = cat_axis['line_color_value'].lstrip('#')
-                        rgb_color = RGBColor.from_string(rgb_hex)
+                if cat_axis.line_color_type is not None:
+                    if cat_axis.line_color_type == 'rgb':
+                        rgb_color = _hex_to_rgb(cat_axis.line_color_value)
                         chart.category_axis.format.line.color.rgb = rgb_color
-                    elif cat_axis['line_color_type'] == 'theme':
-                        theme_val = cat_axis['line_color_value']
-                        if theme_val in theme_map:
-                            chart.category_axis.format.line.color.theme_color = theme_map[theme_val]
+                    elif cat_axis.line_color_type == 'theme':
+                        theme_val = cat_axis.line_color_value
+                        theme_color = cat_axis.line_theme_enum
+                        if theme_color is not None:
+                            chart.category_axis.format.line.color.theme_color = theme_color
 
                             # Apply lumMod/lumOff as brightness
-                            if 'line_lummod' in cat_axis:
-                                lummod = cat_axis['line_lummod']
-                                lumoff = cat_axis.get('line_lumoff', 0)
+                            if cat_axis.line_lummod is not None:
+                                lummod = cat_axis.line_lummod
+                                lumoff = cat_axis.line_lumoff or 0
                                 brightness = lummod_to_brightness(lummod, lumoff)
                                 chart.category_axis.format.line.color.brightness = brightness
                         else:
-                            logger.warning(f"Unknown theme color '{theme_val}' in category axis line")
+                            _warn_unknown_theme(logger, theme_val, "category axis line")
 
                 # Font properties
-                if 'font_size_pt' in cat_axis:
-                    from pptx.util import Pt
-                    chart.category_axis.tick_labels.font.size = Pt(cat_axis['font_size_pt'])
-
-                if 'font_color_theme' in cat_axis:
-                    theme_val = cat_axis['font_color_theme']
-                    if theme_val in theme_map:
-                        chart.category_axis.tick_labels.font.color.theme_color = theme_map[theme_val]
-
-                        if 'font_lummod' in cat_axis:
-                            lummod = cat_axis['font_lummod']
-                            lumoff = cat_axis.get('font_lumoff', 0)
+                if cat_axis.font_size_pt is not None:
+                    chart.category_axis.tick_labels.font.size = Pt(cat_axis.font_size_pt)
+
+                if cat_axis.font_color_theme is not None:
+                    theme_val = cat_axis.font_color_theme
+                    theme_color = cat_axis.font_theme_enum
+                    if theme_color is not None:
+                        chart.category_axis.tick_labels.font.color.theme_color = theme_color
+
+                        if cat_axis.font_lummod is not None:
+                            lummod = cat_axis.font_lummod
+                            lumoff = cat_axis.font_lumoff or 0
                             brightness = lummod_to_brightness(lummod, lumoff)
                             chart.category_axis.tick_labels.font.color.brightness = brightness
                     else:
-                        logger.warning(f"Unknown theme color '{theme_val}' in category axis font")
+                        _warn_unknown_theme(logger, theme_val, "category axis font")
 
             except Exception as e:
-                get_logger().warning(f"Failed to apply category axis styling: {e}")
+                logger.warning("Failed to apply category axis styling: %s", e)
 
         # Apply value axis styling
-        val_axis = crtx_styling.get('value_axis', {})
+        val_axis = crtx_styling.value_axis
         if val_axis:
             try:
-                if 'visible' in val_axis:
-                    chart.value_axis.visible = val_axis['visible']
+                if val_axis.visible is not None:
+                    chart.value_axis.visible = val_axis.visible
 
                 # Tick marks
-                from pptx.enum.chart import XL_TICK_MARK
-                tick_map = {
-                    'none': XL_TICK_MARK.NONE,
-                    'inside': XL_TICK_MARK.INSIDE,
-                    'outside': XL_TICK_MARK.OUTSIDE,
-                    'cross': XL_TICK_MARK.CROSS,
-                }
-                if 'major_tick_mark' in val_axis:
-                    tick_val = val_axis['major_tick_mark']
-                    if tick_val in tick_map:
-                        chart.value_axis.major_tick_mark = tick_map[tick_val]
-
-                if 'minor_tick_mark' in val_axis:
-                    tick_val = val_axis['minor_tick_mark']
-                    if tick_val in tick_map:
-                        chart.value_axis.minor_tick_mark = tick_map[tick_val]
+                if val_axis.major_tick_enum is not None:
+                    chart.value_axis.major_tick_mark = val_axis.major_tick_enum
+
+                if val_axis.minor_tick_enum is not None:
+                    chart.value_axis.minor_tick_mark = val_axis.minor_tick_enum
 
             except Exception as e:
-                get_logger().warning(f"Failed to apply value axis styling: {e}")
+                logger.warning("Failed to apply value axis styling: %s", e)
 
         # Disable gridlines (template has no gridlines)
         # NOTE: Skip for area charts - has_major_gridlines causes XML corruption
-        if chart_type not in [XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED]:
+        if chart_type not in _AREA_TYPES:
             try:
                 chart.value_axis.has_major_gridlines = False
                 chart.value_axis.has_minor_gridlines = False
             except Exception as e:
-                get_logger().warning(f"Failed to disable value axis gridlines: {e}")
+                logger.warning("Failed to disable value axis gridlines: %s", e)
 
             try:
                 chart.category_axis.has_major_gridlines = False
                 chart.category_axis.has_minor_gridlines = False
             except Exception as e:
-                get_logger().warning(f"Failed to disable category axis gridlines: {e}")
+                logger.warning("Failed to disable category axis gridlines: %s", e)
         else:
-            get_logger().info("Skipping gridline settings for area chart (python-pptx compatibility)")
+            logger.info("Skipping gridline settings for area chart (python-pptx compatibility)")
 
     # Apply data label styling (skip in limited mode for compatibility)
     if limited_mode:
-        get_logger().info("Limited mode: skipping data label styling")
+        logger.info("Limited mode: skipping data label styling")
         return
 
-    data_labels = crtx_styling.get('data_labels', [])
+    data_labels = crtx_styling.data_labels
     if data_labels:
         # Use first data label style as default for all series
-        default_dl = data_labels[0] if data_labels else {}
+        default_dl = data_labels[0]
 
         for series_idx, series in enumerate(chart.series):
             # Get series-specific or default style
             dl_style = data_labels[series_idx] if series_idx < len(data_labels) else default_dl
 
-            if dl_style.get('show_value', False):
+            if dl_style.show_value:
                 series.has_data_labels = True
                 dl = series.data_labels
                 dl.show_value = True
 
                 # Position - default based on chart type if not in template
                 # NOTE: Skip position for area charts - causes XML corruption in python-pptx
-                position_val = dl_style.get('position')
-                if not position_val:
-                    # Set default based on chart type
-                    from pptx.enum.chart import XL_CHART_TYPE
-                    if chart_type == XL_CHART_TYPE.LINE:
-                        position_val = 't'  # top for line charts
-                    elif chart_type in [XL_CHART_TYPE.COLUMN_CLUSTERED, XL_CHART_TYPE.BAR_CLUSTERED]:
-                        position_val = 'outEnd'  # outside end for bar/column
-                    elif chart_type in [XL_CHART_TYPE.COLUMN_STACKED, XL_CHART_TYPE.BAR_STACKED]:
-                        position_val = 'ctr'  # center for stacked
-                    elif chart_type == XL_CHART_TYPE.PIE:
-                        position_val = 'outEnd'  # outside for pie
-                    # Skip area charts - position setting causes XML corruption
-                    # elif chart_type in [XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED]:
-                    #     position_val = 't'
+                if dl_style.position:
+                    position = dl_style.position_enum
+                else:
+                    position = _DEFAULT_DL_POSITION.get(chart_type)
 
                 # Skip position setting for area charts (python-pptx compatibility)
-                if position_val and chart_type not in [XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED]:
-                    from pptx.enum.chart import XL_DATA_LABEL_POSITION
-                    pos_map = {
-                        't': XL_DATA_LABEL_POSITION.ABOVE,
-                        'b': XL_DATA_LABEL_POSITION.BELOW,
-                        'l': XL_DATA_LABEL_POSITION.LEFT,
-                        'r': XL_DATA_LABEL_POSITION.RIGHT,
-                        'ctr': XL_DATA_LABEL_POSITION.CENTER,
-                        'inBase': XL_DATA_LABEL_POSITION.INSIDE_BASE,
-                        'inEnd': XL_DATA_LABEL_POSITION.INSIDE_END,
-                        'outEnd': XL_DATA_LABEL_POSITION.OUTSIDE_END,
-                    }
-                    if position_val in pos_map:
-                        try:
-                            dl.position = pos_map[position_val]
-                        except Exception as e:
-                            logger.warning(f"Failed to set data label position for series {series_idx}: {e}")
+                if position is not None and chart_type not in _AREA_TYPES:
+                    try:
+                        dl.position = position
+                    except Exception as e:
+                        logger.warning("Failed to set data label position for series %s: %s", series_idx, e)
 
                 # Number format
-                if 'number_format' in dl_style:
+                if dl_style.number_format is not None:
                     try:
-                        dl.number_format = dl_style['number_format']
+                        dl.number_format = dl_style.number_format
                     except Exception as e:
-                        logger.warning(f"Failed to set data label number format for series {series_idx}: {e}")
+                        logger.warning("Failed to set data label number format for series %s: %s", series_idx, e)
 
                 # Font size
-                if 'font_size_pt' in dl_style:
-                    from pptx.util import Pt
-                    dl.font.size = Pt(dl_style['font_size_pt'])
+                if dl_style.font_size_pt is not None:
+                    dl.font.size = Pt(dl_style.font_size_pt)
 
                 # Font color - RGB or theme
-                if 'font_color_rgb' in dl_style:
+                if dl_style.font_color_rgb is not None:
                     # Apply RGB color
                     try:
-                        from pptx.dml.color import RGBColor
-                        rgb_val = dl_style['font_color_rgb']
-                        r = int(rgb_val[0:2], 16)
-                        g = int(rgb_val[2:4], 16)
-                        b = int(rgb_val[4:6], 16)
-                        dl.font.color.rgb = RGBColor(r, g, b)
+                        dl.font.color.rgb = _hex_to_rgb(dl_style.font_color_rgb)
                     except Exception as e:
-                        logger.warning(f"Failed to apply RGB color to data label for series {series_idx}: {e}")
-                elif 'font_color_theme' in dl_style:
-                    theme_val = dl_style['font_color_theme']
-                    if theme_val in theme_map:
+                        logger.warning("Failed to apply RGB color to data label for series %s: %s", series_idx, e)
+                elif dl_style.font_color_theme is not None:
+                    theme_val = dl_style.font_color_theme
+                    theme_color = dl_style.font_theme_enum
+                    if theme_color is not None:
                         try:
-                            dl.font.color.theme_color = theme_map[theme_val]
+                            dl.font.color.theme_color = theme_color
 
-                            if 'font_lummod' in dl_style:
-                                lummod = dl_style['font_lummod']
-                                lumoff = dl_style.get('font_lumoff', 0)
+                            if dl_style.font_lummod is not None:
+                                lummod = dl_style.font_lummod
+                                lumoff = dl_style.font_lumoff or 0
                                 brightness = lummod_to_brightness(lummod, lumoff)
                                 dl.font.color.brightness = brightness
                         except Exception as e:
-                            logger.warning(f"Failed to apply data label font color for series {series_idx}: {e}")
+                            logger.warning("Failed to apply data label font color for series %s: %s", series_idx, e)
                     else:
-                        logger.warning(f"Unknown theme color '{theme_val}' in data label font for series {series_idx}")
+                        _warn_unknown_theme(logger, theme_val, f"data label font for series {series_idx}")
 
     # Apply legend styling
-    legend_style = crtx_styling.get('legend', {})
+    legend_style = crtx_styling.legend
     if legend_style:
         chart.has_legend = True
 
         # Position
-        if 'position' in legend_style:
-            from pptx.enum.chart import XL_LEGEND_POSITION
-            pos_map = {
-                'b': XL_LEGEND_POSITION.BOTTOM,
-                't': XL_LEGEND_POSITION.TOP,
-                'r': XL_LEGEND_POSITION.RIGHT,
-                'l': XL_LEGEND_POSITION.LEFT,
-            }
-            pos_val = legend_style['position']
-            if pos_val in pos_map:
-                chart.legend.position = pos_map[pos_val]
+        if legend_style.position_enum is not None:
+            chart.legend.position = legend_style.position_enum
 
         # Overlay
-        if 'overlay' in legend_style:
-            chart.legend.include_in_layout = legend_style['overlay']
+        if legend_style.overlay is not None:
+            chart.legend.include_in_layout = legend_style.overlay
 
         # Font size
-        if 'font_size_pt' in legend_style:
-            from pptx.util import Pt
-            chart.legend.font.size = Pt(legend_style['font_size_pt'])
+        if legend_style.font_size_pt is not None:
+            chart.legend.font.size = Pt(legend_style.font_size_pt)
 
         # Font color
-        if 'font_color_theme' in legend_style:
-            theme_val = legend_style['font_color_theme']
-            if theme_val in theme_map:
+        if legend_style.font_color_theme is not None:
+            theme_val = legend_style.font_color_theme
+            theme_color = legend_style.font_theme_enum
+            if theme_color is not None:
                 try:
-                    chart.legend.font.color.theme_color = theme_map[theme_val]
+                    chart.legend.font.color.theme_color = theme_color
 
-                    if 'font_lummod' in legend_style:
-                        lummod = legend_style['font_lummod']
-                        lumoff = legend_style.get('font_lumoff', 0)
+                    if legend_style.font_lummod is not None:
+                        lummod = legend_style.font_lummod
+                        lumoff = legend_style.font_lumoff or 0
                         brightness = lummod_to_brightness(lummod, lumoff)
                         chart.legend.font.color.brightness = brightness
                 except Exception as e:
-                    logger.warning(f"Failed to apply legend font color: {e}")
+                    logger.warning("Failed to apply legend font color: %s", e)
             else:
-                logger.warning(f"Unknown theme color '{theme_val}' in legend font")
+                _warn_unknown_theme(logger, theme_val, "legend font")
 
 
 if __name__ == '__main__':
@@ -707,14 +1038,14 @@ if __name__ == '__main__':
 
     print("Extracted styling:")
     import json
-    print(json.dumps(styling, indent=2))
+    print(json.dumps(styling, indent=2, default=dict))
 
     # Convert lumMod to brightness
     print("\nBrightness conversions:")
-    for idx, ser in enumerate(styling['series']):
-        if 'fill_lummod' in ser:
-            brightness = lummod_to_brightness(ser['fill_lummod'])
-            print(f"  Series {idx} fill: lumMod {ser['fill_lummod']} → brightness {brightness}")
-        if 'line_lummod' in ser:
-            brightness = lummod_to_brightness(ser['line_lummod'])
-            print(f"  Series {idx} line: lumMod {ser['line_lummod']} → brightness {brightness}")
+    for idx, ser in enumerate(styling.series):
+        if ser.fill_lummod is not None:
+            brightness = lummod_to_brightness(ser.fill_lummod)
+            print(f"  Series {idx} fill: lumMod {ser.fill_lummod} → brightness {brightness}")
+        if ser.line_lummod is not None:
+            brightness = lummod_to_brightness(ser.line_lummod)
+            print(f"  Series {idx} line: lumMod {ser.line_lummod} → brightness {brightness}")
@@ -8,62 +8,204 @@ This module creates a Single Source of Truth (style.yaml) from:
 
 The generated YAML can be used by Python, R, and JavaScript/Mermaid.
 
-Usage:
-    python scripts/extract_style.py
+Usage (from the skill root):
+    python -m scripts.extract_style
 
 Example:
-    python scripts/extract_style.py
-    python scripts/extract_style.py --template path/to/template.pptx
+    python -m scripts.extract_style
+    python -m scripts.extract_style --template path/to/template.pptx
+    python -m scripts.extract_style --batch path/to/templates/
 """
 
+import functools
+import glob
 import os
 import sys
 import yaml
-from typing import Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
-# Add scripts directory to path for imports
-sys.path.insert(0, os.path.dirname(__file__))
-
-from crtx_utils import extract_crtx_styling, lummod_to_brightness
+from scripts.cache_utils import file_cache_key, read_json_cache, write_json_cache
+from scripts.crtx_utils import extract_crtx_styling, lummod_to_brightness, lummods_to_brightness
+from lxml import etree
 from pptx import Presentation
 from pptx.enum.dml import MSO_THEME_COLOR, MSO_COLOR_TYPE
+from pptx.shapes.shapetree import SlideShapeFactory
 from pptx.util import Emu
 
+# libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CDumper as _YamlDumper
+except ImportError:
+    from yaml import Dumper as _YamlDumper
+
+
+# DrawingML (table/fill XML) and PresentationML (slide shape tree) namespaces
+_NSMAP = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_A = '{%s}' % _NSMAP['a']
+
+# Table XPaths compiled once at import time. extract_table_style() reads the
+# a:tbl XML through these directly instead of going through python-pptx's
+# cell/fill/font proxies, which re-resolve the XML on every attribute access.
+_XP_TBL_ROWS = etree.XPath('./a:tr', namespaces=_NSMAP)
+_XP_TBL_GRID_COLS = etree.XPath('./a:tblGrid/a:gridCol', namespaces=_NSMAP)
+_XP_ROW_CELLS = etree.XPath('./a:tc', namespaces=_NSMAP)
+_XP_CELL_FIRST_RUN = etree.XPath('./a:txBody/a:p[1]/a:r[1]', namespaces=_NSMAP)
+
+# Flowchart shape candidates on a slide, in document order: non-placeholder
+# connectors, and solid-filled preset-geometry auto shapes (not text boxes).
+# extract_flowchart_style() builds python-pptx shapes for these only.
+_XP_FLOWCHART_SHAPES = etree.XPath(
+    './p:cSld/p:spTree/*['
+    'self::p:cxnSp[not(p:nvCxnSpPr/p:nvPr/p:ph)]'
+    ' or self::p:sp[p:spPr/a:prstGeom and p:spPr/a:solidFill'
+    ' and not(p:nvSpPr/p:nvPr/p:ph)'
+    ' and not(p:nvSpPr/p:cNvSpPr[@txBox="1" or @txBox="true"])]]',
+    namespaces=_NSMAP,
+)
+_CXNSP_TAG = '{%s}cxnSp' % _NSMAP['p']
+
+_TCPR_TAG = _A + 'tcPr'
+_RPR_TAG = _A + 'rPr'
+_SOLIDFILL_TAG = _A + 'solidFill'
+_SCHEMECLR_TAG = _A + 'schemeClr'
+_SRGBCLR_TAG = _A + 'srgbClr'
+_LUMMOD_TAG = _A + 'lumMod'
+_LUMOFF_TAG = _A + 'lumOff'
+_FILL_TAGS = frozenset(_A + t for t in (
+    'noFill', 'solidFill', 'gradFill', 'blipFill', 'pattFill', 'grpFill'))
+_COLOR_TAGS = frozenset(_A + t for t in (
+    'scrgbClr', 'srgbClr', 'hslClr', 'sysClr', 'schemeClr', 'prstClr'))
+
+# Theme colors written to style.yaml (anything else maps to 'bg1')
+_THEME_MAP = {
+    MSO_THEME_COLOR.TEXT_1: 'tx1',
+    MSO_THEME_COLOR.TEXT_2: 'tx2',
+    MSO_THEME_COLOR.BACKGROUND_1: 'bg1',
+    MSO_THEME_COLOR.BACKGROUND_2: 'bg2',
+    MSO_THEME_COLOR.DARK_1: 'dk1',
+    MSO_THEME_COLOR.DARK_2: 'dk2',
+    MSO_THEME_COLOR.LIGHT_1: 'lt1',
+    MSO_THEME_COLOR.LIGHT_2: 'lt2',
+    MSO_THEME_COLOR.ACCENT_1: 'accent1',
+    MSO_THEME_COLOR.ACCENT_2: 'accent2',
+}
+
+# Same names as they appear in a:schemeClr/@val, for reads straight from XML
+_TABLE_THEME_NAMES = frozenset(_THEME_MAP.values())
+
+# Two-digit uppercase hex for each byte value, used by rgb_to_hex()
+_HEX_BYTE = tuple(format(i, '02X') for i in range(256))
+
+# MSO_LINE_DASH_STYLE value -> style.yaml dash_style
+_DASH_MAP = {1: 'solid', 4: 'dash', 2: 'dot'}
+
+# Errors python-pptx raises when reading style properties a shape does not
+# have (fore_color of a non-solid fill, rgb of a theme color, values it cannot
+# map to an enum). Extraction skips those properties and keeps the defaults.
+_PPTX_READ_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+# lumMod/lumOff key pairs of the crtx sections read by convert_to_style_yaml()
+_DEFAULT_LUMMOD = 100000
+_FONT_LUM_KEYS = ('font_lummod', 'font_lumoff')
+_LINE_LUM_KEYS = ('line_lummod', 'line_lumoff')
+
+# Extracted sections are kept in the JSON cache (cache_utils), one file per
+# section and source. Entries are also keyed on the stat of the extraction
+# code, so editing it invalidates them; bump the version when the format of
+# a cached section changes.
+_STYLE_CACHE_VERSION = 1
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_EXTRACTION_CODE = (os.path.join(_SCRIPT_DIR, 'extract_style.py'),
+                    os.path.join(_SCRIPT_DIR, 'crtx_utils.py'))
+
 
 def rgb_to_hex(rgb) -> str:
     """Convert RGBColor to hex string."""
-    return f"#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
+    r, g, b = rgb
+    return '#' + _HEX_BYTE[r] + _HEX_BYTE[g] + _HEX_BYTE[b]
 
 
 def theme_to_str(theme_color) -> str:
     """Convert MSO_THEME_COLOR to string."""
-    theme_map = {
-        MSO_THEME_COLOR.TEXT_1: 'tx1',
-        MSO_THEME_COLOR.TEXT_2: 'tx2',
-        MSO_THEME_COLOR.BACKGROUND_1: 'bg1',
-        MSO_THEME_COLOR.BACKGROUND_2: 'bg2',
-        MSO_THEME_COLOR.DARK_1: 'dk1',
-        MSO_THEME_COLOR.DARK_2: 'dk2',
-        MSO_THEME_COLOR.LIGHT_1: 'lt1',
-        MSO_THEME_COLOR.LIGHT_2: 'lt2',
-        MSO_THEME_COLOR.ACCENT_1: 'accent1',
-        MSO_THEME_COLOR.ACCENT_2: 'accent2',
-    }
-    return theme_map.get(theme_color, 'bg1')
+    return _THEME_MAP.get(theme_color, 'bg1')
+
+
+def _first_child(parent, tags):
+    """Return the first direct child of parent whose tag is in tags, or None."""
+    if parent is not None:
+        for child in parent:
+            if child.tag in tags:
+                return child
+    return None
+
+
+def _xml_percentage(value: str) -> float:
+    """Parse an ST_Percentage attribute ('75000' or '75%') to a fraction."""
+    if '%' in value:
+        return float(value[:-1]) / 100.0
+    return int(value) / 100000.0
 
 
-def extract_table_style(prs: Presentation, slide_index: int = 1) -> Dict[str, Any]:
+def _xml_brightness(color_elm) -> float:
+    """Brightness of a DrawingML color element, as python-pptx reports it."""
+    lum_off = color_elm.find(_LUMOFF_TAG)
+    if lum_off is not None:
+        return _xml_percentage(lum_off.get('val'))
+    lum_mod = color_elm.find(_LUMMOD_TAG)
+    if lum_mod is not None:
+        return _xml_percentage(lum_mod.get('val')) - 1.0
+    return 0
+
+
+def _scheme_name(color_elm) -> str:
+    """Map an a:schemeClr element to the theme string used in style.yaml."""
+    val = color_elm.get('val')
+    return val if val in _TABLE_THEME_NAMES else 'bg1'
+
+
+def _solid_color(fill_parent):
+    """Return (fill, color) for the fill properties of fill_parent.
+
+    fill is the first fill element (None when unfilled); color is the color
+    element of a solid fill, or None for any other fill.
+    """
+    fill = _first_child(fill_parent, _FILL_TAGS)
+    if fill is None or fill.tag != _SOLIDFILL_TAG:
+        return fill, None
+    return fill, _first_child(fill, _COLOR_TAGS)
+
+
+def _read_run_font(tc, style: Dict[str, Any], read_bold: bool) -> None:
+    """Copy size/bold/scheme text color of a cell's first run into style."""
+    runs = _XP_CELL_FIRST_RUN(tc)
+    if not runs:
+        return
+    rPr = runs[0].find(_RPR_TAG)
+    sz = rPr.get('sz') if rPr is not None else None
+    if sz:
+        style['font_size_pt'] = int(int(sz) / 100)
+    if read_bold:
+        style['font_bold'] = rPr is not None and rPr.get('b') in ('1', 'true')
+
+    _, color = _solid_color(rPr)
+    if color is not None and color.tag == _SCHEMECLR_TAG:
+        style['text_color_theme'] = _scheme_name(color)
+        style['text_color_brightness'] = round(_xml_brightness(color), 2)
+
+
+def extract_table_style(slide) -> Dict[str, Any]:
     """Extract table styling from template.pptx.
 
     Args:
-        prs: Presentation object
-        slide_index: Slide number (1-based, default 1)
+        slide: Template slide to read (slide 1 of template.pptx)
 
     Returns:
         Table style dictionary
     """
-    slide = prs.slides[slide_index - 1]
-
     table_style = {
         'border': {
             'color': '#4F4F70',
@@ -89,93 +231,65 @@ def extract_table_style(prs: Presentation, slide_index: int = 1) -> Dict[str, An
     # Find table shape
     for shape in slide.shapes:
         if shape.has_table:
-            table = shape.table
+            # Read row 0 (header) and row 1 (body) straight from the a:tbl XML
+            tbl = shape.table._tbl
+            rows = _XP_TBL_ROWS(tbl)
 
             # Extract header styling from first row
-            if len(table.rows) > 0:
-                header_cell = table.cell(0, 0)
-                fill = header_cell.fill
-
-                if fill.type is not None:
-                    try:
-                        fc = fill.fore_color
-                        if fc.type == MSO_COLOR_TYPE.SCHEME:
-                            table_style['header']['fill_theme'] = theme_to_str(fc.theme_color)
-                            table_style['header']['fill_brightness'] = round(fc.brightness, 2)
-                        elif fc.type == MSO_COLOR_TYPE.RGB:
-                            table_style['header']['fill_rgb'] = rgb_to_hex(fc.rgb)
-                    except:
-                        pass
+            if rows:
+                header_style = table_style['header']
+                header_tc = _XP_ROW_CELLS(rows[0])[0]
+                _, fc = _solid_color(header_tc.find(_TCPR_TAG))
+                if fc is not None:
+                    if fc.tag == _SCHEMECLR_TAG:
+                        header_style['fill_theme'] = _scheme_name(fc)
+                        header_style['fill_brightness'] = round(_xml_brightness(fc), 2)
+                    elif fc.tag == _SRGBCLR_TAG:
+                        header_style['fill_rgb'] = '#' + fc.get('val').upper()
 
                 # Text styling
-                if header_cell.text_frame.paragraphs:
-                    para = header_cell.text_frame.paragraphs[0]
-                    if para.runs:
-                        run = para.runs[0]
-                        if run.font.size:
-                            table_style['header']['font_size_pt'] = int(run.font.size.pt)
-                        table_style['header']['font_bold'] = run.font.bold or False
-
-                        try:
-                            if run.font.color.type == MSO_COLOR_TYPE.SCHEME:
-                                table_style['header']['text_color_theme'] = theme_to_str(run.font.color.theme_color)
-                                if run.font.color.brightness is not None:
-                                    table_style['header']['text_color_brightness'] = round(run.font.color.brightness, 2)
-                        except:
-                            pass
+                _read_run_font(header_tc, header_style, read_bold=True)
 
             # Extract body styling from second row
-            if len(table.rows) > 1:
+            if len(rows) > 1:
+                body_style = table_style['body']
+                body_cells = _XP_ROW_CELLS(rows[1])
                 brightnesses = []
-                for col_idx in range(len(table.columns)):
-                    try:
-                        body_cell = table.cell(1, col_idx)
-                        fill = body_cell.fill
-                        if fill.type is not None:
-                            fc = fill.fore_color
-                            if fc.type == MSO_COLOR_TYPE.SCHEME:
-                                brightnesses.append(round(fc.brightness, 2))
-                                if col_idx == 0:
-                                    table_style['body']['fill_theme'] = theme_to_str(fc.theme_color)
-                    except:
+                for col_idx in range(len(_XP_TBL_GRID_COLS(tbl))):
+                    if col_idx >= len(body_cells):
+                        brightnesses.append(-0.05)
+                        continue
+                    fill, fc = _solid_color(body_cells[col_idx].find(_TCPR_TAG))
+                    if fill is None:
+                        continue
+                    if fill.tag != _SOLIDFILL_TAG:
+                        # Non-solid fill: no single colour to read
                         brightnesses.append(-0.05)
+                    elif fc is not None and fc.tag == _SCHEMECLR_TAG:
+                        brightnesses.append(round(_xml_brightness(fc), 2))
+                        if col_idx == 0:
+                            body_style['fill_theme'] = _scheme_name(fc)
 
                 if brightnesses:
-                    table_style['body']['column_brightness'] = brightnesses
+                    body_style['column_brightness'] = brightnesses
 
                 # Body text styling
-                body_cell = table.cell(1, 0)
-                if body_cell.text_frame.paragraphs:
-                    para = body_cell.text_frame.paragraphs[0]
-                    if para.runs:
-                        run = para.runs[0]
-                        if run.font.size:
-                            table_style['body']['font_size_pt'] = int(run.font.size.pt)
-                        try:
-                            if run.font.color.type == MSO_COLOR_TYPE.SCHEME:
-                                table_style['body']['text_color_theme'] = theme_to_str(run.font.color.theme_color)
-                                if run.font.color.brightness is not None:
-                                    table_style['body']['text_color_brightness'] = round(run.font.color.brightness, 2)
-                        except:
-                            pass
+                _read_run_font(body_cells[0], body_style, read_bold=False)
 
             break
 
     return table_style
 
 
-def extract_flowchart_style(prs: Presentation, slide_index: int = 2) -> Dict[str, Any]:
+def extract_flowchart_style(slide) -> Dict[str, Any]:
     """Extract flowchart/diagram styling from template.pptx.
 
     Args:
-        prs: Presentation object
-        slide_index: Slide number (1-based, default 2)
+        slide: Template slide to read (slide 2 of template.pptx)
 
     Returns:
         Flowchart style dictionary
     """
-    slide = prs.slides[slide_index - 1]
-
     flowchart_style = {
         'direction': 'LR',
         'node': {
@@ -214,18 +328,22 @@ def extract_flowchart_style(prs: Presentation, slide_index: int = 2) -> Dict[str
         },
     }
 
+    SCHEME = MSO_COLOR_TYPE.SCHEME
+    RGB = MSO_COLOR_TYPE.RGB
+
     # Find shapes to analyze - prioritize RGB-filled shapes (like "Good" box)
     primary_shape = None
     connector_found = False
 
-    for shape in slide.shapes:
-        shape_name = shape.name.lower()
-
+    shapes = slide.shapes
+    for elm in _XP_FLOWCHART_SHAPES(slide.element):
         # Extract connector styling (first one found)
-        if shape.shape_type == 9 and not connector_found:  # LINE (connector)
+        if elm.tag == _CXNSP_TAG:
+            if connector_found:
+                continue
             try:
-                line = shape.line
-                if line.color.type == MSO_COLOR_TYPE.SCHEME:
+                line = SlideShapeFactory(elm, shapes).line
+                if line.color.type is SCHEME:
                     flowchart_style['connector']['color_theme'] = theme_to_str(line.color.theme_color)
                     flowchart_style['connector']['color_brightness'] = round(line.color.brightness, 2)
 
@@ -233,31 +351,26 @@ def extract_flowchart_style(prs: Presentation, slide_index: int = 2) -> Dict[str
                     flowchart_style['connector']['width_pt'] = round(line.width.pt, 1)
 
                 if hasattr(line, 'dash_style') and line.dash_style:
-                    dash_map = {1: 'solid', 4: 'dash', 2: 'dot'}
-                    flowchart_style['connector']['dash_style'] = dash_map.get(int(line.dash_style), 'dash')
+                    flowchart_style['connector']['dash_style'] = _DASH_MAP.get(int(line.dash_style), 'dash')
                 connector_found = True
-            except:
+            except _PPTX_READ_ERRORS:
                 pass
             continue
 
-        # Skip non-auto shapes
-        if shape.shape_type != 1:
-            continue
-
         # Check if it's a node shape (rounded rectangle with fill)
+        shape_name = elm.shape_name.lower()
         if 'rounded' in shape_name or 'rectangle' in shape_name or '角丸' in shape_name:
             try:
-                fill = shape.fill
-                if fill.type == 1:  # SOLID
-                    fc = fill.fore_color
-                    # Prioritize RGB-filled shapes (primary color like "Good")
-                    if fc.type == MSO_COLOR_TYPE.RGB:
-                        primary_shape = shape
-                        break  # Found primary color shape
-                    elif primary_shape is None:
-                        # Keep as fallback if no RGB shape found yet
-                        primary_shape = shape
-            except:
+                shape = SlideShapeFactory(elm, shapes)
+                fc = shape.fill.fore_color
+                # Prioritize RGB-filled shapes (primary color like "Good")
+                if fc.type is RGB:
+                    primary_shape = shape
+                    break  # Found primary color shape
+                elif primary_shape is None:
+                    # Keep as fallback if no RGB shape found yet
+                    primary_shape = shape
+            except _PPTX_READ_ERRORS:
                 pass
 
     # Extract styling from the selected shape
@@ -266,10 +379,10 @@ def extract_flowchart_style(prs: Presentation, slide_index: int = 2) -> Dict[str
             fill = primary_shape.fill
             if fill.type == 1:
                 fc = fill.fore_color
-                if fc.type == MSO_COLOR_TYPE.RGB:
+                if fc.type is RGB:
                     flowchart_style['node']['fill'] = rgb_to_hex(fc.rgb)
                     flowchart_style['node']['fill_theme'] = None  # Explicitly set to None
-                elif fc.type == MSO_COLOR_TYPE.SCHEME:
+                elif fc.type is SCHEME:
                     flowchart_style['node']['fill_theme'] = theme_to_str(fc.theme_color)
                     if fc.brightness:
                         flowchart_style['node']['fill_brightness'] = round(fc.brightness, 2)
@@ -289,18 +402,30 @@ def extract_flowchart_style(prs: Presentation, slide_index: int = 2) -> Dict[str
                     flowchart_style['node']['text']['bold'] = run.font.bold or False
 
                     try:
-                        if run.font.color.type == MSO_COLOR_TYPE.RGB:
+                        if run.font.color.type is RGB:
                             flowchart_style['node']['text']['color'] = rgb_to_hex(run.font.color.rgb)
-                        elif run.font.color.type == MSO_COLOR_TYPE.SCHEME:
+                        elif run.font.color.type is SCHEME:
                             flowchart_style['node']['text']['color_theme'] = theme_to_str(run.font.color.theme_color)
-                    except:
+                    except _PPTX_READ_ERRORS:
                         pass
-        except:
+        except _PPTX_READ_ERRORS:
             pass
 
     return flowchart_style
 
 
+def _lum_brightness(section, keys) -> Optional[float]:
+    """Rounded brightness from a section's (lumMod, lumOff) keys, or None if neither is set."""
+    lummod_key, lumoff_key = keys
+    lummod = section.get(lummod_key)
+    lumoff = section.get(lumoff_key)
+    if lummod is None and lumoff is None:
+        return None
+    if lummod is None:
+        lummod = _DEFAULT_LUMMOD
+    return round(lummod_to_brightness(lummod, lumoff or 0), 2)
+
+
 def convert_to_style_yaml(crtx_styling: Dict[str, Any]) -> Dict[str, Any]:
     """Convert crtx_styling dict to style.yaml format.
 
@@ -322,8 +447,15 @@ def convert_to_style_yaml(crtx_styling: Dict[str, Any]) -> Dict[str, Any]:
         'gridlines': {'enabled': False},
     }
 
+    # Series brightness comes precomputed from extract_crtx_styling(); for a
+    # plain dict without it, convert the fill_lummod values here
+    series = crtx_styling.get('series', [])
+    series_brightness = crtx_styling.get('series_brightness')
+    if series_brightness is None:
+        series_brightness = lummods_to_brightness(ser.get('fill_lummod') for ser in series)
+
     # Convert series colors
-    for idx, ser in enumerate(crtx_styling.get('series', [])):
+    for idx, ser in enumerate(series):
         series_entry = {}
 
         if ser.get('fill_type') == 'rgb':
@@ -336,8 +468,8 @@ def convert_to_style_yaml(crtx_styling: Dict[str, Any]) -> Dict[str, Any]:
             series_entry['type'] = 'theme'
             series_entry['value'] = ser.get('fill_value', 'bg1')
 
-            if 'fill_lummod' in ser:
-                brightness = lummod_to_brightness(ser['fill_lummod'])
+            brightness = series_brightness[idx]
+            if brightness is not None:
                 series_entry['brightness'] = round(brightness, 2)
 
         style['colors']['series'].append(series_entry)
@@ -361,11 +493,9 @@ def convert_to_style_yaml(crtx_styling: Dict[str, Any]) -> Dict[str, Any]:
             style['category_axis']['line']['color_type'] = cat_axis['line_color_type']
             style['category_axis']['line']['color_value'] = cat_axis.get('line_color_value', 'tx1')
 
-            if 'line_lummod' in cat_axis or 'line_lumoff' in cat_axis:
-                lummod = cat_axis.get('line_lummod', 100000)
-                lumoff = cat_axis.get('line_lumoff', 0)
-                brightness = lummod_to_brightness(lummod, lumoff)
-                style['category_axis']['line']['brightness'] = round(brightness, 2)
+            brightness = _lum_brightness(cat_axis, _LINE_LUM_KEYS)
+            if brightness is not None:
+                style['category_axis']['line']['brightness'] = brightness
 
         # Font styling
         if 'font_size_pt' in cat_axis:
@@ -375,11 +505,9 @@ def convert_to_style_yaml(crtx_styling: Dict[str, Any]) -> Dict[str, Any]:
             style['category_axis']['font']['color_type'] = 'theme'
             style['category_axis']['font']['color_value'] = cat_axis['font_color_theme']
 
-            if 'font_lummod' in cat_axis or 'font_lumoff' in cat_axis:
-                lummod = cat_axis.get('font_lummod', 100000)
-                lumoff = cat_axis.get('font_lumoff', 0)
-                brightness = lummod_to_brightness(lummod, lumoff)
-                style['category_axis']['font']['brightness'] = round(brightness, 2)
+            brightness = _lum_brightness(cat_axis, _FONT_LUM_KEYS)
+            if brightness is not None:
+                style['category_axis']['font']['brightness'] = brightness
 
     # Convert value axis
     val_axis = crtx_styling.get('value_axis', {})
@@ -409,11 +537,9 @@ def convert_to_style_yaml(crtx_styling: Dict[str, Any]) -> Dict[str, Any]:
             style['legend']['font']['color_type'] = 'theme'
             style['legend']['font']['color_value'] = legend['font_color_theme']
 
-            if 'font_lummod' in legend or 'font_lumoff' in legend:
-                lummod = legend.get('font_lummod', 100000)
-                lumoff = legend.get('font_lumoff', 0)
-                brightness = lummod_to_brightness(lummod, lumoff)
-                style['legend']['font']['brightness'] = round(brightness, 2)
+            brightness = _lum_brightness(legend, _FONT_LUM_KEYS)
+            if brightness is not None:
+                style['legend']['font']['brightness'] = brightness
 
     # Convert data labels
     for dl in crtx_styling.get('data_labels', []):
@@ -428,17 +554,35 @@ def convert_to_style_yaml(crtx_styling: Dict[str, Any]) -> Dict[str, Any]:
             dl_entry['font_color_type'] = 'theme'
             dl_entry['font_color_value'] = dl['font_color_theme']
 
-            if 'font_lummod' in dl or 'font_lumoff' in dl:
-                lummod = dl.get('font_lummod', 100000)
-                lumoff = dl.get('font_lumoff', 0)
-                brightness = lummod_to_brightness(lummod, lumoff)
-                dl_entry['brightness'] = round(brightness, 2)
+            brightness = _lum_brightness(dl, _FONT_LUM_KEYS)
+            if brightness is not None:
+                dl_entry['brightness'] = brightness
 
         style['data_labels'].append(dl_entry)
 
     return style
 
 
+@functools.lru_cache(maxsize=1)
+def _code_stamp() -> Tuple[int, ...]:
+    """(st_mtime_ns, st_size) of each extraction module, flattened."""
+    stamp = []
+    for path in _EXTRACTION_CODE:
+        st = os.stat(path)
+        stamp += [st.st_mtime_ns, st.st_size]
+    return tuple(stamp)
+
+
+def _cached(kind: str, path: str, builder, *extra):
+    """Return builder() for path, reusing the cached result while path and code are unchanged."""
+    key = file_cache_key(path, _STYLE_CACHE_VERSION, list(_code_stamp()), *extra)
+    value = read_json_cache(kind, path, key)
+    if value is None:
+        value = builder()
+        write_json_cache(kind, path, key, value)
+    return value
+
+
 def extract_and_save_style(crtx_path: str, template_path: str, output_path: str) -> Dict[str, Any]:
     """Extract styling from .crtx and template.pptx, save as YAML.
 
@@ -451,23 +595,34 @@ def extract_and_save_style(crtx_path: str, template_path: str, output_path: str)
         The generated style dictionary
     """
     # Extract chart styling from crtx
-    crtx_styling = extract_crtx_styling(crtx_path)
-    style = convert_to_style_yaml(crtx_styling)
+    style = _cached('crtx_style', crtx_path,
+                    lambda: convert_to_style_yaml(extract_crtx_styling(crtx_path)))
 
     # Extract table and flowchart styling from template.pptx
     if os.path.exists(template_path):
-        prs = Presentation(template_path)
+        slides = None
+
+        def load_slides():
+            # Open the template (once) only when a section is not cached
+            nonlocal slides
+            if slides is None:
+                slides = list(Presentation(template_path).slides)
+            return slides
 
         # Table style from Slide 1
         try:
-            table_style = extract_table_style(prs, slide_index=1)  # Slide 1 has table
+            table_style = _cached('table_style', template_path,
+                                  lambda: extract_table_style(load_slides()[0]),
+                                  1)  # Slide 1 has table
             style['table'] = table_style
         except Exception as e:
             print(f"Warning: Could not extract table style: {e}")
 
         # Flowchart style from Slide 2
         try:
-            flowchart_style = extract_flowchart_style(prs, slide_index=2)  # Slide 2 has shapes
+            flowchart_style = _cached('flowchart_style', template_path,
+                                      lambda: extract_flowchart_style(load_slides()[1]),
+                                      2)  # Slide 2 has shapes
             style['flowchart'] = flowchart_style
         except Exception as e:
             print(f"Warning: Could not extract flowchart style: {e}")
@@ -504,7 +659,7 @@ def extract_and_save_style(crtx_path: str, template_path: str, output_path: str)
 
     # Write YAML with header comment
     header = """# Generated from Chart.crtx and template.pptx
-# DO NOT EDIT MANUALLY - regenerate with: python scripts/extract_style.py
+# DO NOT EDIT MANUALLY - regenerate with: python -m scripts.extract_style
 #
 # This file is the Single Source of Truth for styling.
 # Sources:
@@ -516,13 +671,61 @@ def extract_and_save_style(crtx_path: str, template_path: str, output_path: str)
 
 """
 
-    with open(output_path, 'w') as f:
-        f.write(header)
-        yaml.dump(style, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Encode once and write bytes (UTF-8 regardless of the locale)
+    data = header.encode('utf-8') + yaml.dump(
+        style, Dumper=_YamlDumper, encoding='utf-8',
+        default_flow_style=False, allow_unicode=True, sort_keys=False)
+    with open(output_path, 'wb') as f:
+        f.write(data)
 
     return style
 
 
+def _batch_pairs(batch_dir: str) -> List[Tuple[str, str, str]]:
+    """Find (crtx, pptx, output) triples in a directory, paired by file stem.
+
+    NAME.pptx is paired with NAME.crtx and written to NAME.style.yaml;
+    templates without a matching .crtx are reported and skipped.
+    """
+    pairs = []
+    for template_path in sorted(glob.glob(os.path.join(batch_dir, '*.pptx'))):
+        stem = os.path.splitext(template_path)[0]
+        crtx_path = stem + '.crtx'
+        if not os.path.exists(crtx_path):
+            print(f"Warning: Skipping {template_path} (no {os.path.basename(crtx_path)})")
+            continue
+        pairs.append((crtx_path, template_path, stem + '.style.yaml'))
+    return pairs
+
+
+def _extract_one(pair: Tuple[str, str, str]) -> str:
+    """Run extract_and_save_style() for one batch triple (picklable for workers)."""
+    crtx_path, template_path, output_path = pair
+    extract_and_save_style(crtx_path, template_path, output_path)
+    return output_path
+
+
+def run_batch(batch_dir: str, max_workers: Optional[int] = None) -> List[str]:
+    """Extract style.yaml for every template pair in batch_dir in parallel.
+
+    python-pptx parsing is CPU-bound and holds the GIL, so templates are
+    processed in separate worker processes.
+
+    Args:
+        batch_dir: Directory containing NAME.pptx / NAME.crtx pairs
+        max_workers: Worker process count (default: os.cpu_count())
+
+    Returns:
+        Paths of the generated YAML files
+    """
+    pairs = _batch_pairs(batch_dir)
+    if not pairs:
+        return []
+    max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(_extract_one, pairs))
+
+
 def main():
     """Main entry point for CLI usage."""
     # Default paths
@@ -537,16 +740,29 @@ def main():
     crtx_path = default_crtx
     template_path = default_template
     output_path = default_output
+    batch_dir = None
 
     # Simple argument parsing
     for i, arg in enumerate(sys.argv[1:], 1):
-        if arg == '--template' and i < len(sys.argv):
+        if arg == '--batch' and i < len(sys.argv):
+            batch_dir = sys.argv[i + 1]
+        elif arg == '--template' and i < len(sys.argv):
             template_path = sys.argv[i + 1]
         elif arg == '--crtx' and i < len(sys.argv):
             crtx_path = sys.argv[i + 1]
         elif arg == '--output' and i < len(sys.argv):
             output_path = sys.argv[i + 1]
 
+    if batch_dir is not None:
+        if not os.path.isdir(batch_dir):
+            print(f"Error: batch directory not found at {batch_dir}")
+            sys.exit(1)
+        outputs = run_batch(batch_dir)
+        print(f"Generated {len(outputs)} style file(s) in {batch_dir}")
+        for path in outputs:
+            print(f"    - {path}")
+        return
+
     # Check files exist
     if not os.path.exists(crtx_path):
         print(f"Error: Chart.crtx not found at {crtx_path}")
@@ -6,15 +6,62 @@ template.pptxから動的に情報を抽出し、Markdown形式でドキュメ
 スライド数やレイアウトが変更されても自動的に対応する。
 """
 
-import sys
+import io
 import os
-from datetime import datetime
+import time
 
-# pptxスキルのスクリプトをインポート
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from layout_registry import LayoutRegistry
+from scripts.layout_registry import LayoutRegistry
 
-from pptx import Presentation
+from lxml import etree
+
+
+_NSMAP = {
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+
+# スライド直下の図形（p:sp, p:pic 等）が持つプレースホルダー要素 p:ph。
+# python-pptxのshape/placeholder_formatプロキシを経由せずに一括取得する。
+_XP_SLIDE_PHS = etree.XPath(
+    './p:cSld/p:spTree/*[self::p:sp or self::p:grpSp or self::p:graphicFrame'
+    ' or self::p:cxnSp or self::p:pic or self::p:contentPart]/*[1]/p:nvPr/p:ph',
+    namespaces=_NSMAP,
+)
+_SP_TAG = '{%s}sp' % _NSMAP['p']
+
+
+def _shape_text(shape_elm) -> str:
+    """図形要素のテキスト（段落は改行区切り）。テキストを持たない図形は空文字"""
+    if shape_elm.tag != _SP_TAG or shape_elm.txBody is None:
+        return ""
+    return "\n".join(p.text for p in shape_elm.txBody.p_lst)
+
+
+# TEMPLATE.md末尾の固定セクション（一度に書き出す）
+_USAGE_NOTES = """---
+
+## Usage Notes
+
+### outline.mdでレイアウトを指定する方法
+
+```markdown
+## スライド1: タイトルスライド
+**レイアウト**: Title Slide (layout 0)
+
+## スライド2: コンテンツ
+**レイアウト**: Title and Content_withKeyMessage (layout 10)
+**コンテンツタイプ**: TABLE
+```
+
+### AIによる自動選択
+
+generate_presentation.pyは、コンテンツタイプに応じて
+適切なレイアウトを自動選択できます:
+
+- 1カラムテキスト → Layout 10
+- 1カラムグラフ/表 → Layout 11
+- 2カラム比較 → Layout 12/13
+- 3カラム → Layout 16/17
+"""
 
 
 def generate_template_md(template_path: str, output_path: str = None):
@@ -28,147 +75,124 @@ def generate_template_md(template_path: str, output_path: str = None):
     registry = LayoutRegistry(template_path)
     prs = registry.prs
 
-    lines = []
+    # レイアウトをインデックス順に一度だけ並べ、使用/未使用もここから求める
+    layouts_by_idx = [(idx, registry.get_layout_info(idx))
+                      for idx in range(registry.get_layout_count())]
+    unused = [idx for idx, info in layouts_by_idx if not info.is_used]
+
+    buf = io.StringIO()
+    w = buf.write
 
     # ヘッダー
-    lines.append("# Template Inventory (Auto-generated)")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Template:** {os.path.basename(template_path)}")
-    lines.append(f"**Total Slides:** {registry.get_slide_count()}")
-    lines.append(f"**Total Layouts:** {registry.get_layout_count()}")
-    lines.append(f"**Used Layouts:** {len(registry.get_used_layouts())}")
-    lines.append(f"**Unused Layouts:** {len(registry.get_unused_layouts())}")
-    lines.append("")
-    lines.append("> NOTE: スライド番号は0-indexed（Slide 0が最初のスライド）")
-    lines.append("> レイアウト番号はoutline.mdで指定する際に使用")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    w("# Template Inventory (Auto-generated)\n")
+    w("\n")
+    w(f"**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w(f"**Template:** {os.path.basename(template_path)}\n")
+    w(f"**Total Slides:** {registry.get_slide_count()}\n")
+    w(f"**Total Layouts:** {registry.get_layout_count()}\n")
+    w(f"**Used Layouts:** {len(layouts_by_idx) - len(unused)}\n")
+    w(f"**Unused Layouts:** {len(unused)}\n")
+    w("\n")
+    w("> NOTE: スライド番号は0-indexed（Slide 0が最初のスライド）\n")
+    w("> レイアウト番号はoutline.mdで指定する際に使用\n")
+    w("\n")
+    w("---\n")
+    w("\n")
 
     # レイアウト一覧
-    lines.append("## Layouts Overview")
-    lines.append("")
-    lines.append("| Index | Layout Name | Used | Examples |")
-    lines.append("|-------|-------------|------|----------|")
-
-    for idx in sorted(registry._layouts.keys()):
-        info = registry._layouts[idx]
-        used = "✓" if info.example_slides else "✗"
+    w("## Layouts Overview\n")
+    w("\n")
+    w("| Index | Layout Name | Used | Examples |\n")
+    w("|-------|-------------|------|----------|\n")
+
+    for idx, info in layouts_by_idx:
+        used = "✓" if info.is_used else "✗"
         examples = ", ".join([f"Slide {s}" for s in info.example_slides[:3]])
         if len(info.example_slides) > 3:
             examples += f" ... (+{len(info.example_slides)-3})"
         if not examples:
             examples = "なし"
 
-        lines.append(f"| {idx} | {info.name} | {used} | {examples} |")
+        w(f"| {idx} | {info.name} | {used} | {examples} |\n")
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    w("\n")
+    w("---\n")
+    w("\n")
 
     # スライド詳細
-    lines.append("## Slides Detail")
-    lines.append("")
+    w("## Slides Detail\n")
+    w("\n")
+
+    # レイアウトXML要素 → (インデックス, 名前) の対応表を一度だけ構築
+    # （python-pptxのプロキシは毎回生成されるため、比較は要素で行う）
+    layout_index = {
+        layout.element: (idx, layout.name)
+        for idx, layout in enumerate(prs.slide_layouts)
+    }
 
     for slide_idx, slide in enumerate(prs.slides):
         # このスライドのレイアウトを特定
-        layout_idx = None
-        layout_name = ""
-        for idx, layout in enumerate(prs.slide_layouts):
-            if slide.slide_layout == layout:
-                layout_idx = idx
-                layout_name = layout.name
-                break
-
-        lines.append(f"### Slide {slide_idx}: {layout_name} [Layout {layout_idx}]")
-        lines.append("")
-
-        # タイトルを抽出（あれば）
-        if slide.shapes.title:
-            try:
-                title_text = slide.shapes.title.text
-                if title_text:
-                    lines.append(f"**Title:** {title_text}")
-                    lines.append("")
-            except:
-                pass
+        layout_idx, layout_name = layout_index.get(slide.slide_layout.element, (None, ""))
+
+        w(f"### Slide {slide_idx}: {layout_name} [Layout {layout_idx}]\n")
+        w("\n")
+
+        # プレースホルダー要素（p:ph）をXPath一回で取得
+        phs = _XP_SLIDE_PHS(slide.element)
+
+        # タイトルを抽出（あれば）: idx=0 の最初のプレースホルダー
+        title_ph = next((ph for ph in phs if ph.idx == 0), None)
+        if title_ph is not None:
+            title_text = _shape_text(title_ph.getparent().getparent().getparent())
+            if title_text:
+                w(f"**Title:** {title_text}\n")
+                w("\n")
 
         # プレースホルダー情報
-        placeholders = []
-        for shape in slide.shapes:
-            if shape.is_placeholder:
-                ph_idx = shape.placeholder_format.idx
-                ph_type = str(shape.placeholder_format.type)
-                placeholders.append(f"idx={ph_idx} ({ph_type})")
+        placeholders = [f"idx={ph.idx} ({ph.type})" for ph in phs]
 
         if placeholders:
-            lines.append(f"**Placeholders:** {', '.join(placeholders)}")
-            lines.append("")
+            w(f"**Placeholders:** {', '.join(placeholders)}\n")
+            w("\n")
 
         # レイアウト情報
-        lines.append(f"**Layout:** `Layout {layout_idx}: {layout_name}`")
-        lines.append("")
+        w(f"**Layout:** `Layout {layout_idx}: {layout_name}`\n")
+        w("\n")
 
         # outline.mdでの使用例
-        lines.append(f"**outline.mdでの指定例:**")
-        lines.append("```markdown")
-        lines.append(f"## スライドX: タイトル")
-        lines.append(f"**レイアウト**: {layout_name} (layout {layout_idx})")
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        w(f"**outline.mdでの指定例:**\n")
+        w("```markdown\n")
+        w(f"## スライドX: タイトル\n")
+        w(f"**レイアウト**: {layout_name} (layout {layout_idx})\n")
+        w("```\n")
+        w("\n")
+        w("---\n")
+        w("\n")
 
     # 未使用レイアウト
-    unused = registry.get_unused_layouts()
     if unused:
-        lines.append("## Unused Layouts")
-        lines.append("")
-        lines.append("以下のレイアウトは実例スライドがありません:")
-        lines.append("")
+        w("## Unused Layouts\n")
+        w("\n")
+        w("以下のレイアウトは実例スライドがありません:\n")
+        w("\n")
 
         for idx in unused:
-            info = registry._layouts[idx]
-            lines.append(f"- **Layout {idx}: {info.name}**")
+            info = layouts_by_idx[idx][1]
+            w(f"- **Layout {idx}: {info.name}**\n")
 
-        lines.append("")
-        lines.append("> これらのレイアウトも使用可能ですが、実例を参照できません。")
-        lines.append("")
+        w("\n")
+        w("> これらのレイアウトも使用可能ですが、実例を参照できません。\n")
+        w("\n")
 
     # フッター
-    lines.append("---")
-    lines.append("")
-    lines.append("## Usage Notes")
-    lines.append("")
-    lines.append("### outline.mdでレイアウトを指定する方法")
-    lines.append("")
-    lines.append("```markdown")
-    lines.append("## スライド1: タイトルスライド")
-    lines.append("**レイアウト**: Title Slide (layout 0)")
-    lines.append("")
-    lines.append("## スライド2: コンテンツ")
-    lines.append("**レイアウト**: Title and Content_withKeyMessage (layout 10)")
-    lines.append("**コンテンツタイプ**: TABLE")
-    lines.append("```")
-    lines.append("")
-    lines.append("### AIによる自動選択")
-    lines.append("")
-    lines.append("generate_presentation.pyは、コンテンツタイプに応じて")
-    lines.append("適切なレイアウトを自動選択できます:")
-    lines.append("")
-    lines.append("- 1カラムテキスト → Layout 10")
-    lines.append("- 1カラムグラフ/表 → Layout 11")
-    lines.append("- 2カラム比較 → Layout 12/13")
-    lines.append("- 3カラム → Layout 16/17")
-    lines.append("")
+    w(_USAGE_NOTES)
 
     # 出力
-    content = "\n".join(lines)
+    content = buf.getvalue()
 
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with open(output_path, 'wb') as f:
+            f.write(content.encode('utf-8'))
         print(f"✅ Generated: {output_path}")
         print(f"   Slides: {registry.get_slide_count()}")
         print(f"   Layouts: {registry.get_layout_count()}")
@@ -5,19 +5,70 @@ Layout Registry - 動的にtemplate.pptxからレイアウト情報を取得・
 ハードコードを避け、template.pptxの変更に自動対応する。
 """
 
+import functools
+import sys
+from array import array
+
 from pptx import Presentation
+from pptx.enum.shapes import PP_PLACEHOLDER
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import defaultdict
 
 
-@dataclass
+# suggest_layout() の判定表: (KeyMessageあり, カラム数, 図表系か) → レイアウト名
+_OBJECT_CONTENT_TYPES = frozenset({'table', 'chart', 'diagram', 'image'})
+_SUGGESTED_LAYOUTS = {
+    # KeyMessageありの場合
+    (True, 1, True): '1_Title and Object_withKeyMessage',
+    (True, 1, False): 'Title and Content_withKeyMessage',
+    (True, 2, True): '1_Two Object_withKeyMessage',
+    (True, 2, False): 'Two Content_withKeyMessage',
+    (True, 3, True): '2_Three Object_withKeyMessage',
+    (True, 3, False): '1_Three Content_withKeyMessage',
+    # KeyMessageなしの場合（コンテンツタイプは問わない）
+    (False, 1, True): 'Title and Content',
+    (False, 1, False): 'Title and Content',
+    (False, 2, True): 'Two Content',
+    (False, 2, False): 'Two Content',
+    (False, 3, True): 'Comparison',
+    (False, 3, False): 'Comparison',
+}
+_DEFAULT_SUGGESTED_LAYOUT = 'Title and Content'
+
+# find_layout の部分文字列索引に登録する長さの範囲
+_SUBSTRING_MIN = 4
+_SUBSTRING_MAX = 8
+
+
+def type_name(placeholder_type: int) -> str:
+    """プレースホルダー種別の整数値を表示用の名前に戻す（例: 1 -> 'TITLE (1)'）"""
+    if placeholder_type < 0:
+        return 'None'
+    return str(PP_PLACEHOLDER(placeholder_type))
+
+
+@dataclass(slots=True)
 class LayoutInfo:
     """レイアウト情報"""
     index: int
     name: str
-    placeholders: List[Tuple[int, str]]  # [(idx, type), ...]
-    example_slides: List[int]  # このレイアウトを使用しているスライド番号
+    # プレースホルダーは idx と type を並列配列で保持（i番目同士が対応）
+    # type は PP_PLACEHOLDER の整数値（不明なら -1）。表示用には type_name() を使う
+    placeholder_idxs: array = field(default_factory=lambda: array('i'))
+    placeholder_types: array = field(default_factory=lambda: array('i'))
+    # このレイアウトを使用しているスライド番号（符号なし整数の詰め込み配列）
+    example_slides: array = field(default_factory=lambda: array('I'))
+
+    @property
+    def placeholders(self) -> List[Tuple[int, int]]:
+        """[(idx, type), ...] 形式のプレースホルダー一覧（type は整数値）"""
+        return list(zip(self.placeholder_idxs, self.placeholder_types))
+
+    @property
+    def is_used(self) -> bool:
+        """実例スライドがあるか"""
+        return len(self.example_slides) > 0
 
     def __repr__(self):
         return f"Layout({self.index}, {self.name}, {len(self.example_slides)} examples)"
@@ -31,13 +82,31 @@ class LayoutRegistry:
         registry = LayoutRegistry('templates/template.pptx')
         layout_idx = registry.find_layout('Title Slide')
         layout_info = registry.get_layout_info(10)
+
+    テンプレートの解析（Presentationの読み込み）は重いため、同じファイルを
+    編集にも使う場合は再度 Presentation(path) を開かず registry.prs
+    （または open() が返す prs）を下流の処理に渡すこと。
+
+    構築後は属性の再代入を禁止する（遅延解析する使用状況の属性のみ例外）。
     """
 
+    __slots__ = (
+        'template_path', 'prs', '_owns_presentation',
+        '_layouts', '_name_to_index', '_lower_names', '_substring_index',
+        '_layout_by_element', '_usage_analyzed', '_used_mask',
+        '_find_layout_cached', '_find_layouts_by_pattern_cached',
+        '_frozen',
+    )
+
+    # 凍結後も更新を許す属性（_ensure_usage() が初回に設定する）
+    _MUTABLE_AFTER_INIT = frozenset({'_usage_analyzed', '_used_mask'})
+
     def __init__(self, template_source):
         """
         Args:
             template_source: Either a file path (str) or a Presentation instance
         """
+        self._frozen = False
         if isinstance(template_source, str):
             self.template_path = template_source
             self.prs = Presentation(template_source)
@@ -50,33 +119,94 @@ class LayoutRegistry:
         
         self._layouts: Dict[int, LayoutInfo] = {}
         self._name_to_index: Dict[str, int] = {}
-        self._analyze()
+        self._lower_names: List[Tuple[str, int]] = []  # find_layouts_by_pattern用
+        self._substring_index: Dict[str, int] = {}  # find_layout の部分一致用
+        # レイアウトXML要素 → インデックス（スライドのレイアウト特定用）
+        # python-pptxのプロキシは毎回生成されるため、id()ではなく要素をキーにする
+        self._layout_by_element = {}
+        # スライドの使用状況（example_slides）は必要になるまで解析しない
+        self._usage_analyzed = False
+        # 使用中レイアウトのビット集合（bit i が立っていればレイアウト i は使用中）
+        self._used_mask = 0
+        self._analyze_layouts()
+
+        # 名前検索はレイアウト集合（構築後は不変）だけで決まるため、インスタンス
+        # ごとにLRUキャッシュする。レイアウトは変わらないので無効化は不要
+        self._find_layout_cached = functools.lru_cache(maxsize=128)(self._find_layout)
+        self._find_layouts_by_pattern_cached = functools.lru_cache(maxsize=128)(
+            self._find_layouts_by_pattern)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False) and name not in self._MUTABLE_AFTER_INIT:
+            raise AttributeError(f"LayoutRegistry は構築後に変更できません: '{name}'")
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def open(cls, path: str) -> Tuple['LayoutRegistry', Presentation]:
+        """
+        テンプレートを一度だけ読み込み、レジストリとPresentationを返す
+
+        例:
+            registry, prs = LayoutRegistry.open('templates/template.pptx')
+            slide = prs.slides.add_slide(registry.get_layout_by_name('Title Slide'))
+        """
+        registry = cls(path)
+        return registry, registry.prs
+
+    def _analyze_layouts(self):
+        """template.pptxのレイアウト情報を構築（スライドは走査しない）"""
+        layouts = self._layouts
+        name_to_index = self._name_to_index
+        layout_by_element = self._layout_by_element
 
-    def _analyze(self):
-        """template.pptxを解析してレイアウト情報を構築"""
         # レイアウト情報を収集
+        # レイアウト名は同じ文字列が繰り返し現れるため
+        # sys.intern で1つのオブジェクトに集約する（辞書検索も同一性比較で速くなる）
         for idx, layout in enumerate(self.prs.slide_layouts):
-            placeholders = []
+            placeholder_idxs = array('i')
+            placeholder_types = array('i')
             for ph in layout.placeholders:
-                placeholders.append((
-                    ph.placeholder_format.idx,
-                    str(ph.placeholder_format.type)
-                ))
+                pf = ph.placeholder_format
+                placeholder_idxs.append(pf.idx)
+                placeholder_types.append(-1 if pf.type is None else int(pf.type))
 
-            self._layouts[idx] = LayoutInfo(
+            name = sys.intern(layout.name)
+            layouts[idx] = LayoutInfo(
                 index=idx,
-                name=layout.name,
-                placeholders=placeholders,
-                example_slides=[]
+                name=name,
+                placeholder_idxs=placeholder_idxs,
+                placeholder_types=placeholder_types,
             )
-            self._name_to_index[layout.name] = idx
-
-        # 各スライドがどのレイアウトを使っているか記録
+            name_to_index[name] = idx
+            layout_by_element[layout.element] = idx
+
+        # 大文字小文字を無視した検索用に、小文字化した名前を一度だけ作る
+        self._lower_names = [(name.lower(), idx) for name, idx in name_to_index.items()]
+
+        # 部分一致検索用: 長さ _SUBSTRING_MIN〜_SUBSTRING_MAX の部分文字列 → 最初にマッチするレイアウト
+        # （setdefault で線形走査と同じ「最初の一致」を保持する）
+        substring_index = self._substring_index
+        for name, idx in name_to_index.items():
+            for k in range(_SUBSTRING_MIN, min(_SUBSTRING_MAX, len(name)) + 1):
+                for start in range(len(name) - k + 1):
+                    substring_index.setdefault(name[start:start + k], idx)
+
+    def _ensure_usage(self):
+        """各スライドがどのレイアウトを使っているか記録（初回のみ）"""
+        if self._usage_analyzed:
+            return
+        self._usage_analyzed = True
+
+        layouts = self._layouts
+        layout_by_element = self._layout_by_element
+        used_mask = 0
         for slide_idx, slide in enumerate(self.prs.slides):
-            for layout_idx, layout in enumerate(self.prs.slide_layouts):
-                if slide.slide_layout == layout:
-                    self._layouts[layout_idx].example_slides.append(slide_idx)
-                    break
+            layout_idx = layout_by_element.get(slide.slide_layout.element)
+            if layout_idx is not None:
+                layouts[layout_idx].example_slides.append(slide_idx)
+                used_mask |= 1 << layout_idx
+        self._used_mask = used_mask
 
     def get_layout_count(self) -> int:
         """レイアウト総数を取得"""
@@ -88,6 +218,7 @@ class LayoutRegistry:
 
     def get_layout_info(self, index: int) -> Optional[LayoutInfo]:
         """インデックスからレイアウト情報を取得"""
+        self._ensure_usage()
         return self._layouts.get(index)
 
     def get_layout_by_name(self, name: str):
@@ -118,11 +249,18 @@ class LayoutRegistry:
             find_layout('Title Slide') -> 0
             find_layout('KeyMessage') -> 10 (最初にマッチしたもの)
         """
+        return self._find_layout_cached(name)
+
+    def _find_layout(self, name: str) -> Optional[int]:
+        """find_layout() の本体（キャッシュなし）"""
         # 完全一致を優先
         if name in self._name_to_index:
             return self._name_to_index[name]
 
-        # 部分一致
+        # 部分一致（索引でカバーされる長さなら辞書引きのみ）
+        if _SUBSTRING_MIN <= len(name) <= _SUBSTRING_MAX:
+            return self._substring_index.get(name)
+
         for layout_name, idx in self._name_to_index.items():
             if name in layout_name:
                 return idx
@@ -131,19 +269,25 @@ class LayoutRegistry:
 
     def find_layouts_by_pattern(self, pattern: str) -> List[int]:
         """パターンに一致するすべてのレイアウトを検索"""
-        results = []
-        for layout_name, idx in self._name_to_index.items():
-            if pattern.lower() in layout_name.lower():
-                results.append(idx)
-        return results
+        # キャッシュ値は共有されるためタプルで保持し、呼び出し側にはリストを返す
+        return list(self._find_layouts_by_pattern_cached(pattern))
+
+    def _find_layouts_by_pattern(self, pattern: str) -> Tuple[int, ...]:
+        """find_layouts_by_pattern() の本体（キャッシュなし）"""
+        pattern = pattern.lower()
+        return tuple(idx for lower_name, idx in self._lower_names if pattern in lower_name)
 
     def get_used_layouts(self) -> List[int]:
         """実際に使用されているレイアウトのリスト"""
-        return [idx for idx, info in self._layouts.items() if info.example_slides]
+        self._ensure_usage()
+        used_mask = self._used_mask
+        return [idx for idx in self._layouts if (used_mask >> idx) & 1]
 
     def get_unused_layouts(self) -> List[int]:
         """未使用のレイアウトのリスト"""
-        return [idx for idx, info in self._layouts.items() if not info.example_slides]
+        self._ensure_usage()
+        used_mask = self._used_mask
+        return [idx for idx in self._layouts if not (used_mask >> idx) & 1]
 
     def suggest_layout(self, content_type: str, columns: int = 1,
                       has_keymessage: bool = True) -> Optional[str]:
@@ -158,58 +302,37 @@ class LayoutRegistry:
         Returns:
             推奨レイアウトの名前（例: "Title Slide", "Title and Content_withKeyMessage"）
         """
-        # KeyMessageありの場合
-        if has_keymessage:
-            if columns == 1:
-                if content_type in ['table', 'chart', 'diagram', 'image']:
-                    return '1_Title and Object_withKeyMessage'
-                else:
-                    return 'Title and Content_withKeyMessage'
-
-            elif columns == 2:
-                if content_type in ['table', 'chart', 'diagram', 'image']:
-                    return '1_Two Object_withKeyMessage'
-                else:
-                    return 'Two Content_withKeyMessage'
-
-            elif columns == 3:
-                if content_type in ['table', 'chart', 'diagram', 'image']:
-                    return '2_Three Object_withKeyMessage'
-                else:
-                    return '1_Three Content_withKeyMessage'
-
-        # KeyMessageなしの場合
-        else:
-            if columns == 1:
-                return 'Title and Content'
-            elif columns == 2:
-                return 'Two Content'
-            elif columns == 3:
-                return 'Comparison'
-
-        # デフォルト
-        return 'Title and Content'
+        is_object = content_type in _OBJECT_CONTENT_TYPES
+        return _SUGGESTED_LAYOUTS.get(
+            (bool(has_keymessage), columns, is_object), _DEFAULT_SUGGESTED_LAYOUT)
 
     def print_summary(self):
         """レイアウト情報のサマリーを出力"""
+        self._ensure_usage()
+        # _layouts はインデックス順に登録済みのため、ソートせずに1回の走査で使用/未使用を分ける
+        lines = []
+        unused = []
+        for idx, info in self._layouts.items():
+            if info.example_slides:
+                lines.append(f"[{idx:2d}] ✓ {info.name} ({len(info.example_slides)} examples)")
+            else:
+                lines.append(f"[{idx:2d}] ✗ {info.name} ")
+                unused.append((idx, info))
+
         print(f"=== Layout Registry Summary ===")
         print(f"Template: {self.template_path}")
         print(f"Layouts: {self.get_layout_count()}")
         print(f"Slides: {self.get_slide_count()}")
-        print(f"Used layouts: {len(self.get_used_layouts())}")
-        print(f"Unused layouts: {len(self.get_unused_layouts())}")
+        print(f"Used layouts: {len(self._layouts) - len(unused)}")
+        print(f"Unused layouts: {len(unused)}")
 
         print(f"\n=== All Layouts ===")
-        for idx in sorted(self._layouts.keys()):
-            info = self._layouts[idx]
-            status = "✓" if info.example_slides else "✗"
-            examples = f"({len(info.example_slides)} examples)" if info.example_slides else ""
-            print(f"[{idx:2d}] {status} {info.name} {examples}")
+        for line in lines:
+            print(line)
 
-        if self.get_unused_layouts():
+        if unused:
             print(f"\n=== Unused Layouts ===")
-            for idx in self.get_unused_layouts():
-                info = self._layouts[idx]
+            for idx, info in unused:
                 print(f"[{idx:2d}] {info.name}")
 
 
@@ -6,8 +6,12 @@ Logs are written to:
 - {working_dir}/processing/pptx_generation.log (legacy)
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +21,30 @@ class PPTXLogger:
 
     _instance: Optional[logging.Logger] = None
     _log_file_path: Optional[Path] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _working_dir: Optional[Path] = None  # explicit working_dir of the current setup
+    _lock = threading.Lock()
+
+    # pptx_generation.log rotation / buffering
+    _LOG_MAX_BYTES = 10 * 1024 * 1024
+    _LOG_BACKUP_COUNT = 3
+    _LOG_BUFFER_CAPACITY = 512  # records buffered before a write
+
+    @classmethod
+    def _shutdown(cls) -> None:
+        """Stop the queue listener, flush buffered records and close the log file."""
+        listener = cls._listener
+        if listener is None:
+            return
+        cls._listener = None
+        listener.stop()
+        # MemoryHandler.close() flushes into its target but leaves it open,
+        # so close the file handler behind it explicitly
+        for handler in listener.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
 
     @classmethod
     def _detect_working_dir(cls) -> Path:
@@ -31,12 +59,24 @@ class PPTXLogger:
         """
         cwd = Path.cwd()
 
+        # One directory listing answers every probe below; nested paths are
+        # only stat'ed when their parent entry is actually present
+        try:
+            with os.scandir(cwd) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+
+        def has_dir(name: str) -> bool:
+            entry = entries.get(name)
+            return entry is not None and entry.is_dir()
+
         # Check if current dir has powerpoint/processing (new structure)
-        if (cwd / 'powerpoint' / 'processing').exists():
+        if has_dir('powerpoint') and (cwd / 'powerpoint' / 'processing').exists():
             return cwd
 
         # Check if current dir is presentation or has processing (legacy)
-        if cwd.name == 'presentation' or (cwd / 'processing').exists():
+        if cwd.name == 'presentation' or 'processing' in entries:
             return cwd
 
         # Check if parent is presentation
@@ -44,7 +84,7 @@ class PPTXLogger:
             return cwd.parent
 
         # Check for ./presentation/
-        if (cwd / 'presentation').exists() and (cwd / 'presentation').is_dir():
+        if has_dir('presentation'):
             return cwd / 'presentation'
 
         # Fallback to cwd
@@ -57,13 +97,29 @@ class PPTXLogger:
         Args:
             working_dir: Working directory (e.g., project root or presentation/).
                         If None, auto-detects or uses current working directory.
+                        Passing a different directory than the current setup
+                        reconfigures the logger to write there.
         """
-        if cls._instance is not None:
-            return cls._instance
+        requested = Path(working_dir).resolve() if working_dir else None
 
+        # Fast path without the lock once set up
+        logger = cls._instance
+        if logger is not None and (requested is None or requested == cls._working_dir):
+            return logger
+
+        with cls._lock:
+            # Another thread may have finished setup while we waited
+            logger = cls._instance
+            if logger is not None and (requested is None or requested == cls._working_dir):
+                return logger
+            return cls._setup_locked(requested)
+
+    @classmethod
+    def _setup_locked(cls, requested: Optional[Path]) -> logging.Logger:
+        """Build the logger (caller holds cls._lock)."""
         # Determine log file location
-        if working_dir:
-            base_dir = Path(working_dir)
+        if requested is not None:
+            base_dir = requested
         else:
             base_dir = cls._detect_working_dir()
 
@@ -78,18 +134,27 @@ class PPTXLogger:
 
         processing_dir.mkdir(parents=True, exist_ok=True)
 
-        cls._log_file_path = processing_dir / "pptx_generation.log"
+        log_file_path = processing_dir / "pptx_generation.log"
 
         # Create logger
         logger = logging.getLogger('pptx_generation')
         logger.setLevel(logging.DEBUG)
 
-        # Remove existing handlers
+        # Remove existing handlers (and flush/close the previous setup's file)
         logger.handlers = []
+        cls._shutdown()
 
-        # File handler
-        file_handler = logging.FileHandler(cls._log_file_path, mode='a', encoding='utf-8')
+        # File handler (size-bounded), written in batches: records are held in
+        # memory until the buffer fills or a WARNING+ record arrives
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file_path, mode='a', maxBytes=cls._LOG_MAX_BYTES,
+            backupCount=cls._LOG_BACKUP_COUNT, encoding='utf-8'
+        )
         file_handler.setLevel(logging.DEBUG)
+        buffered_file_handler = logging.handlers.MemoryHandler(
+            cls._LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+        )
+        buffered_file_handler.setLevel(logging.DEBUG)
 
         # Console handler (warnings and errors only)
         console_handler = logging.StreamHandler()
@@ -103,16 +168,29 @@ class PPTXLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Records are only enqueued on the calling thread; formatting and the
+        # file/console writes happen on the listener's background thread
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        cls._listener = listener
+        # Drain pending records and flush the buffer on interpreter exit
+        atexit.unregister(cls._shutdown)
+        atexit.register(cls._shutdown)
 
-        cls._instance = logger
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
         logger.info("=" * 60)
         logger.info("PPTX Generation Started")
-        logger.info(f"Log file: {cls._log_file_path}")
+        logger.info("Log file: %s", log_file_path)
         logger.info("=" * 60)
 
+        cls._log_file_path = log_file_path
+        cls._working_dir = requested
+        # Publish last so the unlocked fast path never sees a half-built setup
+        cls._instance = logger
         return logger
 
     @classmethod
@@ -122,6 +200,14 @@ class PPTXLogger:
             return cls.setup()
         return cls._instance
 
+    @classmethod
+    def debug_enabled(cls) -> bool:
+        """Whether DEBUG records are currently emitted.
+
+        Use to skip building expensive debug-only values in hot loops.
+        """
+        return cls.get_logger().isEnabledFor(logging.DEBUG)
+
     @classmethod
     def get_log_path(cls) -> Optional[Path]:
         """Get path to log file."""
@@ -129,7 +215,14 @@ class PPTXLogger:
 
 
 def get_logger() -> logging.Logger:
-    """Convenience function to get logger."""
+    """Convenience function to get logger.
+
+    Pass message arguments separately instead of pre-formatting them, e.g.
+    ``logger.debug("ph=%s type=%s", idx, ph_type)`` rather than an f-string:
+    the message is then only interpolated when a record is actually emitted.
+    Guard debug-only work that is costly by itself with
+    ``PPTXLogger.debug_enabled()``.
+    """
     return PPTXLogger.get_logger()
 
 
@@ -18,88 +18,167 @@ Usage:
     shapes = create_flowchart_shapes(slide, placeholder, mermaid_code)
 """
 
+import copy
+import functools
 import re
+from collections import deque
 from typing import Dict, List, Tuple, Any
 
-from pptx.util import Inches, Pt, Emu
-from pptx.enum.shapes import MSO_SHAPE, MSO_CONNECTOR
-from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
-from pptx.enum.dml import MSO_THEME_COLOR, MSO_LINE_DASH_STYLE
-from pptx.dml.color import RGBColor
-from pptx.oxml.ns import qn
-from lxml import etree
-
-# Try to import style_config
-try:
-    from scripts.style_config import StyleConfig
-    STYLE_CONFIG_AVAILABLE = True
-except ImportError:
+# python-pptx and lxml (and style_config, which imports python-pptx) are
+# imported on first use by _import_pptx(), so parse_mermaid_flowchart() and
+# calculate_layout() don't pay their import cost
+_PPTX_IMPORTED = False
+
+# Node size and edge-label box geometry (EMU; 914400 per inch)
+_EMU_PER_INCH = 914400
+_NODE_W_EMU, _NODE_H_EMU = int(1.5 * _EMU_PER_INCH), int(0.8 * _EMU_PER_INCH)
+_LABEL_X_OFF, _LABEL_Y_OFF = int(0.5 * _EMU_PER_INCH), int(0.2 * _EMU_PER_INCH)  # offset from the edge midpoint
+_LABEL_W, _LABEL_H = _EMU_PER_INCH, int(0.4 * _EMU_PER_INCH)
+
+# Node text that python-pptx stores as a single run verbatim (no line breaks
+# or escaped control characters), so a cloned node only needs its <a:t> replaced
+_PLAIN_TEXT_RE = re.compile(r'[^\x00-\x08\x0a-\x1f]+')
+
+# Arrow size in style.yaml -> <a:tailEnd> w/len value
+_SIZE_MAP = {'small': 'sm', 'medium': 'med', 'large': 'lg'}
+
+# Mermaid syntax patterns (compiled once at import)
+# Flowchart declaration lines ("flowchart LR", "graph TD", ...)
+_DECLARATION_RE = re.compile(r'^[ \t]*(?:flowchart|graph)[^\n]*', re.M)
+# All tokens in one alternation, scanned in a single pass:
+#   conn:    A --> B or A -->|label| B  (target id is a lookahead so that a
+#            definition such as B[Text] right after the arrow is still seen)
+#   rect:    A[Text]
+#   diamond: A{Text}
+#   rounded: A(Text)
+# Whitespace and text never span lines, matching line-by-line parsing.
+_TOKEN_RE = re.compile(
+    r'(?P<conn>(?P<from>\w+)[^\S\n]*--+>?[^\S\n]*(?:\|(?P<label>[^|\n]*)\|)?[^\S\n]*(?=(?P<to>\w+)))'
+    r'|(?P<rect>(?P<rect_id>\w+)\[(?P<rect_text>[^\]\n]+)\])'
+    r'|(?P<diamond>(?P<diamond_id>\w+)\{(?P<diamond_text>[^}\n]+)\})'
+    r'|(?P<rounded>(?P<rounded_id>\w+)\((?P<rounded_text>[^)\n]+)\))'
+)
+
+
+def _import_pptx():
+    """Import python-pptx, lxml and style_config and build the tables using them.
+
+    Runs once; everything is bound as module globals.
+    """
+    global _PPTX_IMPORTED, STYLE_CONFIG_AVAILABLE, StyleConfig
+    global Pt, MSO_SHAPE, MSO_CONNECTOR, MSO_ANCHOR, PP_ALIGN, MSO_THEME_COLOR
+    global MSO_LINE_DASH_STYLE, RGBColor, qn, etree
+    global _EFFECTLST, _TAILEND, _T, _EXTLST
+    global _ALIGN_MAP, _V_ALIGN_MAP, _CONN_TYPE_MAP, _DASH_MAP
+    if _PPTX_IMPORTED:
+        return
+
+    from pptx.util import Pt
+    from pptx.enum.shapes import MSO_SHAPE, MSO_CONNECTOR
+    from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+    from pptx.enum.dml import MSO_THEME_COLOR, MSO_LINE_DASH_STYLE
+    from pptx.dml.color import RGBColor
+    from pptx.oxml.ns import qn
+    from lxml import etree
+
+    # Try to import style_config
     try:
-        from style_config import StyleConfig
+        from scripts.style_config import StyleConfig
         STYLE_CONFIG_AVAILABLE = True
     except ImportError:
-        STYLE_CONFIG_AVAILABLE = False
+        try:
+            from style_config import StyleConfig
+            STYLE_CONFIG_AVAILABLE = True
+        except ImportError:
+            STYLE_CONFIG_AVAILABLE = False
+
+    # DrawingML tags used on the per-shape path
+    _EFFECTLST = qn('a:effectLst')
+    _TAILEND = qn('a:tailEnd')
+    _T = qn('a:t')
+    _EXTLST = qn('p:extLst')
+
+    # style.yaml value -> python-pptx constant
+    _ALIGN_MAP = {'left': PP_ALIGN.LEFT, 'center': PP_ALIGN.CENTER, 'right': PP_ALIGN.RIGHT}
+    _V_ALIGN_MAP = {'top': MSO_ANCHOR.TOP, 'middle': MSO_ANCHOR.MIDDLE, 'bottom': MSO_ANCHOR.BOTTOM}
+    _CONN_TYPE_MAP = {'straight': MSO_CONNECTOR.STRAIGHT, 'elbow': MSO_CONNECTOR.ELBOW}
+    _DASH_MAP = {
+        'solid': MSO_LINE_DASH_STYLE.SOLID,
+        'dash': MSO_LINE_DASH_STYLE.DASH,
+        'dot': MSO_LINE_DASH_STYLE.ROUND_DOT
+    }
+
+    _PPTX_IMPORTED = True
 
 
 def get_style():
-    """Get styling from style.yaml."""
+    """Get styling from style.yaml.
+
+    StyleConfig.load() reuses the parsed file until it changes.
+    """
+    _import_pptx()
     if STYLE_CONFIG_AVAILABLE:
+        import yaml  # available whenever style_config imported
         try:
             return StyleConfig.load()
-        except:
+        except (FileNotFoundError, yaml.YAMLError):
             pass
     return None
 
 
+# Default flowchart configuration (used when style.yaml has no flowchart section).
+# Shared across calls; callers must treat it as read-only.
+_DEFAULT_FLOWCHART_CONFIG = {
+    'direction': 'LR',
+    'node': {
+        'shape': 'rounded_rectangle',
+        'fill': '#4F4F70',
+        'fill_theme': None,
+        'border_width_pt': 0,
+        'corner_radius_pt': 8,
+        'shadow': {
+            'enabled': True,
+            'blur_pt': 4,
+            'distance_pt': 3,
+            'direction_deg': 45,
+            'opacity': 0.4
+        },
+        'text': {
+            'color': '#FFFFFF',
+            'font_size_pt': 11,
+            'bold': False,
+            'vertical_align': 'middle',
+            'horizontal_align': 'center'
+        }
+    },
+    'connector': {
+        'type': 'elbow',
+        'color_theme': 'bg1',
+        'color_brightness': -0.25,
+        'width_pt': 1.0,
+        'dash_style': 'dash',
+        'arrow': {
+            'type': 'triangle',
+            'size': 'medium'
+        }
+    },
+    'label': {
+        'font_size_pt': 9,
+        'color_theme': 'bg1',
+        'color_brightness': -0.5
+    }
+}
+
+
 def get_flowchart_config(style):
     """Get flowchart configuration from style.yaml.
 
     Returns default values if style.yaml not available.
+    The returned dict is shared and must not be modified.
     """
     if style and hasattr(style, '_style_data') and 'flowchart' in style._style_data:
         return style._style_data['flowchart']
-
-    # Default configuration
-    return {
-        'direction': 'LR',
-        'node': {
-            'shape': 'rounded_rectangle',
-            'fill': '#4F4F70',
-            'fill_theme': None,
-            'border_width_pt': 0,
-            'corner_radius_pt': 8,
-            'shadow': {
-                'enabled': True,
-                'blur_pt': 4,
-                'distance_pt': 3,
-                'direction_deg': 45,
-                'opacity': 0.4
-            },
-            'text': {
-                'color': '#FFFFFF',
-                'font_size_pt': 11,
-                'bold': False,
-                'vertical_align': 'middle',
-                'horizontal_align': 'center'
-            }
-        },
-        'connector': {
-            'type': 'elbow',
-            'color_theme': 'bg1',
-            'color_brightness': -0.25,
-            'width_pt': 1.0,
-            'dash_style': 'dash',
-            'arrow': {
-                'type': 'triangle',
-                'size': 'medium'
-            }
-        },
-        'label': {
-            'font_size_pt': 9,
-            'color_theme': 'bg1',
-            'color_brightness': -0.5
-        }
-    }
+    return _DEFAULT_FLOWCHART_CONFIG
 
 
 def parse_mermaid_flowchart(mermaid_code: str) -> Tuple[Dict, List]:
@@ -113,55 +192,48 @@ def parse_mermaid_flowchart(mermaid_code: str) -> Tuple[Dict, List]:
         nodes: {id: {'text': str, 'shape': 'rect'|'diamond'|'rounded'}}
         edges: [{'from': id, 'to': id, 'label': str}]
     """
-    nodes = {}
-    edges = []
+    # Parsing is memoized per source; fresh dicts are built for every caller
+    node_items, edge_items = _parse_mermaid_cached(mermaid_code)
+    nodes = {node_id: {'text': text, 'shape': shape} for node_id, text, shape in node_items}
+    edges = [{'from': src, 'to': dst, 'label': label} for src, dst, label in edge_items]
+    return nodes, edges
 
-    # Remove comments and normalize
-    lines = mermaid_code.strip().split('\n')
 
-    for line in lines:
-        line = line.strip()
+@functools.lru_cache(maxsize=256)
+def _parse_mermaid_cached(mermaid_code: str) -> Tuple[Tuple, Tuple]:
+    """parse_mermaid_flowchart() body, as immutable tuples.
 
-        # Skip flowchart declaration and empty lines
-        if not line or line.startswith('flowchart') or line.startswith('graph'):
-            continue
+    Returns:
+        ((id, text, shape), ...), ((from, to, label), ...)
+    """
+    nodes = {}
+    edges = []
 
-        # Parse node definitions and connections
-        # Pattern: A[Text] or A{Text} or A(Text) or A((Text))
-        # Connection: A --> B or A -->|label| B
-
-        # Find connections first
-        conn_match = re.search(r'(\w+)\s*--+>?\s*(?:\|([^|]*)\|)?\s*(\w+)', line)
-        if conn_match:
-            from_id = conn_match.group(1)
-            label = conn_match.group(2) or ''
-            to_id = conn_match.group(3)
-            edges.append({'from': from_id, 'to': to_id, 'label': label.strip()})
-
-        # Find node definitions
-        # [text] = rectangle
-        # {text} = diamond
-        # (text) = rounded
-        # ((text)) = circle
-        node_patterns = [
-            (r'(\w+)\[([^\]]+)\]', 'rect'),      # A[Text]
-            (r'(\w+)\{([^}]+)\}', 'diamond'),    # A{Text}
-            (r'(\w+)\(([^)]+)\)', 'rounded'),    # A(Text)
-        ]
-
-        for pattern, shape_type in node_patterns:
-            for match in re.finditer(pattern, line):
-                node_id = match.group(1)
-                text = match.group(2).strip()
-                if node_id not in nodes:
-                    nodes[node_id] = {'text': text, 'shape': shape_type}
+    # Skip flowchart declaration lines, then tokenize everything in one pass
+    code = _DECLARATION_RE.sub('', mermaid_code)
 
-    return nodes, edges
+    for match in _TOKEN_RE.finditer(code):
+        kind = match.lastgroup
+        if kind == 'conn':
+            label = match.group('label') or ''
+            edges.append((match.group('from'), match.group('to'), label.strip()))
+        else:
+            # [text] = rectangle, {text} = diamond, (text) = rounded
+            # First definition of an id wins
+            nodes.setdefault(match.group(kind + '_id'),
+                             (match.group(kind + '_text').strip(), kind))
+
+    return (tuple((node_id, text, shape) for node_id, (text, shape) in nodes.items()),
+            tuple(edges))
 
 
 def calculate_layout(nodes: Dict, edges: List, bounds: Tuple, direction: str = 'LR') -> Dict:
     """Calculate positions for nodes.
 
+    Nodes are ranked in two phases: cycle removal (DFS back-edges are
+    ignored) and longest-path layering over a topological order. Nodes of
+    the same level are spread evenly across the other axis.
+
     Args:
         nodes: Node definitions
         edges: Edge definitions
@@ -169,43 +241,78 @@ def calculate_layout(nodes: Dict, edges: List, bounds: Tuple, direction: str = '
         direction: 'LR' for left-to-right, 'TD' for top-down
 
     Returns:
-        Dict mapping node_id to (left, top, width, height)
+        Dict mapping node_id to (left, top, width, height), with every node
+        of `nodes` present and in the same order
     """
     left, top, width, height = bounds
 
-    # Build dependency graph to determine levels
+    # Build dependency graph to determine levels (edges to undefined nodes are ignored)
     node_ids = list(nodes.keys())
-    levels = {}
-    incoming = {n: 0 for n in node_ids}
+    # out_edges: source -> [targets], preds: target -> [sources]; built once so
+    # nodes never rescan the edge list
+    all_out = {}
+    has_incoming = set()
 
     for edge in edges:
-        if edge['to'] in incoming:
-            incoming[edge['to']] += 1
-
-    # Find root nodes (no incoming edges)
-    queue = [n for n in node_ids if incoming[n] == 0]
-    for n in queue:
-        levels[n] = 0
+        src, dst = edge['from'], edge['to']
+        if src in nodes and dst in nodes:
+            all_out.setdefault(src, []).append(dst)
+            has_incoming.add(dst)
+
+    # Cycle removal: a DFS from the root nodes (then any node left unvisited),
+    # in node order, marks edges pointing back onto the current path; those
+    # back-edges (loops such as "retry" arrows) are ignored for ranking
+    back_edges = set()
+    state = {}  # node_id -> 1 while on the DFS path, 2 once finished
+    starts = [n for n in node_ids if n not in has_incoming] + node_ids
+    for start in starts:
+        if start in state:
+            continue
+        state[start] = 1
+        stack = [(start, iter(all_out.get(start, ())))]
+        while stack:
+            current, children = stack[-1]
+            for child in children:
+                child_state = state.get(child)
+                if child_state == 1:
+                    back_edges.add((current, child))
+                elif child_state is None:
+                    state[child] = 1
+                    stack.append((child, iter(all_out.get(child, ()))))
+                    break
+            else:
+                state[current] = 2
+                stack.pop()
+
+    out_edges = {}
+    preds = {}
+    indegree = {n: 0 for n in node_ids}
+
+    for src, targets in all_out.items():
+        for dst in targets:
+            if (src, dst) not in back_edges:
+                out_edges.setdefault(src, []).append(dst)
+                preds.setdefault(dst, []).append(src)
+                indegree[dst] += 1
+
+    # Topological order (Kahn's algorithm), starting from root nodes
+    queue = deque(n for n in node_ids if indegree[n] == 0)
+    order = []
 
-    # BFS to assign levels
-    processed = set(queue)
     while queue:
-        current = queue.pop(0)
-        current_level = levels[current]
+        current = queue.popleft()
+        order.append(current)
+        for next_node in out_edges.get(current, ()):
+            indegree[next_node] -= 1
+            if indegree[next_node] == 0:
+                queue.append(next_node)
+
+    # Longest-path ranking: every parent is ranked before its children
+    levels = {}
+    for n in order:
+        levels[n] = 1 + max((levels[p] for p in preds.get(n, ())), default=-1)
 
-        for edge in edges:
-            if edge['from'] == current:
-                next_node = edge['to']
-                if next_node not in levels:
-                    levels[next_node] = current_level + 1
-                else:
-                    levels[next_node] = max(levels[next_node], current_level + 1)
-
-                if next_node not in processed:
-                    queue.append(next_node)
-                    processed.add(next_node)
-
-    # Assign levels to any remaining nodes
+    # Every node is ranked once back-edges are dropped; keep a safe default
     for n in node_ids:
         if n not in levels:
             levels[n] = 0
@@ -217,13 +324,13 @@ def calculate_layout(nodes: Dict, edges: List, bounds: Tuple, direction: str = '
             level_groups[level] = []
         level_groups[level].append(node_id)
 
-    # Calculate positions
-    positions = {}
+    # Calculate positions (pre-seeded so keys follow the order of `nodes`)
+    positions = dict.fromkeys(node_ids)
     num_levels = max(levels.values()) + 1 if levels else 1
 
     # Node dimensions
-    node_width = Inches(1.5)
-    node_height = Inches(0.8)
+    node_width = _NODE_W_EMU
+    node_height = _NODE_H_EMU
 
     if direction == 'LR':
         # Horizontal layout
@@ -251,7 +358,150 @@ def calculate_layout(nodes: Dict, edges: List, bounds: Tuple, direction: str = '
     return positions
 
 
-def create_flowchart_shapes(slide, placeholder, mermaid_code: str, direction: str = None):
+def _disable_effects(spPr):
+    """Ensure spPr has an empty <a:effectLst/> (overrides theme shadows).
+
+    Shapes just created by python-pptx have no effectLst, so this is usually a
+    single lookup plus append; an existing list is emptied in place.
+    """
+    effect_lst = spPr.find(_EFFECTLST)
+    if effect_lst is None:
+        etree.SubElement(spPr, _EFFECTLST)
+    elif len(effect_lst):
+        for effect in list(effect_lst):
+            effect_lst.remove(effect)
+
+
+def _hex_to_rgb(hex_color):
+    """'#RRGGBB' -> RGBColor."""
+    return RGBColor(*bytes.fromhex(hex_color.strip('#')[:6]))
+
+
+def _style_node_shape(shape, text, style, node_config, primary_theme,
+                      primary_rgb_color, text_rgb_color):
+    """Apply fill, border, shadow and text styling (from style.yaml) to a node shape.
+
+    RGB colors are passed in pre-parsed (None when not used).
+    """
+    # Apply fill (from style.yaml) - use theme color or RGB
+    shape.fill.solid()
+    if primary_theme:
+        # Use theme color
+        shape.fill.fore_color.theme_color = style.get_theme_color(primary_theme) if style else MSO_THEME_COLOR.ACCENT_1
+        # Apply fill brightness
+        fill_brightness = node_config.get('fill_brightness', 0.0)
+        if fill_brightness != 0.0:
+            shape.fill.fore_color.brightness = fill_brightness
+    elif primary_rgb_color:
+        # Use RGB color
+        shape.fill.fore_color.rgb = primary_rgb_color
+
+    # Border (from style.yaml)
+    border_width = node_config.get('border_width_pt', 0)
+    if border_width == 0:
+        shape.line.fill.background()
+    else:
+        shape.line.width = Pt(border_width)
+        # Apply border color
+        border_theme = node_config.get('border_theme')
+        if border_theme and style:
+            shape.line.color.theme_color = style.get_theme_color(border_theme)
+            border_brightness = node_config.get('border_brightness', 0.0)
+            if border_brightness != 0.0:
+                shape.line.color.brightness = border_brightness
+
+    # Shadow - explicitly disable (override theme defaults)
+    # Always disable shadow as style.yaml has shadow.enabled: false
+    _disable_effects(shape._element.spPr)
+
+    # Add text (from style.yaml)
+    text_config = node_config.get('text', {})
+    tf = shape.text_frame
+    tf.clear()
+    p = tf.paragraphs[0]
+    p.text = text
+
+    # Horizontal alignment
+    h_align = text_config.get('horizontal_align', 'center')
+    p.alignment = _ALIGN_MAP.get(h_align, PP_ALIGN.CENTER)
+
+    # Text styling - use theme colors or RGB from style.yaml
+    font_family = text_config.get('font_family', 'Arial')
+    font_size = text_config.get('font_size_pt', 12)
+    font_bold = text_config.get('bold', False)
+    font_italic = text_config.get('italic', False)
+
+    # Get color - prefer theme, fallback to RGB
+    color_theme = text_config.get('color_theme')
+    color_brightness = text_config.get('color_brightness', 0.0)
+
+    # Apply font formatting to runs (normally a single run). Typeface, size,
+    # bold and italic are written straight onto <a:rPr> instead of through
+    # the python-pptx font setters
+    size_attr = str(Pt(font_size).centipoints)
+    bold_attr = None if font_bold is None else ('1' if font_bold else '0')
+    italic_attr = None if font_italic is None else ('1' if font_italic else '0')
+    for run in p.runs:
+        rPr = run._r.get_or_add_rPr()
+        rPr.get_or_add_latin().typeface = font_family
+        rPr.set('sz', size_attr)
+        if bold_attr is not None:
+            rPr.set('b', bold_attr)
+        if italic_attr is not None:
+            rPr.set('i', italic_attr)
+
+        # Apply color
+        if color_theme and style:
+            # Use theme color
+            run.font.color.theme_color = style.get_theme_color(color_theme)
+            if color_brightness != 0.0:
+                run.font.color.brightness = color_brightness
+        elif text_rgb_color:
+            # Use RGB color
+            run.font.color.rgb = text_rgb_color
+
+    # Vertical alignment
+    v_align = text_config.get('vertical_align', 'middle')
+    tf.vertical_anchor = _V_ALIGN_MAP.get(v_align, MSO_ANCHOR.MIDDLE)
+    tf.word_wrap = True
+    tf.auto_size = None
+
+
+def _clone_shape(slide, prototype, x, y, w, h, text, pending):
+    """Copy an already styled single-run shape with new position and text.
+
+    Produces the same XML as creating and styling the shape again (node shapes
+    and edge-label text boxes), without the per-property python-pptx setters.
+    The copy is queued on `pending`; _flush_pending() adds it to the slide.
+    """
+    sp = copy.deepcopy(prototype)
+    shape_id = slide.shapes._next_shape_id
+    cNvPr = sp.nvSpPr.cNvPr
+    basename = cNvPr.name.rsplit(' ', 1)[0]
+    cNvPr.id = shape_id
+    cNvPr.name = '%s %d' % (basename, shape_id - 1)
+    sp.x, sp.y, sp.cx, sp.cy = x, y, w, h
+    sp.find('.//' + _T).text = text
+    pending.append(sp)
+    return slide.shapes._shape_factory(sp)
+
+
+def _flush_pending(slide, pending):
+    """Insert queued shape elements into the slide's spTree in one operation.
+
+    Called before python-pptx adds a shape itself, so z-order is unchanged.
+    """
+    if not pending:
+        return
+    spTree = slide.shapes._spTree
+    ext_lst = spTree.find(_EXTLST)
+    at = len(spTree) if ext_lst is None else spTree.index(ext_lst)
+    spTree[at:at] = pending
+    pending.clear()
+
+
+def create_flowchart_shapes(slide, placeholder, mermaid_code: str, direction: str = None,
+                            use_fast_builder: bool = True):
     """Create native PowerPoint shapes from Mermaid flowchart.
 
     Args:
@@ -259,10 +509,16 @@ def create_flowchart_shapes(slide, placeholder, mermaid_code: str, direction: st
         placeholder: Placeholder shape (for position/size)
         mermaid_code: Mermaid flowchart code
         direction: 'LR' or 'TD' (default from style.yaml)
+        use_fast_builder: Clone the XML of the first styled node of each shape
+            kind (and of the first edge label) instead of styling every one
+            through python-pptx. Cloning relies on python-pptx internals; pass
+            False to build every shape through the public API instead
 
     Returns:
         List of created shape objects
     """
+    _import_pptx()
+
     # Get styling from style.yaml
     style = get_style()
     config = get_flowchart_config(style)
@@ -298,6 +554,13 @@ def create_flowchart_shapes(slide, placeholder, mermaid_code: str, direction: st
     if not nodes:
         raise ValueError("No nodes found in Mermaid code")
 
+    # Parse RGB colors once for all nodes (theme colors take precedence)
+    primary_rgb_color = _hex_to_rgb(primary_rgb) if primary_rgb else None
+    text_config = node_config.get('text', {})
+    text_rgb = text_config.get('color')
+    use_text_theme = text_config.get('color_theme') and style
+    text_rgb_color = _hex_to_rgb(text_rgb) if text_rgb and not use_text_theme else None
+
     # Get bounds from placeholder
     bounds = (placeholder.left, placeholder.top, placeholder.width, placeholder.height)
 
@@ -310,232 +573,162 @@ def create_flowchart_shapes(slide, placeholder, mermaid_code: str, direction: st
 
     created_shapes = []
     shape_refs = {}  # node_id -> shape
-
-    # Create node shapes
-    for node_id, node_info in nodes.items():
-        if node_id not in positions:
-            continue
-
-        x, y, w, h = positions[node_id]
-        text = node_info['text']
-        shape_type = node_info['shape']
-
-        # Determine PowerPoint shape type
-        # Template uses ROUNDED_RECTANGLE for most shapes
-        if shape_type == 'diamond':
-            mso_shape = MSO_SHAPE.DIAMOND
-        else:  # rect and rounded both use rounded rectangle
-            mso_shape = MSO_SHAPE.ROUNDED_RECTANGLE
-
-        # Create shape
-        shape = slide.shapes.add_shape(mso_shape, x, y, w, h)
-
-        # Apply fill (from style.yaml) - use theme color or RGB
-        shape.fill.solid()
-        if primary_theme:
-            # Use theme color
-            shape.fill.fore_color.theme_color = style.get_theme_color(primary_theme) if style else MSO_THEME_COLOR.ACCENT_1
-            # Apply fill brightness
-            fill_brightness = node_config.get('fill_brightness', 0.0)
-            if fill_brightness != 0.0:
-                shape.fill.fore_color.brightness = fill_brightness
-        elif primary_rgb:
-            # Use RGB color
-            rgb_str = primary_rgb.strip('#')
-            r = int(rgb_str[0:2], 16)
-            g = int(rgb_str[2:4], 16)
-            b = int(rgb_str[4:6], 16)
-            shape.fill.fore_color.rgb = RGBColor(r, g, b)
-
-        # Border (from style.yaml)
-        border_width = node_config.get('border_width_pt', 0)
-        if border_width == 0:
-            shape.line.fill.background()
-        else:
-            shape.line.width = Pt(border_width)
-            # Apply border color
-            border_theme = node_config.get('border_theme')
-            if border_theme and style:
-                shape.line.color.theme_color = style.get_theme_color(border_theme)
-                border_brightness = node_config.get('border_brightness', 0.0)
-                if border_brightness != 0.0:
-                    shape.line.color.brightness = border_brightness
-
-        # Shadow - explicitly disable (override theme defaults)
-        # Always disable shadow as style.yaml has shadow.enabled: false
-        spPr = shape._element.spPr
-        # Remove any existing effectLst
-        existing_effectLst = spPr.find('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst')
-        if existing_effectLst is not None:
-            spPr.remove(existing_effectLst)
-        # Add empty effectLst to disable shadow
-        etree.SubElement(spPr, '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst')
-
-        # Add text (from style.yaml)
-        text_config = node_config.get('text', {})
-        tf = shape.text_frame
-        tf.clear()
-        p = tf.paragraphs[0]
-        p.text = text
-
-        # Horizontal alignment
-        h_align = text_config.get('horizontal_align', 'center')
-        align_map = {'left': PP_ALIGN.LEFT, 'center': PP_ALIGN.CENTER, 'right': PP_ALIGN.RIGHT}
-        p.alignment = align_map.get(h_align, PP_ALIGN.CENTER)
-
-        # Text styling - use theme colors or RGB from style.yaml
-        font_family = text_config.get('font_family', 'Arial')
-        font_size = text_config.get('font_size_pt', 12)
-        font_bold = text_config.get('bold', False)
-        font_italic = text_config.get('italic', False)
-
-        # Get color - prefer theme, fallback to RGB
-        color_theme = text_config.get('color_theme')
-        color_rgb = text_config.get('color')
-        color_brightness = text_config.get('color_brightness', 0.0)
-
-        # Apply font formatting to runs
-        for run in p.runs:
-            run.font.name = font_family
-            run.font.size = Pt(font_size)
-            run.font.bold = font_bold
-            run.font.italic = font_italic
-
-            # Apply color
-            if color_theme and style:
-                # Use theme color
-                run.font.color.theme_color = style.get_theme_color(color_theme)
-                if color_brightness != 0.0:
-                    run.font.color.brightness = color_brightness
-            elif color_rgb:
-                # Use RGB color
-                rgb_str = color_rgb.strip('#')
-                r = int(rgb_str[0:2], 16)
-                g = int(rgb_str[2:4], 16)
-                b = int(rgb_str[4:6], 16)
-                run.font.color.rgb = RGBColor(r, g, b)
-
-        # Vertical alignment
-        v_align = text_config.get('vertical_align', 'middle')
-        v_align_map = {'top': MSO_ANCHOR.TOP, 'middle': MSO_ANCHOR.MIDDLE, 'bottom': MSO_ANCHOR.BOTTOM}
-        tf.vertical_anchor = v_align_map.get(v_align, MSO_ANCHOR.MIDDLE)
-        tf.word_wrap = True
-        tf.auto_size = None
-
-        shape_refs[node_id] = shape
-        created_shapes.append(shape)
-
-    # Create connectors
-    for edge in edges:
-        from_id = edge['from']
-        to_id = edge['to']
-
-        if from_id not in shape_refs or to_id not in shape_refs:
-            continue
-
-        from_shape = shape_refs[from_id]
-        to_shape = shape_refs[to_id]
-
-        # Get connector points
-        # From: right center, To: left center (for LR)
-        if direction == 'LR':
-            begin_x = from_shape.left + from_shape.width
-            begin_y = from_shape.top + from_shape.height // 2
-            end_x = to_shape.left
-            end_y = to_shape.top + to_shape.height // 2
-        else:  # TD
-            begin_x = from_shape.left + from_shape.width // 2
-            begin_y = from_shape.top + from_shape.height
-            end_x = to_shape.left + to_shape.width // 2
-            end_y = to_shape.top
-
-        # Create connector (from style.yaml)
+    prototypes = {}  # MSO_SHAPE -> styled <p:sp> to clone (use_fast_builder only)
+    label_prototype = None  # styled edge-label text box to clone (use_fast_builder only)
+    pending = []  # cloned elements not yet in the spTree (use_fast_builder only)
+
+    # Clones get their ids before they are in the tree, so let python-pptx
+    # count shape ids instead of rescanning the tree (turbo-add mode)
+    shapes = slide.shapes
+    restore_turbo = use_fast_builder and not shapes.turbo_add_enabled
+    if restore_turbo:
+        shapes.turbo_add_enabled = True
+    try:
+        # Create node shapes
+        for node_id, (x, y, w, h) in positions.items():
+            node_info = nodes[node_id]
+            text = node_info['text']
+            shape_type = node_info['shape']
+
+            # Determine PowerPoint shape type
+            # Template uses ROUNDED_RECTANGLE for most shapes
+            if shape_type == 'diamond':
+                mso_shape = MSO_SHAPE.DIAMOND
+            else:  # rect and rounded both use rounded rectangle
+                mso_shape = MSO_SHAPE.ROUNDED_RECTANGLE
+
+            # Create shape. The first fully styled shape of each kind becomes a
+            # prototype that later nodes clone as XML (use_fast_builder only)
+            prototype = prototypes.get(mso_shape)
+            if prototype is not None and _PLAIN_TEXT_RE.fullmatch(text):
+                shape = _clone_shape(slide, prototype, x, y, w, h, text, pending)
+            else:
+                _flush_pending(slide, pending)
+                shape = slide.shapes.add_shape(mso_shape, x, y, w, h)
+                _style_node_shape(shape, text, style, node_config, primary_theme,
+                                  primary_rgb_color, text_rgb_color)
+                if use_fast_builder and _PLAIN_TEXT_RE.fullmatch(text):
+                    prototypes.setdefault(mso_shape, shape._element)
+
+            shape_refs[node_id] = shape
+            created_shapes.append(shape)
+
+        # Connector and label styling is the same for every edge (from style.yaml)
         conn_type = connector_config.get('type', 'elbow')
-        conn_type_map = {'straight': MSO_CONNECTOR.STRAIGHT, 'elbow': MSO_CONNECTOR.ELBOW}
-        mso_conn = conn_type_map.get(conn_type, MSO_CONNECTOR.ELBOW)
-
-        connector = slide.shapes.add_connector(
-            mso_conn,
-            begin_x, begin_y,
-            end_x, end_y
-        )
-
-        # Remove shadow from connector
-        conn_spPr = connector._element.spPr
-        existing_effectLst = conn_spPr.find(qn('a:effectLst'))
-        if existing_effectLst is not None:
-            conn_spPr.remove(existing_effectLst)
-        etree.SubElement(conn_spPr, qn('a:effectLst'))
-
-        # Style connector (from style.yaml)
-        color_theme = connector_config.get('color_theme', 'bg1')
-        color_brightness = connector_config.get('color_brightness', -0.25)
-        conn_width = connector_config.get('width_pt', 1.0)
-        dash_style = connector_config.get('dash_style', 'dash')
-
-        connector.line.color.theme_color = style.get_theme_color(color_theme) if style else MSO_THEME_COLOR.BACKGROUND_1
-        connector.line.color.brightness = color_brightness
-        connector.line.width = Pt(conn_width)
-
-        # Dash style
-        dash_map = {
-            'solid': MSO_LINE_DASH_STYLE.SOLID,
-            'dash': MSO_LINE_DASH_STYLE.DASH,
-            'dot': MSO_LINE_DASH_STYLE.ROUND_DOT
-        }
-        connector.line.dash_style = dash_map.get(dash_style, MSO_LINE_DASH_STYLE.DASH)
-
-        # Add arrow at end (from style.yaml)
-        arrow_config = connector_config.get('arrow', {})
-        arrow_type = arrow_config.get('type', 'triangle')
-        arrow_size = arrow_config.get('size', 'medium')
-        size_map = {'small': 'sm', 'medium': 'med', 'large': 'lg'}
-
-        ln = connector.line._ln
-        tailEnd = ln.find(qn('a:tailEnd'))
-        if tailEnd is None:
-            tailEnd = connector.line._ln.makeelement(qn('a:tailEnd'))
-            ln.append(tailEnd)
-        tailEnd.set('type', arrow_type)
-        tailEnd.set('w', size_map.get(arrow_size, 'med'))
-        tailEnd.set('len', size_map.get(arrow_size, 'med'))
-
-        created_shapes.append(connector)
-
-        # Add label if present
-        if edge['label']:
-            # Create text box for label
-            label_x = (begin_x + end_x) // 2 - Inches(0.5)
-            label_y = (begin_y + end_y) // 2 - Inches(0.2)
-
-            label_box = slide.shapes.add_textbox(
-                label_x, label_y,
-                Inches(1), Inches(0.4)
-            )
-
-            # Remove shadow from label
-            label_spPr = label_box._element.spPr
-            existing_effectLst = label_spPr.find(qn('a:effectLst'))
-            if existing_effectLst is not None:
-                label_spPr.remove(existing_effectLst)
-            etree.SubElement(label_spPr, qn('a:effectLst'))
-
-            tf = label_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = edge['label']
-            p.alignment = PP_ALIGN.CENTER
+        mso_conn = _CONN_TYPE_MAP.get(conn_type, MSO_CONNECTOR.ELBOW)
+        conn_theme_color = (style.get_theme_color(connector_config.get('color_theme', 'bg1'))
+                            if style else MSO_THEME_COLOR.BACKGROUND_1)
+        label_theme_color = (style.get_theme_color(label_config.get('color_theme', 'bg1'))
+                             if style else MSO_THEME_COLOR.BACKGROUND_1)
 
-            # Label styling (from style.yaml)
-            label_font_size = label_config.get('font_size_pt', 9)
-            label_color_theme = label_config.get('color_theme', 'bg1')
-            label_brightness = label_config.get('color_brightness', -0.5)
-
-            for run in p.runs:
-                run.font.size = Pt(label_font_size)
-                run.font.color.theme_color = style.get_theme_color(label_color_theme) if style else MSO_THEME_COLOR.BACKGROUND_1
-                run.font.color.brightness = label_brightness
+        # Create connectors
+        for edge in edges:
+            from_id = edge['from']
+            to_id = edge['to']
+
+            if from_id not in shape_refs or to_id not in shape_refs:
+                continue
+
+            from_shape = shape_refs[from_id]
+            to_shape = shape_refs[to_id]
+
+            # Get connector points
+            # From: right center, To: left center (for LR)
+            if direction == 'LR':
+                begin_x = from_shape.left + from_shape.width
+                begin_y = from_shape.top + from_shape.height // 2
+                end_x = to_shape.left
+                end_y = to_shape.top + to_shape.height // 2
+            else:  # TD
+                begin_x = from_shape.left + from_shape.width // 2
+                begin_y = from_shape.top + from_shape.height
+                end_x = to_shape.left + to_shape.width // 2
+                end_y = to_shape.top
+
+            # Create connector
+            _flush_pending(slide, pending)
+            connector = slide.shapes.add_connector(
+                mso_conn,
+                begin_x, begin_y,
+                end_x, end_y
+            )
 
-            created_shapes.append(label_box)
+            # Remove shadow from connector
+            _disable_effects(connector._element.spPr)
+
+            # Style connector (from style.yaml)
+            color_brightness = connector_config.get('color_brightness', -0.25)
+            conn_width = connector_config.get('width_pt', 1.0)
+            dash_style = connector_config.get('dash_style', 'dash')
+
+            connector.line.color.theme_color = conn_theme_color
+            connector.line.color.brightness = color_brightness
+            connector.line.width = Pt(conn_width)
+
+            # Dash style
+            connector.line.dash_style = _DASH_MAP.get(dash_style, MSO_LINE_DASH_STYLE.DASH)
+
+            # Add arrow at end (from style.yaml)
+            arrow_config = connector_config.get('arrow', {})
+            arrow_type = arrow_config.get('type', 'triangle')
+            arrow_size = arrow_config.get('size', 'medium')
+
+            ln = connector.line._ln
+            tailEnd = ln.find(_TAILEND)
+            if tailEnd is None:
+                tailEnd = connector.line._ln.makeelement(_TAILEND)
+                ln.append(tailEnd)
+            tailEnd.set('type', arrow_type)
+            tailEnd.set('w', _SIZE_MAP.get(arrow_size, 'med'))
+            tailEnd.set('len', _SIZE_MAP.get(arrow_size, 'med'))
+
+            created_shapes.append(connector)
+
+            # Add label if present
+            if edge['label']:
+                # Create text box for label
+                label_x = (begin_x + end_x) // 2 - _LABEL_X_OFF
+                label_y = (begin_y + end_y) // 2 - _LABEL_Y_OFF
+                plain_label = _PLAIN_TEXT_RE.fullmatch(edge['label'])
+
+                # Labels differ only in position and text: clone the first one
+                if label_prototype is not None and plain_label:
+                    label_box = _clone_shape(slide, label_prototype, label_x, label_y,
+                                             _LABEL_W, _LABEL_H, edge['label'], pending)
+                    created_shapes.append(label_box)
+                    continue
+
+                _flush_pending(slide, pending)
+                label_box = slide.shapes.add_textbox(
+                    label_x, label_y,
+                    _LABEL_W, _LABEL_H
+                )
+
+                # Remove shadow from label
+                _disable_effects(label_box._element.spPr)
+
+                tf = label_box.text_frame
+                p = tf.paragraphs[0]
+                p.text = edge['label']
+                p.alignment = PP_ALIGN.CENTER
+
+                # Label styling (from style.yaml)
+                label_font_size = label_config.get('font_size_pt', 9)
+                label_brightness = label_config.get('color_brightness', -0.5)
+
+                for run in p.runs:
+                    run.font.size = Pt(label_font_size)
+                    run.font.color.theme_color = label_theme_color
+                    run.font.color.brightness = label_brightness
+
+                if use_fast_builder and plain_label:
+                    label_prototype = label_box._element
+                created_shapes.append(label_box)
+
+        _flush_pending(slide, pending)
+    finally:
+        if restore_turbo:
+            shapes.turbo_add_enabled = False
 
     return created_shapes
 
@@ -562,3 +755,22 @@ if __name__ == '__main__':
     print("\nParsed edges:")
     for edge in edges:
         print(f"  {edge['from']} --> {edge['to']} [{edge['label']}]")
+
+    # Cyclic flowchart: the retry edge C --> B must not collapse the levels
+    cyclic_code = '''flowchart LR
+        A[開始]
+        B[試行]
+        C{OK?}
+        D[完了]
+        A --> B
+        B --> C
+        C -->|No| B
+        C -->|Yes| D
+    '''
+
+    nodes, edges = parse_mermaid_flowchart(cyclic_code)
+    positions = calculate_layout(nodes, edges, (457200, 1371600, 8229600, 4572000))
+
+    print("\nCyclic layout:")
+    for node_id, (x, y, w, h) in positions.items():
+        print(f"  {node_id}: x={x}, y={y}")
@@ -13,15 +13,18 @@ Usage:
 """
 
 from typing import Any, Dict, List
+import copy
+import functools
+import itertools
 import os
+import re
 from pathlib import Path
 
-from pptx.chart.data import CategoryChartData
-from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.util import Inches, Pt, Emu
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.xmlchemy import OxmlElement
 
 # Use style_config for all styling (Single Source of Truth)
 from scripts.style_config import StyleConfig
@@ -29,14 +32,6 @@ from scripts.style_config import StyleConfig
 # Import logging
 from scripts.logging_utils import get_logger
 
-# Import crtx utilities if available
-try:
-    from scripts.crtx_utils import extract_crtx_styling, apply_crtx_styling_to_chart
-    CRTX_AVAILABLE = True
-except ImportError:
-    CRTX_AVAILABLE = False
-    get_logger().error("crtx_utils not available - chart styling will fail")
-
 # Import snapshot utilities
 from scripts.snapshot_utils import create_generation_snapshot
 
@@ -47,6 +42,36 @@ CHART_CRTX_PATH = SKILL_DIR / 'templates' / 'template.crtx'
 # Track whether snapshot has been created in this session
 _SNAPSHOT_CREATED = False
 
+# Numeric table cells: leading number + unit suffix ("3500万", "1234567円", "98765")
+_NUM_FMT_RE = re.compile(r'([\d.]+)(.*)')
+# Number formatting stripped before column-type detection (commas, yen sign, units)
+_NUM_STRIP_TRANS = str.maketrans('', '', ',¥%万円')
+
+# style.yaml table alignment -> OOXML / python-pptx values
+_TABLE_OOXML_ANCHOR_MAP = {'top': 't', 'middle': 'ctr', 'bottom': 'b'}
+_TABLE_H_ALIGN_MAP = {
+    'left': PP_ALIGN.LEFT,
+    'center': PP_ALIGN.CENTER,
+    'right': PP_ALIGN.RIGHT,
+    'justify': PP_ALIGN.JUSTIFY
+}
+# style.yaml table border color_theme -> <a:schemeClr val>
+_TABLE_BORDER_THEME_MAP = {
+    'ACCENT_1': 'accent1',
+    'LIGHT_1': 'lt1',
+    'DARK_1': 'dk1',
+    'bg1': 'bg1',
+    'tx1': 'tx1'
+}
+# Table cell border line (lnL/lnR/lnT/lnB) with a theme color
+_TABLE_BORDER_LINE_XML = (
+    '<a:{tag} w="{width}"><a:solidFill>'
+    '<a:schemeClr val="{scheme_val}">{lum_mod}</a:schemeClr>'
+    '</a:solidFill></a:{tag}>'
+)
+# <a:bodyPr> inset attributes and their OOXML defaults (omitted when equal)
+_BODY_PR_INSETS = (('lIns', 91440), ('rIns', 91440), ('tIns', 45720), ('bIns', 45720))
+
 
 def create_styled_table(slide, placeholder_shape, spec: Dict[str, Any]):
     """Create native table with style.yaml styling.
@@ -72,7 +97,8 @@ def create_styled_table(slide, placeholder_shape, spec: Dict[str, Any]):
     logger.info("Creating styled table")
 
     # Create generation snapshot (once per session)
-    _ensure_snapshot_created()
+    if not _SNAPSHOT_CREATED:
+        _ensure_snapshot_created()
 
     # Load style configuration
     style = StyleConfig.load()
@@ -91,31 +117,21 @@ def create_styled_table(slide, placeholder_shape, spec: Dict[str, Any]):
     cols = len(data[0])
     for row_idx, row_data in enumerate(data):
         if len(row_data) != cols:
-            logger.error(f"Row {row_idx} has {len(row_data)} columns, expected {cols}")
+            logger.error("Row %s has %s columns, expected %s", row_idx, len(row_data), cols)
             raise ValueError(f"All rows must have same number of columns (expected {cols}, row {row_idx} has {len(row_data)})")
 
-    logger.debug(f"Table validated: {len(data)} rows x {cols} columns")
+    logger.debug("Table validated: %s rows x %s columns", len(data), cols)
 
     rows = len(data)
     cols = len(data[0])
 
     # Auto-detect column types if not provided
     if not column_types:
-        column_types = []
         # Use first data row (row 1 if header exists, row 0 otherwise)
         data_row_idx = 1 if header_row and len(data) > 1 else 0
-        for c_idx in range(cols):
-            cell_value = str(data[data_row_idx][c_idx]).strip()
-            # Simple number detection: if parseable as float and contains digits
-            is_number = False
-            try:
-                # Remove common number formatting (commas, yen sign, units, etc.)
-                cleaned = cell_value.replace(',', '').replace('¥', '').replace('%', '').replace('万', '').replace('円', '')
-                float(cleaned)
-                is_number = True
-            except ValueError:
-                is_number = False
-            column_types.append('number' if is_number else 'text')
+        sample_row = data[data_row_idx]
+        column_types = ['number' if _is_numeric_cell(sample_row[c_idx]) else 'text'
+                        for c_idx in range(cols)]
 
     # Try to use placeholder.insert_table() if available
     from pptx.enum.shapes import PP_PLACEHOLDER_TYPE
@@ -144,116 +160,73 @@ def create_styled_table(slide, placeholder_shape, spec: Dict[str, Any]):
     
     table = table_shape.table
 
+    # Cell XML is built once per table from style.yaml and deep-copied into
+    # each cell; python-pptx property setters are not used in the loop
+    border_theme, border_brightness = _table_border_color(table_style)
+    border_templates = _table_border_templates(border_theme, border_brightness)
+
+    # Header/body run, paragraph and body properties; only the body fill
+    # brightness varies (per column)
+    table_values = table_style.snapshot()
+    header_ctx = _table_cell_context(
+        table_style.header, table_values.header_text_theme, table_values.header_text_brightness)
+    body_ctx = _table_cell_context(
+        table_style.body, table_values.body_text_theme, table_values.body_text_brightness)
+    header_fill = _scheme_color_fill(
+        table_values.header_fill_theme, table_values.header_fill_brightness)
+    body_fills = [_scheme_color_fill(table_values.body_fill_theme,
+                                     table_style.get_body_brightness(c_idx))
+                  for c_idx in range(cols)]
+    number_columns = [c_idx < len(column_types) and column_types[c_idx] == 'number'
+                      for c_idx in range(cols)]
+    last_row, last_col = rows - 1, cols - 1
+    a_p, a_r = qn('a:p'), qn('a:r')
+    deepcopy = copy.deepcopy
+
     # Fill data and apply styling
-    for r_idx, row_data in enumerate(data):
+    # Walk the row/cell objects once instead of looking up table.cell(r, c)
+    for r_idx, (row, row_data) in enumerate(zip(table.rows, data)):
         is_header = header_row and r_idx == 0
+        ctx = header_ctx if is_header else body_ctx
+        rPr_template = ctx['rPr']
+        algn = ctx['algn']
+        body_pr_attrs = ctx['body_pr_attrs']
+        is_top_edge, is_bottom_edge = r_idx == 0, r_idx == last_row
 
-        for c_idx, cell_value in enumerate(row_data):
-            cell = table.cell(r_idx, c_idx)
-
+        for c_idx, (cell, cell_value) in enumerate(zip(row.cells, row_data)):
             # Format cell value with thousand separator if it's a number
             cell_text = str(cell_value)
-            if not is_header and c_idx < len(column_types) and column_types[c_idx] == 'number':
-                # Try to format numbers with thousand separator
-                import re
-                # Match patterns like "3500万", "1234567円", "98765"
-                match = re.match(r'([\d.]+)(.*)', cell_text.replace(',', ''))
-                if match:
-                    number_part = match.group(1)
-                    suffix = match.group(2)  # unit like "万", "円", "%"
-                    try:
-                        # Parse as number and format with comma
-                        num = float(number_part)
-                        if num == int(num):
-                            formatted = f"{int(num):,}"
-                        else:
-                            formatted = f"{num:,}"
-                        cell_text = formatted + suffix
-                    except ValueError:
-                        pass  # Keep original if parsing fails
+            if not is_header and number_columns[c_idx]:
+                cell_text = _format_number_text(cell_text)
 
             cell.text = cell_text
-
-            # Apply fill
-            cell.fill.solid()
-            if is_header:
-                # Header: theme color + brightness from style.yaml
-                cell.fill.fore_color.theme_color = table_style.header_fill_theme
-                cell.fill.fore_color.brightness = table_style.header_fill_brightness
+            tc = cell._tc
+
+            # Text margins and vertical alignment from style.yaml
+            txBody = tc.txBody
+            bodyPr = txBody.bodyPr
+            for attr, value in body_pr_attrs:
+                bodyPr.set(attr, value)
+
+            # Horizontal alignment and run font (header or body) from style.yaml
+            if '\n' in cell_text or '\v' in cell_text:
+                # Multi-line text: a paragraph per line, runs split at line breaks
+                for p in txBody.iterchildren(a_p):
+                    p.get_or_add_pPr().set('algn', algn)
+                    for r in p.iterchildren(a_r):
+                        r.insert(0, deepcopy(rPr_template))
             else:
-                # Body: theme color + column-specific brightness from style.yaml
-                cell.fill.fore_color.theme_color = table_style.body_fill_theme
-                cell.fill.fore_color.brightness = table_style.get_body_brightness(c_idx)
-
-            # Apply text formatting
-            text_frame = cell.text_frame
-            
-            # Get style config based on row type
-            if is_header:
-                style_config = table_style.header
-            else:
-                style_config = table_style.body
-            
-            # Text margins
-            from pptx.util import Emu
-            text_frame.margin_left = Emu(style_config.margin_left_emu)
-            text_frame.margin_right = Emu(style_config.margin_right_emu)
-            text_frame.margin_top = Emu(style_config.margin_top_emu)
-            text_frame.margin_bottom = Emu(style_config.margin_bottom_emu)
-            
-            # Vertical alignment from style.yaml
-            v_align_str = style_config.vertical_align
-            
-            v_align_map = {
-                'top': MSO_ANCHOR.TOP,
-                'middle': MSO_ANCHOR.MIDDLE,
-                'bottom': MSO_ANCHOR.BOTTOM
-            }
-            text_frame.vertical_anchor = v_align_map.get(v_align_str, MSO_ANCHOR.MIDDLE)
-            
-            # Ensure vertical centering via OOXML (python-pptx API sometimes doesn't work)
-            from pptx.oxml.xmlchemy import OxmlElement
-            txBody = cell._tc.txBody
-            if txBody is not None:
-                bodyPr = txBody.bodyPr
-                if bodyPr is not None:
-                    ooxml_anchor = {'top': 't', 'middle': 'ctr', 'bottom': 'b'}.get(v_align_str, 'ctr')
-                    bodyPr.set('anchor', ooxml_anchor)
-
-            for para in text_frame.paragraphs:
-                # Horizontal alignment from style.yaml
-                h_align_str = style_config.horizontal_align
-                
-                h_align_map = {
-                    'left': PP_ALIGN.LEFT,
-                    'center': PP_ALIGN.CENTER,
-                    'right': PP_ALIGN.RIGHT,
-                    'justify': PP_ALIGN.JUSTIFY
-                }
-                para.alignment = h_align_map.get(h_align_str, PP_ALIGN.RIGHT)
-
-                for run in para.runs:
-                    if is_header:
-                        # Header: all attributes from style.yaml
-                        run.font.name = table_style.header.font_family
-                        run.font.size = Pt(table_style.header.font_size_pt)
-                        run.font.bold = table_style.header.font_bold
-                        run.font.italic = table_style.header.font_italic
-                        run.font.underline = table_style.header.font_underline
-                        run.font.color.theme_color = table_style.header_text_theme
-                        run.font.color.brightness = table_style.header_text_brightness
-                    else:
-                        # Body: all attributes from style.yaml
-                        run.font.name = table_style.body.font_family
-                        run.font.size = Pt(table_style.body.font_size_pt)
-                        run.font.bold = table_style.body.font_bold
-                        run.font.italic = table_style.body.font_italic
-                        run.font.underline = table_style.body.font_underline
-                        run.font.color.theme_color = table_style.body_text_theme
-                        run.font.color.brightness = table_style.body_text_brightness
-
-            # Apply borders
-            _apply_table_borders(cell, r_idx, c_idx, rows, cols)
+                # Single paragraph with one run (no run for empty text)
+                p = txBody.find(a_p)
+                p.get_or_add_pPr().set('algn', algn)
+                if cell_text:
+                    p.find(a_r).insert(0, deepcopy(rPr_template))
+
+            # Fill (header or column-specific body brightness) and borders
+            tcPr = tc.get_or_add_tcPr()
+            tcPr.append(deepcopy(header_fill if is_header else body_fills[c_idx]))
+            tcPr.extend(deepcopy(border_templates[
+                is_top_edge, is_bottom_edge, c_idx == 0, c_idx == last_col]))
 
     # Remove placeholder shape (only if not already removed by insert_table)
     if not placeholder_removed:
@@ -262,95 +235,151 @@ def create_styled_table(slide, placeholder_shape, spec: Dict[str, Any]):
             sp.getparent().remove(sp)
             logger.debug("Placeholder shape removed successfully")
         except Exception as e:
-            logger.warning(f"Could not remove placeholder shape: {e}")
+            logger.warning("Could not remove placeholder shape: %s", e)
 
     return table_shape
 
 
-def _apply_table_borders(cell, row_idx, col_idx, total_rows, total_cols):
-    """Apply borders to table cell according to style.yaml.
-
-    Borders:
-    - Outer edges: thick (1.5pt), PRIMARY color
-    - Inner edges: standard (1pt), PRIMARY color
-
-    Note: Requires OOXML manipulation as python-pptx has limited table border API.
-    """
-    from pptx.oxml.xmlchemy import OxmlElement
-    from pptx.util import Pt
+def _is_numeric_cell(value) -> bool:
+    """Whether a cell value parses as a number once formatting is stripped."""
+    # Remove common number formatting (commas, yen sign, units, etc.)
+    try:
+        float(str(value).strip().translate(_NUM_STRIP_TRANS))
+    except ValueError:
+        return False
+    return True
 
-    # Load style configuration
-    style = StyleConfig.load()
-    table_style = style.table
 
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
+def _format_number_text(cell_text: str) -> str:
+    """Add thousand separators to a numeric cell, keeping its unit suffix.
 
-    # Remove existing borders
-    for child in list(tcPr):
-        if child.tag.endswith(('lnL', 'lnR', 'lnT', 'lnB')):
-            tcPr.remove(child)
+    Matches patterns like "3500万", "1234567円", "98765"; other text is
+    returned unchanged.
+    """
+    match = _NUM_FMT_RE.match(cell_text.replace(',', ''))
+    if not match:
+        return cell_text
+    number_part = match.group(1)
+    suffix = match.group(2)  # unit like "万", "円", "%"
+    try:
+        # Parse as number and format with comma
+        num = float(number_part)
+    except ValueError:
+        return cell_text  # Keep original if parsing fails
+    if num == int(num):
+        formatted = f"{int(num):,}"
+    else:
+        formatted = f"{num:,}"
+    return formatted + suffix
+
+
+def _scheme_color_fill(theme_color, brightness):
+    """Build <a:solidFill> for a theme color with python-pptx brightness semantics."""
+    schemeClr = OxmlElement('a:schemeClr')
+    schemeClr.set('val', theme_color.xml_value)
+    if brightness > 0:
+        # Tint: lighter
+        lumMod = OxmlElement('a:lumMod')
+        lumMod.set('val', str(int(round((1.0 - brightness) * 100000.0))))
+        schemeClr.append(lumMod)
+        lumOff = OxmlElement('a:lumOff')
+        lumOff.set('val', str(int(round(brightness * 100000.0))))
+        schemeClr.append(lumOff)
+    elif brightness < 0:
+        # Shade: darker
+        lumMod = OxmlElement('a:lumMod')
+        lumMod.set('val', str(int(round((1.0 + brightness) * 100000.0))))
+        schemeClr.append(lumMod)
+    solidFill = OxmlElement('a:solidFill')
+    solidFill.append(schemeClr)
+    return solidFill
+
+
+def _table_cell_context(section, text_theme, text_brightness) -> Dict[str, Any]:
+    """Resolve the per-cell XML of a table section (header or body) once.
+
+    Returns the <a:bodyPr> attributes (non-default insets, anchor), the
+    paragraph alignment and an <a:rPr> template to copy into each run.
+    """
+    margins = (Emu(section.margin_left_emu), Emu(section.margin_right_emu),
+               Emu(section.margin_top_emu), Emu(section.margin_bottom_emu))
+    body_pr_attrs = [(attr, str(int(value)))
+                     for (attr, default), value in zip(_BODY_PR_INSETS, margins)
+                     if value != default]
+    body_pr_attrs.append(('anchor', _TABLE_OOXML_ANCHOR_MAP.get(section.vertical_align, 'ctr')))
+
+    rPr = OxmlElement('a:rPr')
+    rPr.set('sz', str(Pt(section.font_size_pt).centipoints))
+    for attr, value in (('b', section.font_bold), ('i', section.font_italic)):
+        if value is not None:
+            rPr.set(attr, '1' if value else '0')
+    underline = section.font_underline
+    if underline is not None:
+        if underline is True:
+            rPr.set('u', 'sng')
+        elif underline is False:
+            rPr.set('u', 'none')
+        else:
+            rPr.set('u', underline.xml_value)
+    rPr.append(_scheme_color_fill(text_theme, text_brightness))
+    if section.font_family is not None:
+        latin = OxmlElement('a:latin')
+        latin.set('typeface', section.font_family)
+        rPr.append(latin)
+
+    return {
+        'body_pr_attrs': body_pr_attrs,
+        'algn': _TABLE_H_ALIGN_MAP.get(section.horizontal_align, PP_ALIGN.RIGHT).xml_value,
+        'rPr': rPr,
+    }
 
-    # Determine if this is an outer edge
-    is_left_edge = col_idx == 0
-    is_right_edge = col_idx == total_cols - 1
-    is_top_edge = row_idx == 0
-    is_bottom_edge = row_idx == total_rows - 1
 
-    # Get border color from style.yaml (theme color reference)
+def _table_border_color(table_style):
+    """Resolve the table border (theme name, brightness) from style.yaml."""
     border_config = table_style.get('border', {}) if hasattr(table_style, 'get') else getattr(table_style, 'border', {})
     border_theme = border_config.get('color_theme', 'ACCENT_1') if isinstance(border_config, dict) else getattr(border_config, 'color_theme', 'ACCENT_1')
     border_brightness = border_config.get('color_brightness', 0.0) if isinstance(border_config, dict) else getattr(border_config, 'color_brightness', 0.0)
+    return border_theme, border_brightness
 
-    # Helper to create border line element with theme color
-    def create_border(width_pt):
-        ln = OxmlElement('a:ln')
-        ln.set('w', str(int(width_pt * 12700)))  # Convert pt to EMU
-        
-        solidFill = OxmlElement('a:solidFill')
-        
-        # Use theme color instead of RGB
-        schemeClr = OxmlElement('a:schemeClr')
-        theme_color_map = {
-            'ACCENT_1': 'accent1',
-            'LIGHT_1': 'lt1',
-            'DARK_1': 'dk1',
-            'bg1': 'bg1',
-            'tx1': 'tx1'
-        }
-        schemeClr.set('val', theme_color_map.get(border_theme, 'accent1'))
-        
-        # Apply brightness if needed
-        if border_brightness != 0.0:
-            lumMod = OxmlElement('a:lumMod')
-            lumMod.set('val', str(int((1.0 + border_brightness) * 100000)))
-            schemeClr.append(lumMod)
-        
-        solidFill.append(schemeClr)
-        ln.append(solidFill)
-        
-        return ln
-
-    # Apply borders
-    # Left border
-    lnL = create_border(1.5 if is_left_edge else 1.0)
-    lnL.tag = '{http://schemas.openxmlformats.org/drawingml/2006/main}lnL'
-    tcPr.append(lnL)
-
-    # Right border
-    lnR = create_border(1.5 if is_right_edge else 1.0)
-    lnR.tag = '{http://schemas.openxmlformats.org/drawingml/2006/main}lnR'
-    tcPr.append(lnR)
-
-    # Top border
-    lnT = create_border(1.5 if is_top_edge else 1.0)
-    lnT.tag = '{http://schemas.openxmlformats.org/drawingml/2006/main}lnT'
-    tcPr.append(lnT)
-
-    # Bottom border
-    lnB = create_border(1.5 if is_bottom_edge else 1.0)
-    lnB.tag = '{http://schemas.openxmlformats.org/drawingml/2006/main}lnB'
-    tcPr.append(lnB)
+
+@functools.lru_cache(maxsize=8)
+def _table_border_templates(border_theme, border_brightness) -> Dict[tuple, Any]:
+    """Build the table cell border elements according to style.yaml.
+
+    Borders:
+    - Outer edges: thick (1.5pt), PRIMARY color
+    - Inner edges: standard (1pt), PRIMARY color
+
+    Returns {(is_top, is_bottom, is_left, is_right): <a:tcPr>} holding the
+    lnL/lnR/lnT/lnB of every edge combination; the caller deep-copies the
+    matching template and moves its four children into each cell's <a:tcPr>.
+    Cached per border color, so the templates must not be modified in place.
+
+    Note: Requires OOXML manipulation as python-pptx has limited table border API.
+    """
+    scheme_val = _TABLE_BORDER_THEME_MAP.get(border_theme, 'accent1')
+    # Apply brightness if needed
+    lum_mod = ''
+    if border_brightness != 0.0:
+        lum_mod = '<a:lumMod val="%d"/>' % int((1.0 + border_brightness) * 100000)
+
+    # Border line XML per (side, is_outer); width converted from pt to EMU
+    lines = {
+        (tag, is_outer): _TABLE_BORDER_LINE_XML.format(
+            tag=tag, width=int((1.5 if is_outer else 1.0) * 12700),
+            scheme_val=scheme_val, lum_mod=lum_mod)
+        for tag in ('lnL', 'lnR', 'lnT', 'lnB') for is_outer in (False, True)
+    }
+
+    # One parse per edge combination
+    templates = {}
+    for is_top, is_bottom, is_left, is_right in itertools.product((False, True), repeat=4):
+        templates[is_top, is_bottom, is_left, is_right] = parse_xml(
+            '<a:tcPr %s>%s%s%s%s</a:tcPr>' % (
+                nsdecls('a'),
+                lines['lnL', is_left], lines['lnR', is_right],
+                lines['lnT', is_top], lines['lnB', is_bottom]))
+    return templates
 
 
 def create_styled_chart(slide, placeholder_shape, spec: Dict[str, Any]):
@@ -377,10 +406,11 @@ def create_styled_chart(slide, placeholder_shape, spec: Dict[str, Any]):
         - Data labels from style.yaml data_labels
     """
     logger = get_logger()
-    logger.info(f"Creating styled chart (type: {spec.get('chart_kind', 'line')})")
+    logger.info("Creating styled chart (type: %s)", spec.get('chart_kind', 'line'))
 
     # Create generation snapshot (once per session)
-    _ensure_snapshot_created()
+    if not _SNAPSHOT_CREATED:
+        _ensure_snapshot_created()
 
     # Load style configuration
     style = StyleConfig.load()
@@ -404,22 +434,29 @@ def create_styled_chart(slide, placeholder_shape, spec: Dict[str, Any]):
         series_values = series_spec.get('values', [])
 
         if not series_values:
-            logger.error(f"Series '{series_name}' has no values")
+            logger.error("Series '%s' has no values", series_name)
             raise ValueError(f"Series '{series_name}' must have values")
 
         if len(series_values) != len(categories):
-            logger.error(f"Series '{series_name}' has {len(series_values)} values, expected {len(categories)}")
+            logger.error("Series '%s' has %s values, expected %s", series_name, len(series_values), len(categories))
             raise ValueError(f"Series '{series_name}' must have same length as categories ({len(categories)})")
 
-        # Validate numeric values
-        for val_idx, val in enumerate(series_values):
-            try:
-                float(val)
-            except (ValueError, TypeError):
-                logger.error(f"Series '{series_name}' value at index {val_idx} is not numeric: {val}")
-                raise ValueError(f"Series '{series_name}' contains non-numeric value: {val}")
+        # Validate numeric values (one C-level pass; locate the bad value only on failure)
+        try:
+            list(map(float, series_values))
+        except (ValueError, TypeError):
+            for val_idx, val in enumerate(series_values):
+                try:
+                    float(val)
+                except (ValueError, TypeError):
+                    logger.error("Series '%s' value at index %s is not numeric: %s", series_name, val_idx, val)
+                    raise ValueError(f"Series '{series_name}' contains non-numeric value: {val}")
+
+    logger.debug("Chart validated: %s categories, %s series", len(categories), len(series_specs))
 
-    logger.debug(f"Chart validated: {len(categories)} categories, {len(series_specs)} series")
+    # Chart-only imports (pptx.chart.data pulls in the xlsx writer)
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
 
     # Map chart_kind to XL_CHART_TYPE
     chart_type_map = {
@@ -475,16 +512,18 @@ def create_styled_chart(slide, placeholder_shape, spec: Dict[str, Any]):
 
     # Apply .crtx template styling
     # Chart.crtx is the Single Source of Truth for chart styling
-    if not CRTX_AVAILABLE:
+    try:
+        from scripts.crtx_utils import extract_crtx_styling, apply_crtx_styling_to_chart
+    except ImportError:
         logger.error("crtx_utils not available - required for chart styling")
         raise RuntimeError("crtx_utils not available - required for chart styling")
 
     # Load chart template styling
     if not CHART_CRTX_PATH.exists():
-        logger.error(f"Chart template not found at {CHART_CRTX_PATH}")
+        logger.error("Chart template not found at %s", CHART_CRTX_PATH)
         raise FileNotFoundError(f"Chart template not found at {CHART_CRTX_PATH}")
 
-    logger.debug(f"Loading chart template from {CHART_CRTX_PATH}")
+    logger.debug("Loading chart template from %s", CHART_CRTX_PATH)
     crtx_styling = extract_crtx_styling(str(CHART_CRTX_PATH))
 
     # Apply styling (area charts have special handling in apply_crtx_styling_to_chart)
@@ -499,7 +538,7 @@ def create_styled_chart(slide, placeholder_shape, spec: Dict[str, Any]):
             sp.getparent().remove(sp)
             logger.debug("Placeholder shape removed successfully")
         except Exception as e:
-            logger.warning(f"Could not remove placeholder shape: {e}")
+            logger.warning("Could not remove placeholder shape: %s", e)
 
     return chart_shape
 
@@ -594,7 +633,7 @@ def create_styled_diagram(slide, placeholder_shape, spec: Dict[str, Any]):
             sp.getparent().remove(sp)
             logger.debug("Placeholder shape removed successfully")
         except Exception as e:
-            logger.warning(f"Could not remove placeholder shape: {e}")
+            logger.warning("Could not remove placeholder shape: %s", e)
 
     return created_shapes
 
@@ -618,6 +657,6 @@ def _ensure_snapshot_created():
         create_generation_snapshot()
         _SNAPSHOT_CREATED = True
     except Exception as e:
-        logger.warning(f"Failed to create generation snapshot: {e}")
+        logger.warning("Failed to create generation snapshot: %s", e)
         # Don't fail the entire generation if snapshot fails
         _SNAPSHOT_CREATED = True  # Don't retry
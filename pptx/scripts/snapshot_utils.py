@@ -14,6 +14,25 @@ from typing import Optional
 from scripts.logging_utils import get_logger
 
 
+def _copy_file(src: str, dst: str) -> None:
+    """Copy src to dst and carry over its access/modification times.
+
+    Unlike shutil.copy2 only the timestamps are copied, not the permission bits.
+    """
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _scan_dir(path: str) -> dict:
+    """Map entry name -> os.DirEntry for a directory ({} if it does not exist)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
 def create_generation_snapshot(project_dir: Optional[str] = None) -> None:
     """Create snapshot of templates used at generation time.
 
@@ -41,7 +60,7 @@ def create_generation_snapshot(project_dir: Optional[str] = None) -> None:
 
     # Create snapshot directory
     os.makedirs(snapshot_dir, exist_ok=True)
-    logger.info(f"Creating generation snapshot in {snapshot_dir}")
+    logger.info("Creating generation snapshot in %s", snapshot_dir)
 
     # Template files to snapshot
     files_to_copy = [
@@ -51,35 +70,55 @@ def create_generation_snapshot(project_dir: Optional[str] = None) -> None:
         ('TEMPLATE.md', 'Layout documentation'),
     ]
 
-    # Copy each file
+    # One directory read each tells which sources exist and which snapshot
+    # copies are already present
+    template_entries = _scan_dir(skill_templates)
+    snapshot_entries = _scan_dir(snapshot_dir)
+
     for filename, description in files_to_copy:
         src = os.path.join(skill_templates, filename)
         dst = os.path.join(snapshot_dir, filename)
 
-        if not os.path.exists(src):
-            logger.warning(f"{description} not found: {src}")
+        src_entry = template_entries.get(filename)
+        if src_entry is None:
+            logger.warning("%s not found: %s", description, src)
+            continue
+
+        # _copy_file() keeps the source mtime, so an unchanged source matches
+        # the previous snapshot's copy
+        dst_entry = snapshot_entries.get(filename)
+        try:
+            src_stat = src_entry.stat()
+            dst_stat = dst_entry.stat() if dst_entry is not None else None
+        except OSError:
+            dst_stat = None
+        if (dst_stat is not None and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+                and dst_stat.st_size == src_stat.st_size):
+            logger.debug("%s unchanged, keeping snapshot copy: %s", description, filename)
             continue
 
         try:
-            shutil.copy2(src, dst)
-            logger.debug(f"Copied {description}: {filename}")
+            _copy_file(src, dst)
+            logger.debug("Copied %s: %s", description, filename)
         except Exception as e:
-            logger.error(f"Failed to copy {filename}: {e}")
+            logger.error("Failed to copy %s: %s", filename, e)
 
     # Create timestamp file
     timestamp_path = os.path.join(snapshot_dir, 'timestamp.txt')
     try:
-        with open(timestamp_path, 'w', encoding='utf-8') as f:
-            f.write(f"Generation Timestamp: {datetime.now().isoformat()}\n")
-            f.write(f"Skill Templates Path: {skill_templates}\n")
-            f.write(f"Project Directory: {project_dir}\n")
-            f.write(f"\nPurpose: Audit trail of templates/styles used at generation time\n")
-            f.write(f"Note: Regeneration always uses latest templates from skill directory\n")
-        logger.debug(f"Created timestamp file: {timestamp_path}")
+        Path(timestamp_path).write_text(
+            f"Generation Timestamp: {datetime.now().isoformat()}\n"
+            f"Skill Templates Path: {skill_templates}\n"
+            f"Project Directory: {project_dir}\n"
+            "\nPurpose: Audit trail of templates/styles used at generation time\n"
+            "Note: Regeneration always uses latest templates from skill directory\n",
+            encoding='utf-8'
+        )
+        logger.debug("Created timestamp file: %s", timestamp_path)
     except Exception as e:
-        logger.error(f"Failed to create timestamp file: {e}")
+        logger.error("Failed to create timestamp file: %s", e)
 
-    logger.info(f"✅ Generation snapshot created successfully")
+    logger.info("✅ Generation snapshot created successfully")
 
 
 def get_snapshot_info(project_dir: Optional[str] = None) -> dict:
@@ -99,13 +138,17 @@ def get_snapshot_info(project_dir: Optional[str] = None) -> dict:
 
     snapshot_dir = os.path.join(project_dir, 'powerpoint', 'processing', 'snapshot')
 
-    if not os.path.exists(snapshot_dir):
+    # One directory read answers both the existence and file-listing checks
+    try:
+        with os.scandir(snapshot_dir) as it:
+            entries = list(it)
+    except (FileNotFoundError, NotADirectoryError):
         return {'exists': False}
 
     # Read timestamp
     timestamp_path = os.path.join(snapshot_dir, 'timestamp.txt')
     timestamp = None
-    if os.path.exists(timestamp_path):
+    if any(entry.name == 'timestamp.txt' for entry in entries):
         try:
             with open(timestamp_path, 'r', encoding='utf-8') as f:
                 first_line = f.readline().strip()
@@ -115,9 +158,7 @@ def get_snapshot_info(project_dir: Optional[str] = None) -> dict:
             pass
 
     # List files
-    files = []
-    if os.path.exists(snapshot_dir):
-        files = [f for f in os.listdir(snapshot_dir) if os.path.isfile(os.path.join(snapshot_dir, f))]
+    files = [entry.name for entry in entries if entry.is_file()]
 
     return {
         'exists': True,
@@ -24,27 +24,147 @@ Usage:
     position = config.legend.position  # XL_LEGEND_POSITION.BOTTOM
 """
 
+from __future__ import annotations
+
+import functools
 import os
 import yaml
-from typing import Dict, Any, Optional
-
-from pptx.dml.color import RGBColor
-from pptx.enum.dml import MSO_THEME_COLOR
-from pptx.enum.chart import XL_LEGEND_POSITION
-from pptx.util import Pt
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from pptx.dml.color import RGBColor
+    from pptx.enum.dml import MSO_THEME_COLOR
+    from pptx.enum.chart import XL_LEGEND_POSITION
+    from pptx.util import Pt
+
+# python-pptx is imported on first use by _import_pptx(), so loading
+# style.yaml and reading plain values (colors, flowchart, ...) doesn't pay
+# its import cost
+_PPTX_IMPORTED = False
+
+# LibYAML-backed loader when available (much faster than the pure-Python one)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from scripts.cache_utils import file_cache_key, read_json_cache, write_json_cache
+except ImportError:
+    from cache_utils import file_cache_key, read_json_cache, write_json_cache
+
+# Master style.yaml (expanded once at import)
+_MASTER_STYLE_PATH = os.path.join(
+    os.path.expanduser('~/.claude/skills/pptx/templates'),
+    'style.yaml'
+)
+
+# Parsed style.yaml data, keyed by real path and validated by (st_mtime_ns, st_size).
+# The parsed data is shared between StyleConfig instances and must not be mutated.
+_STYLE_DATA_MEMO: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+# Across processes the parsed data is served from a JSON copy (cache_utils);
+# bump the version if what is stored for a style.yaml changes
+_STYLE_DATA_CACHE_VERSION = 1
+
+# Marks a missing key in AttrDict attribute lookups
+_MISSING = object()
+
+
+def _import_pptx() -> None:
+    """Import python-pptx and build the lookup tables using it.
+
+    Runs once; everything is bound as module globals.
+    """
+    global _PPTX_IMPORTED, RGBColor, MSO_THEME_COLOR, XL_LEGEND_POSITION, Pt
+    global _THEME_COLOR_MAP, _LEGEND_POSITION_MAP
+    if _PPTX_IMPORTED:
+        return
+
+    from pptx.dml.color import RGBColor
+    from pptx.enum.dml import MSO_THEME_COLOR
+    from pptx.enum.chart import XL_LEGEND_POSITION
+    from pptx.util import Pt
+
+    # OOXML theme color name -> MSO_THEME_COLOR (used by _theme_color)
+    _THEME_COLOR_MAP = {
+        'tx1': MSO_THEME_COLOR.TEXT_1,
+        'tx2': MSO_THEME_COLOR.TEXT_2,
+        'bg1': MSO_THEME_COLOR.BACKGROUND_1,
+        'bg2': MSO_THEME_COLOR.BACKGROUND_2,
+        'accent1': MSO_THEME_COLOR.ACCENT_1,
+        'accent2': MSO_THEME_COLOR.ACCENT_2,
+        'accent3': MSO_THEME_COLOR.ACCENT_3,
+        'accent4': MSO_THEME_COLOR.ACCENT_4,
+        'accent5': MSO_THEME_COLOR.ACCENT_5,
+        'accent6': MSO_THEME_COLOR.ACCENT_6,
+        'dk1': MSO_THEME_COLOR.DARK_1,
+        'dk2': MSO_THEME_COLOR.DARK_2,
+        'lt1': MSO_THEME_COLOR.LIGHT_1,
+        'lt2': MSO_THEME_COLOR.LIGHT_2,
+    }
+
+    # style.yaml legend position -> XL_LEGEND_POSITION (used by LegendConfig.position)
+    _LEGEND_POSITION_MAP = {
+        'bottom': XL_LEGEND_POSITION.BOTTOM,
+        'top': XL_LEGEND_POSITION.TOP,
+        'left': XL_LEGEND_POSITION.LEFT,
+        'right': XL_LEGEND_POSITION.RIGHT,
+    }
+
+    _PPTX_IMPORTED = True
+
+
+def _theme_color(theme_name: str) -> MSO_THEME_COLOR:
+    """Theme name (tx1, bg1, accent1, ...) -> MSO_THEME_COLOR (BACKGROUND_1 if unknown)."""
+    _import_pptx()
+    return _THEME_COLOR_MAP.get(theme_name, MSO_THEME_COLOR.BACKGROUND_1)
+
+
+def _load_style_data(yaml_path: str) -> Dict[str, Any]:
+    """Parse style.yaml, reusing the parsed result while the file is unchanged.
+
+    Looks in the in-process memo first, then in the JSON cache (JSON loads
+    much faster than YAML), and parses the YAML only when both miss.
+    """
+    st = os.stat(yaml_path)
+    key = os.path.realpath(yaml_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    entry = _STYLE_DATA_MEMO.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    cache_key = file_cache_key(yaml_path, _STYLE_DATA_CACHE_VERSION)
+    style_data = read_json_cache('style_data', yaml_path, cache_key)
+    if style_data is None:
+        with open(yaml_path, 'rb') as f:
+            style_data = yaml.load(f, Loader=_YamlLoader)
+        write_json_cache('style_data', yaml_path, cache_key, style_data)
+
+    _STYLE_DATA_MEMO[key] = (stamp, style_data)
+    return style_data
 
 
 class AttrDict(dict):
-    """Dictionary that allows attribute access."""
+    """Dictionary that allows attribute access.
+
+    Nested dicts are converted to AttrDict once, on construction, so reads
+    never re-wrap them. Keys are only consulted when normal attribute lookup
+    fails, so a key named like a dict method (get, items, ...) never shadows it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for key, value in self.items():
+            if isinstance(value, dict) and not isinstance(value, AttrDict):
+                self[key] = AttrDict(value)
 
     def __getattr__(self, key):
-        try:
-            value = self[key]
-            if isinstance(value, dict):
-                return AttrDict(value)
-            return value
-        except KeyError:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
+        return value
 
 
 class StyleConfig:
@@ -56,6 +176,11 @@ class StyleConfig:
     def __init__(self, style_data: Dict[str, Any]):
         self._style_data = style_data
 
+    @staticmethod
+    def default_path() -> str:
+        """Path of the master style.yaml used when load() gets no path."""
+        return _MASTER_STYLE_PATH
+
     @classmethod
     def load(cls, yaml_path: Optional[str] = None) -> 'StyleConfig':
         """Load style.yaml and return StyleConfig instance.
@@ -69,70 +194,64 @@ class StyleConfig:
         Returns:
             StyleConfig instance
         """
-        if yaml_path is None:
-            # Always use master template
-            yaml_path = os.path.join(
-                os.path.expanduser('~/.claude/skills/pptx/templates'),
-                'style.yaml'
-            )
-
-            if not os.path.exists(yaml_path):
-                raise FileNotFoundError(
-                    "Master style.yaml not found. Please generate it with:\n"
-                    "  cd ~/.claude/skills/pptx && python scripts/extract_style.py"
-                )
-
-        with open(yaml_path, 'r') as f:
-            style_data = yaml.safe_load(f)
+        if yaml_path is not None:
+            return cls(_load_style_data(yaml_path))
 
-        return cls(style_data)
-
-    @property
+        # Always use master template
+        try:
+            return cls(_load_style_data(cls.default_path()))
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                "Master style.yaml not found. Please generate it with:\n"
+                "  cd ~/.claude/skills/pptx && python -m scripts.extract_style"
+            ) from None
+
+    @functools.cached_property
     def colors(self) -> AttrDict:
         """Get colors section."""
         return AttrDict(self._style_data.get('colors', {}))
 
-    @property
+    @functools.cached_property
     def category_axis(self) -> 'AxisConfig':
         """Get category axis configuration."""
         return AxisConfig(self._style_data.get('category_axis', {}))
 
-    @property
+    @functools.cached_property
     def value_axis(self) -> 'AxisConfig':
         """Get value axis configuration."""
         return AxisConfig(self._style_data.get('value_axis', {}))
 
-    @property
+    @functools.cached_property
     def legend(self) -> 'LegendConfig':
         """Get legend configuration."""
         return LegendConfig(self._style_data.get('legend', {}))
 
-    @property
+    @functools.cached_property
     def gridlines(self) -> AttrDict:
         """Get gridlines configuration."""
         return AttrDict(self._style_data.get('gridlines', {}))
 
-    @property
+    @functools.cached_property
     def table(self) -> 'TableConfig':
         """Get table configuration."""
         return TableConfig(self._style_data.get('table', {}))
 
-    @property
+    @functools.cached_property
     def diagram(self) -> AttrDict:
         """Get diagram configuration."""
         return AttrDict(self._style_data.get('diagram', {}))
 
-    @property
+    @functools.cached_property
     def mermaid(self) -> AttrDict:
         """Get mermaid configuration."""
         return AttrDict(self._style_data.get('mermaid', {}))
 
-    @property
+    @functools.cached_property
     def shape(self) -> AttrDict:
         """Get shape configuration."""
         return AttrDict(self._style_data.get('shape', {}))
 
-    @property
+    @functools.cached_property
     def flowchart(self) -> AttrDict:
         """Get flowchart configuration."""
         return AttrDict(self._style_data.get('flowchart', {}))
@@ -146,15 +265,12 @@ class StyleConfig:
         Returns:
             RGBColor for the series
         """
-        series_list = self._style_data.get('colors', {}).get('series', [])
-
-        if index < len(series_list):
-            series = series_list[index]
-            if series.get('type') == 'rgb':
-                return self.hex_to_rgb(series.get('value', '#000000'))
+        series_rgbs, primary_rgb = self._series_rgb_table
+        if index < len(series_rgbs):
+            return series_rgbs[index]
 
         # Default: primary color
-        return self.hex_to_rgb(self._style_data.get('colors', {}).get('primary', '#4F4F70'))
+        return primary_rgb
 
     def get_series_theme(self, index: int) -> Dict[str, Any]:
         """Get series theme color info.
@@ -165,24 +281,40 @@ class StyleConfig:
         Returns:
             Dict with 'theme_color' (MSO_THEME_COLOR) and 'brightness' (float)
         """
-        series_list = self._style_data.get('colors', {}).get('series', [])
-
-        if index < len(series_list):
-            series = series_list[index]
-            if series.get('type') == 'theme':
-                theme_color = self.get_theme_color(series.get('value', 'bg1'))
-                brightness = series.get('brightness', 0)
-                return {
-                    'theme_color': theme_color,
-                    'brightness': brightness
-                }
-
-        # Default: BACKGROUND_1 with no brightness
+        series_themes = self._series_theme_table
+        if index < len(series_themes):
+            theme_color, brightness = series_themes[index]
+        else:
+            # Default: BACKGROUND_1 with no brightness
+            theme_color, brightness = MSO_THEME_COLOR.BACKGROUND_1, 0
         return {
-            'theme_color': MSO_THEME_COLOR.BACKGROUND_1,
-            'brightness': 0
+            'theme_color': theme_color,
+            'brightness': brightness
         }
 
+    @functools.cached_property
+    def _series_rgb_table(self) -> Tuple[List[RGBColor], RGBColor]:
+        """Per-series RGBColor (primary for non-rgb entries) and the primary color."""
+        colors = self._style_data.get('colors', {})
+        primary_rgb = self.hex_to_rgb(colors.get('primary', '#4F4F70'))
+        series_rgbs = [
+            self.hex_to_rgb(series.get('value', '#000000')) if series.get('type') == 'rgb'
+            else primary_rgb
+            for series in colors.get('series', [])
+        ]
+        return series_rgbs, primary_rgb
+
+    @functools.cached_property
+    def _series_theme_table(self) -> List[Tuple[MSO_THEME_COLOR, float]]:
+        """Per-series (theme color, brightness); (BACKGROUND_1, 0) for non-theme entries."""
+        _import_pptx()
+        return [
+            (_theme_color(series.get('value', 'bg1')), series.get('brightness', 0))
+            if series.get('type') == 'theme'
+            else (MSO_THEME_COLOR.BACKGROUND_1, 0)
+            for series in self._style_data.get('colors', {}).get('series', [])
+        ]
+
     def get_data_label_style(self, index: int) -> Dict[str, Any]:
         """Get data label style for series.
 
@@ -212,46 +344,54 @@ class StyleConfig:
         Returns:
             MSO_THEME_COLOR enum value
         """
-        theme_map = {
-            'tx1': MSO_THEME_COLOR.TEXT_1,
-            'tx2': MSO_THEME_COLOR.TEXT_2,
-            'bg1': MSO_THEME_COLOR.BACKGROUND_1,
-            'bg2': MSO_THEME_COLOR.BACKGROUND_2,
-            'accent1': MSO_THEME_COLOR.ACCENT_1,
-            'accent2': MSO_THEME_COLOR.ACCENT_2,
-            'accent3': MSO_THEME_COLOR.ACCENT_3,
-            'accent4': MSO_THEME_COLOR.ACCENT_4,
-            'accent5': MSO_THEME_COLOR.ACCENT_5,
-            'accent6': MSO_THEME_COLOR.ACCENT_6,
-            'dk1': MSO_THEME_COLOR.DARK_1,
-            'dk2': MSO_THEME_COLOR.DARK_2,
-            'lt1': MSO_THEME_COLOR.LIGHT_1,
-            'lt2': MSO_THEME_COLOR.LIGHT_2,
-        }
-        return theme_map.get(theme_name, MSO_THEME_COLOR.BACKGROUND_1)
+        return _theme_color(theme_name)
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def hex_to_rgb(hex_color: str) -> RGBColor:
         """Convert hex color string to RGBColor.
 
+        Results are cached (RGBColor is an immutable tuple); palette colors
+        repeat across series and tables.
+
         Args:
             hex_color: Hex color string (e.g., '#4F4F70' or '4F4F70')
 
         Returns:
             RGBColor object
         """
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
+        r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
+        _import_pptx()
         return RGBColor(r, g, b)
 
 
+@dataclass(frozen=True, slots=True)
+class AxisSnapshot:
+    """All AxisConfig values, resolved in one pass (see AxisConfig.snapshot)."""
+    visible: bool
+    tick_marks: str
+    line_width: Pt
+    line_color_type: str
+    line_color_value: str
+    line_brightness: float
+    font_size: Pt
+    font_color_type: str
+    font_color_value: str
+    font_brightness: float
+
+
 class AxisConfig:
     """Configuration for chart axis."""
 
+    __slots__ = ('_data', '_line', '_font', '_line_width', '_font_size')
+
     def __init__(self, axis_data: Dict[str, Any]):
+        _import_pptx()
         self._data = axis_data
+        self._line = axis_data.get('line') or {}
+        self._font = axis_data.get('font') or {}
+        self._line_width = Pt(self._line.get('width_pt', 0.75))
+        self._font_size = Pt(self._font.get('size_pt', 11))
 
     @property
     def visible(self) -> bool:
@@ -266,56 +406,70 @@ class AxisConfig:
     @property
     def line_width(self) -> Pt:
         """Line width as Pt."""
-        line = self._data.get('line', {})
-        width_pt = line.get('width_pt', 0.75)
-        return Pt(width_pt)
+        return self._line_width
 
     @property
     def line_color_type(self) -> str:
         """Line color type (rgb or theme)."""
-        line = self._data.get('line', {})
-        return line.get('color_type', 'theme')
+        return self._line.get('color_type', 'theme')
 
     @property
     def line_color_value(self) -> str:
         """Line color value."""
-        line = self._data.get('line', {})
-        return line.get('color_value', 'tx1')
+        return self._line.get('color_value', 'tx1')
 
     @property
     def line_brightness(self) -> float:
         """Line brightness."""
-        line = self._data.get('line', {})
-        return line.get('brightness', 0)
+        return self._line.get('brightness', 0)
 
     @property
     def font_size(self) -> Pt:
         """Font size as Pt."""
-        font = self._data.get('font', {})
-        size_pt = font.get('size_pt', 11)
-        return Pt(size_pt)
+        return self._font_size
 
     @property
     def font_color_type(self) -> str:
         """Font color type."""
-        font = self._data.get('font', {})
-        return font.get('color_type', 'theme')
+        return self._font.get('color_type', 'theme')
 
     @property
     def font_color_value(self) -> str:
         """Font color value."""
-        font = self._data.get('font', {})
-        return font.get('color_value', 'tx1')
+        return self._font.get('color_value', 'tx1')
 
     @property
     def font_brightness(self) -> float:
         """Font brightness."""
-        font = self._data.get('font', {})
-        return font.get('brightness', 0)
+        return self._font.get('brightness', 0)
+
+    def snapshot(self) -> AxisSnapshot:
+        """Read every axis setting at once into an immutable AxisSnapshot.
+
+        Use when building a chart axis instead of reading the properties
+        one by one.
+        """
+        line = self._line
+        font = self._font
+        return AxisSnapshot(
+            visible=self._data.get('visible', True),
+            tick_marks=self._data.get('tick_marks', 'none'),
+            line_width=self._line_width,
+            line_color_type=line.get('color_type', 'theme'),
+            line_color_value=line.get('color_value', 'tx1'),
+            line_brightness=line.get('brightness', 0),
+            font_size=self._font_size,
+            font_color_type=font.get('color_type', 'theme'),
+            font_color_value=font.get('color_value', 'tx1'),
+            font_brightness=font.get('brightness', 0),
+        )
 
 
 class TableHeaderConfig:
     """Configuration for table header."""
+
+    __slots__ = ('_data',)
+
     def __init__(self, header_data: Dict[str, Any]):
         self._data = header_data
     
@@ -366,6 +520,9 @@ class TableHeaderConfig:
 
 class TableBodyConfig:
     """Configuration for table body."""
+
+    __slots__ = ('_data',)
+
     def __init__(self, body_data: Dict[str, Any]):
         self._data = body_data
     
@@ -414,87 +571,106 @@ class TableBodyConfig:
         return self._data.get('margin_bottom_emu', 45720)
 
 
+@dataclass(frozen=True, slots=True)
+class TableSnapshot:
+    """Table-level TableConfig values, resolved in one pass (see TableConfig.snapshot)."""
+    border_color: RGBColor
+    border_width_outer: Pt
+    border_width_inner: Pt
+    header_fill_theme: MSO_THEME_COLOR
+    header_fill_brightness: float
+    header_text_theme: MSO_THEME_COLOR
+    header_text_brightness: float
+    header_font_bold: bool
+    header_font_size: Pt
+    body_fill_theme: MSO_THEME_COLOR
+    body_text_theme: MSO_THEME_COLOR
+    body_text_brightness: float
+    body_font_size: Pt
+    alignment: str
+
+
 class TableConfig:
     """Configuration for table styling."""
 
+    __slots__ = ('_data', '_header', '_body', '_border', '_border_width_outer',
+                 '_border_width_inner', '_header_font_size', '_body_font_size')
+
     def __init__(self, table_data: Dict[str, Any]):
+        _import_pptx()
         self._data = table_data
+        self._header = table_data.get('header') or {}
+        self._body = table_data.get('body') or {}
+        self._border = table_data.get('border') or {}
+        self._border_width_outer = Pt(self._border.get('width_outer_pt', 1.5))
+        self._border_width_inner = Pt(self._border.get('width_inner_pt', 1.0))
+        self._header_font_size = Pt(self._header.get('font_size_pt', 12))
+        self._body_font_size = Pt(self._body.get('font_size_pt', 12))
 
     @property
     def header(self) -> TableHeaderConfig:
         """Header configuration."""
-        return TableHeaderConfig(self._data.get('header', {}))
+        return TableHeaderConfig(self._header)
     
     @property
     def body(self) -> TableBodyConfig:
         """Body configuration."""
-        return TableBodyConfig(self._data.get('body', {}))
+        return TableBodyConfig(self._body)
 
     @property
     def border_color(self) -> RGBColor:
         """Border color as RGBColor."""
-        border = self._data.get('border', {})
-        hex_color = border.get('color', '#4F4F70')
+        hex_color = self._border.get('color', '#4F4F70')
         return StyleConfig.hex_to_rgb(hex_color)
 
     @property
     def border_width_outer(self) -> Pt:
         """Outer border width."""
-        border = self._data.get('border', {})
-        return Pt(border.get('width_outer_pt', 1.5))
+        return self._border_width_outer
 
     @property
     def border_width_inner(self) -> Pt:
         """Inner border width."""
-        border = self._data.get('border', {})
-        return Pt(border.get('width_inner_pt', 1.0))
+        return self._border_width_inner
 
     @property
     def header_fill_theme(self) -> MSO_THEME_COLOR:
         """Header fill theme color."""
-        header = self._data.get('header', {})
-        return StyleConfig.get_theme_color(header.get('fill_theme', 'bg1'))
+        return _theme_color(self._header.get('fill_theme', 'bg1'))
 
     @property
     def header_fill_brightness(self) -> float:
         """Header fill brightness."""
-        header = self._data.get('header', {})
-        return header.get('fill_brightness', -0.5)
+        return self._header.get('fill_brightness', -0.5)
 
     @property
     def header_text_theme(self) -> MSO_THEME_COLOR:
         """Header text theme color."""
-        header = self._data.get('header', {})
-        return StyleConfig.get_theme_color(header.get('text_color_theme', 'lt1'))
+        return _theme_color(self._header.get('text_color_theme', 'lt1'))
 
     @property
     def header_text_brightness(self) -> float:
         """Header text brightness."""
-        header = self._data.get('header', {})
-        return header.get('text_color_brightness', 0)
+        return self._header.get('text_color_brightness', 0)
 
     @property
     def header_font_bold(self) -> bool:
         """Header font bold."""
-        header = self._data.get('header', {})
-        return header.get('font_bold', True)
+        return self._header.get('font_bold', True)
 
     @property
     def header_font_size(self) -> Pt:
         """Header font size."""
-        header = self._data.get('header', {})
-        return Pt(header.get('font_size_pt', 12))
+        return self._header_font_size
 
     @property
     def body_fill_theme(self) -> MSO_THEME_COLOR:
         """Body fill theme color."""
-        body = self._data.get('body', {})
-        return StyleConfig.get_theme_color(body.get('fill_theme', 'bg1'))
+        return _theme_color(self._body.get('fill_theme', 'bg1'))
 
     def get_body_brightness(self, col_idx: int) -> float:
         """Get body cell brightness for column."""
-        body = self._data.get('body', {})
-        brightnesses = body.get('column_brightness', [-0.15, -0.05, -0.05, -0.05])
+        brightnesses = self._body.get('column_brightness', [-0.15, -0.05, -0.05, -0.05])
         if col_idx < len(brightnesses):
             return brightnesses[col_idx]
         return brightnesses[-1] if brightnesses else -0.05
@@ -502,69 +678,85 @@ class TableConfig:
     @property
     def body_text_theme(self) -> MSO_THEME_COLOR:
         """Body text theme color."""
-        body = self._data.get('body', {})
-        return StyleConfig.get_theme_color(body.get('text_color_theme', 'dk1'))
+        return _theme_color(self._body.get('text_color_theme', 'dk1'))
 
     @property
     def body_text_brightness(self) -> float:
         """Body text brightness."""
-        body = self._data.get('body', {})
-        return body.get('text_color_brightness', 0)
+        return self._body.get('text_color_brightness', 0)
 
     @property
     def body_font_size(self) -> Pt:
         """Body font size."""
-        body = self._data.get('body', {})
-        return Pt(body.get('font_size_pt', 12))
+        return self._body_font_size
 
     @property
     def alignment(self) -> str:
         """Default alignment (deprecated, use header/body.horizontal_align)."""
         return self._data.get('alignment', 'right')
 
+    def snapshot(self) -> TableSnapshot:
+        """Read every table-level setting at once into an immutable TableSnapshot.
+
+        Header/body section settings stay on header/body and per-column
+        brightness on get_body_brightness().
+        """
+        header = self._header
+        body = self._body
+        return TableSnapshot(
+            border_color=StyleConfig.hex_to_rgb(self._border.get('color', '#4F4F70')),
+            border_width_outer=self._border_width_outer,
+            border_width_inner=self._border_width_inner,
+            header_fill_theme=_theme_color(header.get('fill_theme', 'bg1')),
+            header_fill_brightness=header.get('fill_brightness', -0.5),
+            header_text_theme=_theme_color(header.get('text_color_theme', 'lt1')),
+            header_text_brightness=header.get('text_color_brightness', 0),
+            header_font_bold=header.get('font_bold', True),
+            header_font_size=self._header_font_size,
+            body_fill_theme=_theme_color(body.get('fill_theme', 'bg1')),
+            body_text_theme=_theme_color(body.get('text_color_theme', 'dk1')),
+            body_text_brightness=body.get('text_color_brightness', 0),
+            body_font_size=self._body_font_size,
+            alignment=self._data.get('alignment', 'right'),
+        )
+
 
 class LegendConfig:
     """Configuration for chart legend."""
 
+    __slots__ = ('_data', '_font', '_font_size')
+
     def __init__(self, legend_data: Dict[str, Any]):
+        _import_pptx()
         self._data = legend_data
+        self._font = legend_data.get('font') or {}
+        self._font_size = Pt(self._font.get('size_pt', 11))
 
     @property
     def position(self) -> XL_LEGEND_POSITION:
         """Legend position as XL_LEGEND_POSITION."""
         pos = self._data.get('position', 'bottom')
-        pos_map = {
-            'bottom': XL_LEGEND_POSITION.BOTTOM,
-            'top': XL_LEGEND_POSITION.TOP,
-            'left': XL_LEGEND_POSITION.LEFT,
-            'right': XL_LEGEND_POSITION.RIGHT,
-        }
-        return pos_map.get(pos, XL_LEGEND_POSITION.BOTTOM)
+        return _LEGEND_POSITION_MAP.get(pos, XL_LEGEND_POSITION.BOTTOM)
 
     @property
     def font_size(self) -> Pt:
         """Font size as Pt."""
-        font = self._data.get('font', {})
-        size_pt = font.get('size_pt', 11)
-        return Pt(size_pt)
+        return self._font_size
 
     @property
     def font_color_type(self) -> str:
         """Font color type."""
-        font = self._data.get('font', {})
-        return font.get('color_type', 'theme')
+        return self._font.get('color_type', 'theme')
 
     @property
     def font_color_value(self) -> str:
         """Font color value."""
-        font = self._data.get('font', {})
-        return font.get('color_value', 'tx1')
+        return self._font.get('color_value', 'tx1')
 
     @property
     def font_brightness(self) -> float:
         """Font brightness."""
-        font = self._data.get('font', {})
-        return font.get('brightness', 0)
+        return self._font.get('brightness', 0)
 
 
 if __name__ == '__main__':